@@ -0,0 +1,68 @@
+"""Compare bulk parsing and formatting against going through one address object per line."""
+
+from __future__ import annotations
+
+import timeit
+
+from corpora import ipv4_corpus, ipv6_corpus
+
+from iplib3 import IPv4, IPv6
+from iplib3.bulk import format_ipv4_many, format_ipv6_many, parse_ipv4_many, parse_ipv6_many
+
+CORPUS_SIZE = 100_000
+REPEATS = 5
+
+
+def per_address(seconds: float, count: int) -> float:
+    """Convert a total run time to microseconds per address."""
+    return seconds / count * 1_000_000
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    ipv4 = ipv4_corpus(CORPUS_SIZE, port_ratio=1 / 3)
+    ipv6 = ipv6_corpus(CORPUS_SIZE, port_ratio=1 / 3)
+
+    cases = (
+        ("IPv4", ipv4, lambda: [IPv4(address) for address in ipv4], lambda: parse_ipv4_many(ipv4)),
+        ("IPv6", ipv6, lambda: [IPv6(address) for address in ipv6], lambda: parse_ipv6_many(ipv6)),
+    )
+
+    for name, corpus, objects, bulk in cases:
+        object_time = min(timeit.repeat(objects, number=1, repeat=REPEATS))
+        bulk_time = min(timeit.repeat(bulk, number=1, repeat=REPEATS))
+        speedup = object_time / bulk_time
+
+        print(f"{name} objects: {per_address(object_time, len(corpus)):8.3f} us/address")
+        print(f"{name} bulk:    {per_address(bulk_time, len(corpus)):8.3f} us/address ({speedup:.1f}x)")
+
+    ipv4_nums = list(parse_ipv4_many(ipv4).addresses)
+    batch = parse_ipv6_many(ipv6)
+    ipv6_nums = [high << 64 | low for high, low in zip(batch.high, batch.low, strict=True)]
+
+    cases = (
+        (
+            "IPv4",
+            ipv4_nums,
+            lambda: [str(IPv4.from_int(num)) for num in ipv4_nums],
+            lambda: format_ipv4_many(ipv4_nums),
+        ),
+        (
+            "IPv6",
+            ipv6_nums,
+            lambda: [str(IPv6.from_int(num)) for num in ipv6_nums],
+            lambda: format_ipv6_many(ipv6_nums),
+        ),
+    )
+
+    for name, nums, objects, bulk in cases:
+        object_time = min(timeit.repeat(objects, number=1, repeat=REPEATS))
+        bulk_time = min(timeit.repeat(bulk, number=1, repeat=REPEATS))
+        speedup = object_time / bulk_time
+
+        print(f"{name} formatting objects: {per_address(object_time, len(nums)):8.3f} us/address")
+        print(f"{name} formatting bulk:    {per_address(bulk_time, len(nums)):8.3f} us/address ({speedup:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Compare dictionary throughput of numeric address hashing against the old text-based hashing.
+
+Addresses are parsed from text, as they usually are, so the old hashing
+gets to reuse the text it keeps rather than formatting every address.
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+import time
+from typing import TYPE_CHECKING
+
+from iplib3 import IPAddress, IPv4
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+ADDRESS_COUNT = 10_000_000  # Override with the first command line argument
+
+
+class TextHashedIPv4(IPv4):
+    """IPv4 with the hashing and equality used before they became numeric."""
+
+    __slots__ = ()
+
+    def __eq__(self, other: object) -> bool:
+        """Compare equality through text, like before."""
+        if str(self) == str(other):
+            return True
+
+        return super(IPAddress, self).__eq__(other)
+
+    def __hash__(self) -> int:
+        """Hash the text form, like before."""
+        return hash(str(self))
+
+
+def address_texts(count: int, seed: int = 0) -> list[str]:
+    """Generate random addresses as text, a third of which carry a port."""
+    rng = random.Random(seed)
+    texts = [str(IPv4.from_int(rng.getrandbits(32))) for _ in range(count)]
+    return [f"{text}:{rng.randrange(1, 65536)}" if idx % 3 == 0 else text for idx, text in enumerate(texts)]
+
+
+def timed(function: Callable[[], object]) -> float:
+    """Return the run time of a function in seconds."""
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else ADDRESS_COUNT
+    texts = address_texts(count)
+
+    for name, address_class in (("before", TextHashedIPv4), ("after", IPv4)):
+        keys = [address_class(text) for text in texts]
+        # Equal but distinct objects, so lookups can't short-circuit on identity
+        probes = [address_class(text) for text in texts]
+        table: dict[IPv4, int] = {}
+
+        def insert(keys: list[IPv4] = keys, table: dict[IPv4, int] = table) -> None:
+            for idx, key in enumerate(keys):
+                table[key] = idx  # noqa: PERF403
+
+        def lookup(probes: list[IPv4] = probes, table: dict[IPv4, int] = table) -> None:
+            for probe in probes:
+                table[probe]
+
+        insert_time = timed(insert)
+        lookup_time = timed(lookup)
+
+        print(f"{name:>6} insert: {count / insert_time / 1_000_000:6.2f} M addresses/s")
+        print(f"{name:>6} lookup: {count / lookup_time / 1_000_000:6.2f} M addresses/s")
+
+        del keys, probes, table
+
+
+if __name__ == "__main__":
+    main()
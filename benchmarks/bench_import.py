@@ -0,0 +1,79 @@
+"""
+Measure how long importing iplib3 takes, and fail if it's over budget.
+
+Each statement runs in a new interpreter with -X importtime, and the time
+counted is that of the modules it imports beyond what the interpreter
+imports at startup. The best of several runs is compared with the budget:
+
+    PYTHONPATH=src python benchmarks/bench_import.py
+    PYTHONPATH=src python benchmarks/bench_import.py --scale 2  # On a slow machine
+"""
+
+from __future__ import annotations
+
+import argparse
+import subprocess
+import sys
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+DEFAULT_REPEAT = 5
+
+# Milliseconds each statement may take, measured on a modest machine with some headroom
+BUDGETS = {
+    "import iplib3": 5.0,
+    "from iplib3 import ip_validator": 40.0,
+    "from iplib3 import IPAddress": 45.0,
+}
+
+
+def import_times(statement: str) -> dict[str, int]:
+    """Run a statement in a new interpreter, returning the cumulative microseconds of its top-level imports."""
+    stderr = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stderr
+
+    times = {}
+    for line in stderr.splitlines():
+        # Lines look like 'import time:       123 |        456 |   package.module',
+        # where the name is indented by two more spaces for each level of nesting
+        _, _, cumulative, name = line.replace(":", "|", 1).split("|")
+        if cumulative.strip().isdigit() and not name.startswith("  "):
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+def measure(statement: str, repeat: int) -> float:
+    """Return the best time in milliseconds the statement spends importing modules."""
+    startup = set(import_times("pass"))
+    return min(
+        sum(time for name, time in import_times(statement).items() if name not in startup) / 1000 for _ in range(repeat)
+    )
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Measure the statements and print a table, returning 1 if any of them is over budget."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="runs per statement, the best counts")
+    parser.add_argument("--scale", type=float, default=1.0, help="multiply the budgets, for slower machines")
+    args = parser.parse_args(argv)
+
+    over_budget = 0
+    print(f"{'statement':<35} {'ms':>8} {'budget':>8}")
+    for statement, budget in BUDGETS.items():
+        elapsed = measure(statement, args.repeat)
+        allowed = budget * args.scale
+        over = elapsed > allowed
+        over_budget += over
+        print(f"{statement:<35} {elapsed:>8.1f} {allowed:>8.1f}{'  OVER BUDGET' if over else ''}")
+
+    return 1 if over_budget else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,109 @@
+"""
+Measure how parsing addresses scales with the number of workers.
+
+By default a file of generated addresses is parsed by parse_file_parallel
+with an increasing number of worker processes. With --threads, a list of
+addresses is parsed by the bulk parsers on an increasing number of threads
+instead. Each run is compared with a single worker:
+
+    PYTHONPATH=src python benchmarks/bench_parallel.py --size 2000000
+    PYTHONPATH=src python3.14t benchmarks/bench_parallel.py --threads
+
+Threads only run in parallel on free-threaded builds. Elsewhere the
+parsers fall back to a single thread, so the speed-up stays around 1.
+Efficiency is the speed-up divided by the number of workers, so values
+close to 1 mean close to linear scaling.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import tempfile
+from functools import partial
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import corpora
+from suite import DEFAULT_REPEAT, DEFAULT_SEED, render_table, time_runs
+
+from iplib3.bulk import parse_ipv4_many, parse_ipv6_many
+from iplib3.constants.subnet import SubnetType
+from iplib3.parallel import parse_file_parallel, threads_run_in_parallel
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+DEFAULT_SIZE = 1_000_000
+DEFAULT_CHUNK_BYTES = 1 << 20
+
+
+def worker_counts(maximum: int) -> list[int]:
+    """Return the powers of two up to the maximum, and the maximum itself."""
+    counts = [1]
+    while counts[-1] * 2 < maximum:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != maximum:
+        counts.append(maximum)
+    return counts
+
+
+def time_workers(make_run: Callable[[int], Callable[[], Any]], maximum: int, size: int, repeat: int) -> list[list[str]]:
+    """Time a run for each worker count, returning table rows compared with a single worker."""
+    rows = []
+    baseline = None
+    for workers in worker_counts(maximum):
+        best = min(time_runs(make_run(workers), repeat))
+        baseline = baseline or best
+        speed_up = baseline / best
+        rows.append([str(workers), f"{size / best:,.0f}", f"{speed_up:.2f}x", f"{speed_up / workers:.0%}"])
+    return rows
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Parse the command line, time the worker counts and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size", type=int, default=DEFAULT_SIZE, help="number of addresses")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="timed runs per worker count")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="seed for the generated corpus")
+    parser.add_argument("--version", choices=("ipv4", "ipv6"), default="ipv4", help="address version")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="largest worker count")
+    parser.add_argument("--threads", action="store_true", help="parse a list on threads instead of a file on processes")
+    parser.add_argument("--chunk-bytes", type=int, default=DEFAULT_CHUNK_BYTES, help="bytes per chunk of the file")
+    parser.add_argument(
+        "--format", choices=("text", "markdown"), default="text", help="table format, Markdown for tickets"
+    )
+    args = parser.parse_args(argv)
+
+    version = SubnetType(args.version)
+    corpus = (corpora.ipv4_corpus if version == SubnetType.IPV4 else corpora.ipv6_corpus)(
+        args.size, args.seed, port_ratio=0.2
+    )
+
+    if args.threads:
+        parse = parse_ipv4_many if version == SubnetType.IPV4 else parse_ipv6_many
+        if not threads_run_in_parallel():
+            print("Threads don't run in parallel on this interpreter, the parsers use a single thread\n")
+        rows = time_workers(
+            lambda workers: partial(parse, corpus, workers=workers), args.workers, args.size, args.repeat
+        )
+    else:
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "addresses.txt"
+            path.write_text("\n".join(corpus) + "\n")
+            rows = time_workers(
+                lambda workers: partial(
+                    parse_file_parallel, path, version, workers=workers, chunk_bytes=args.chunk_bytes
+                ),
+                args.workers,
+                args.size,
+                args.repeat,
+            )
+
+    print(render_table(["workers", "addresses/sec", "speed-up", "efficiency"], rows, args.format))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,155 @@
+"""Generated address corpora for the benchmarks, deterministic for a given seed."""
+
+from __future__ import annotations
+
+import random
+
+EPHEMERAL_PORTS = (32768, 60999)
+WELL_KNOWN_PORTS = (22, 53, 80, 123, 443, 3306, 5432, 8080, 8443)
+
+
+def ipv4_address(rng: random.Random) -> str:
+    """Generate an IPv4 address, mostly from the private ranges."""
+    kind = rng.randrange(4)
+    if kind == 0:
+        octets = [10, rng.randrange(256), rng.randrange(256), rng.randrange(256)]
+    elif kind == 1:
+        octets = [172, rng.randrange(16, 32), rng.randrange(256), rng.randrange(256)]
+    elif kind == 2:  # noqa: PLR2004
+        octets = [192, 168, rng.randrange(256), rng.randrange(256)]
+    else:
+        octets = [rng.randrange(1, 224), rng.randrange(256), rng.randrange(256), rng.randrange(256)]
+    return ".".join(map(str, octets))
+
+
+def ipv6_address(rng: random.Random) -> str:
+    """Generate an IPv6 address, in the compressed or full forms seen in logs and configs."""
+    kind = rng.randrange(4)
+    if kind == 0:
+        # Documentation prefix with a small host part
+        return f"2001:db8:{rng.randrange(65536):x}::{rng.randrange(1, 4096):x}"
+    if kind == 1:
+        # Link-local with a random interface identifier
+        return "fe80::" + ":".join(f"{rng.randrange(65536):x}" for _ in range(4))
+    if kind == 2:  # noqa: PLR2004
+        # Global unicast, fully written out
+        return ":".join(f"{rng.randrange(65536):04x}" for _ in range(8))
+    return ":".join(f"{rng.randrange(65536):X}" for _ in range(8))
+
+
+def port(rng: random.Random) -> int:
+    """Generate a port number, either a well-known one or an ephemeral one."""
+    if rng.random() < 0.5:  # noqa: PLR2004
+        return rng.choice(WELL_KNOWN_PORTS)
+    return rng.randint(*EPHEMERAL_PORTS)
+
+
+def ipv4_corpus(size: int, seed: int = 0, port_ratio: float = 0.0) -> list[str]:
+    """Generate IPv4 addresses, the given share of which carry a port."""
+    rng = random.Random(seed)
+    corpus = []
+    for _ in range(size):
+        address = ipv4_address(rng)
+        corpus.append(f"{address}:{port(rng)}" if rng.random() < port_ratio else address)
+    return corpus
+
+
+def ipv6_corpus(size: int, seed: int = 0, port_ratio: float = 0.0) -> list[str]:
+    """Generate IPv6 addresses, the given share of which carry a port."""
+    rng = random.Random(seed)
+    corpus = []
+    for _ in range(size):
+        address = ipv6_address(rng)
+        corpus.append(f"[{address}]:{port(rng)}" if rng.random() < port_ratio else address)
+    return corpus
+
+
+def ipv4_values(size: int, seed: int = 0) -> list[int]:
+    """Generate IPv4 address values."""
+    rng = random.Random(seed)
+    return [rng.getrandbits(32) for _ in range(size)]
+
+
+def ipv6_values(size: int, seed: int = 0) -> list[int]:
+    """Generate IPv6 address values, a mix of dense ones and ones with runs of zero segments."""
+    rng = random.Random(seed)
+    return [rng.getrandbits(128) & ~(((1 << rng.choice((0, 16, 48, 64))) - 1) << 16) for _ in range(size)]
+
+
+def mixed_corpus(size: int, seed: int = 0, invalid_ratio: float = 0.2) -> list[str]:
+    """Generate IPv4 and IPv6 addresses with and without ports, the given share of them malformed."""
+    rng = random.Random(seed)
+    corpus = []
+    for _ in range(size):
+        if rng.random() < 0.5:  # noqa: PLR2004
+            address = ipv4_address(rng)
+            if rng.random() < 0.3:  # noqa: PLR2004
+                address = f"{address}:{port(rng)}"
+        else:
+            address = ipv6_address(rng)
+            if rng.random() < 0.3:  # noqa: PLR2004
+                address = f"[{address}]:{port(rng)}"
+
+        corpus.append(malformed(address, rng) if rng.random() < invalid_ratio else address)
+    return corpus
+
+
+def malformed(address: str, rng: random.Random) -> str:
+    """Break an address in one of the ways seen in real input."""
+    kind = rng.randrange(5)
+    if kind == 0:
+        return address + ".1"
+    if kind == 1:
+        return address.replace("1", "g", 1) if "1" in address else address + "g"
+    if kind == 2:  # noqa: PLR2004
+        return f"{address}:{rng.randrange(65536, 100000)}"
+    if kind == 3:  # noqa: PLR2004
+        return address[: len(address) // 2]
+    return "999." + address
+
+
+def ports_corpus(size: int, seed: int = 0, invalid_ratio: float = 0.1) -> list[int]:
+    """Generate port numbers, the given share of them out of range."""
+    rng = random.Random(seed)
+    return [rng.choice((-1, 65536, 70000)) if rng.random() < invalid_ratio else port(rng) for _ in range(size)]
+
+
+def ipv4_subnet_corpus(size: int, seed: int = 0) -> list[int | str]:
+    """Generate IPv4 subnet masks, half as prefix lengths and half in dotted form."""
+    rng = random.Random(seed)
+    corpus: list[int | str] = []
+    for _ in range(size):
+        prefix_length = rng.choice((8, 12, 16, 20, 22, 24, 24, 24, 26, 28, 30))
+        if rng.random() < 0.5:  # noqa: PLR2004
+            corpus.append(prefix_length)
+        else:
+            mask = (0xFF_FF_FF_FF << (32 - prefix_length)) & 0xFF_FF_FF_FF
+            corpus.append(".".join(str(mask >> shift & 0xFF) for shift in (24, 16, 8, 0)))
+    return corpus
+
+
+def ipv6_subnet_corpus(size: int, seed: int = 0) -> list[int]:
+    """Generate IPv6 prefix lengths."""
+    rng = random.Random(seed)
+    return [rng.choice((32, 48, 56, 64, 64, 64, 96, 112, 120)) for _ in range(size)]
+
+
+def network_corpus(size: int, seed: int = 0, host_bits_ratio: float = 0.0) -> list[str]:
+    """Generate IPv4 and IPv6 networks in CIDR notation, the given share of them with host bits set."""
+    rng = random.Random(seed)
+    corpus = []
+    for _ in range(size):
+        if rng.random() < 0.5:  # noqa: PLR2004
+            bits, prefix_length = 32, rng.choice((8, 12, 16, 20, 24, 24, 26, 28, 30, 32))
+        else:
+            bits, prefix_length = 128, rng.choice((32, 48, 56, 64, 64, 96, 112, 128))
+
+        value = rng.getrandbits(bits)
+        if prefix_length < bits and rng.random() >= host_bits_ratio:
+            value &= ~((1 << (bits - prefix_length)) - 1)
+        if bits == 32:  # noqa: PLR2004
+            address = ".".join(str(value >> shift & 0xFF) for shift in (24, 16, 8, 0))
+        else:
+            address = ":".join(f"{value >> shift & 0xFFFF:x}" for shift in range(112, -1, -16))
+        corpus.append(f"{address}/{prefix_length}")
+    return corpus
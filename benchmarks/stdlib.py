@@ -0,0 +1,258 @@
+"""
+Compare iplib3 with the standard library's ipaddress module.
+
+Both libraries are given identical generated inputs, and their results are
+checked against each other while their throughput is measured, so speed-ups
+in the parsing and formatting code can't quietly change what it returns:
+
+    PYTHONPATH=src python benchmarks/stdlib.py --format markdown
+
+The exit code is 1 if any result differs. The corpora avoid the inputs
+where the libraries disagree by design: ports, leading zeroes in IPv4
+octets, surrounding whitespace, IPv4-mapped IPv6 addresses and scope IDs.
+"""
+
+from __future__ import annotations
+
+import argparse
+import ipaddress
+import random
+import sys
+from functools import partial
+from operator import eq
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+import corpora
+from suite import DEFAULT_REPEAT, DEFAULT_SEED, DEFAULT_SIZE, render_table, time_runs
+
+from iplib3 import IPAddress, IPNetwork, format_ipv4_many, format_ipv6_many, ip_validator
+from iplib3.address import AddressFormat, PureAddress
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+INVALID = "<invalid>"
+SHOWN_MISMATCHES = 5
+COMPRESSED = AddressFormat.SHORTEN | AddressFormat.REMOVE_ZEROES
+IPV4_MAPPED_PREFIX = 0xFFFF
+
+
+class Comparison(NamedTuple):
+    """
+    The same operation done by both libraries.
+
+    `ours` and `theirs` take the whole corpus and return a result per item.
+    The prepare functions turn the corpus into each library's own objects
+    before timing starts, and `same` decides whether two results agree.
+    """
+
+    name: str
+    corpus: Callable[[int, int], Sequence[Any]]
+    ours: Callable[[Sequence[Any]], Sequence[object]]
+    theirs: Callable[[Sequence[Any]], Sequence[object]]
+    prepare_ours: Callable[[Sequence[Any]], Sequence[Any]] = list
+    prepare_theirs: Callable[[Sequence[Any]], Sequence[Any]] = list
+    same: Callable[[object, object], bool] = eq
+
+
+def _each(function: Callable[[Any], object]) -> Callable[[Sequence[Any]], list[object]]:
+    """Apply a function to each item, recording the ones it rejects as invalid."""
+
+    def run(corpus: Sequence[Any]) -> list[object]:
+        results: list[object] = []
+        for item in corpus:
+            try:
+                results.append(function(item))
+            except ValueError:
+                results.append(INVALID)
+        return results
+
+    return run
+
+
+def _stdlib_valid(address: str) -> bool:
+    try:
+        ipaddress.ip_address(address)
+    except ValueError:
+        return False
+    return True
+
+
+def _our_network(network: str) -> tuple[int, int, int]:
+    parsed = IPNetwork(network)
+    return parsed.network, parsed.broadcast, parsed.num_addresses
+
+
+def _their_network(network: str) -> tuple[int, int, int]:
+    parsed = ipaddress.ip_network(network)
+    return int(parsed.network_address), int(parsed.broadcast_address), parsed.num_addresses
+
+
+def _without_mapped(values: Callable[[int, int], list[int]]) -> Callable[[int, int], list[int]]:
+    """Leave out IPv4-mapped addresses, which ipaddress writes with a dotted IPv4 part."""
+
+    def corpus(size: int, seed: int) -> list[int]:
+        return [value for value in values(size, seed) if value >> 32 != IPV4_MAPPED_PREFIX]
+
+    return corpus
+
+
+def _without_ports(size: int, seed: int) -> list[str]:
+    """Mixed, partly malformed addresses, without the ports ipaddress doesn't know about."""
+    return [
+        address
+        for address in corpora.mixed_corpus(size, seed)
+        if "]" not in address and not ("." in address and ":" in address)
+    ]
+
+
+def _membership_corpus(size: int, seed: int) -> list[tuple[str, str]]:
+    """Pair networks with addresses of the same version, half of them inside the network."""
+    rng = random.Random(seed)
+    pairs = []
+    for network in corpora.network_corpus(size, seed):
+        parsed = ipaddress.ip_network(network)
+        if rng.random() < 0.5:  # noqa: PLR2004
+            value = int(parsed.network_address) + rng.randrange(parsed.num_addresses)
+        else:
+            value = rng.getrandbits(parsed.max_prefixlen)
+        pairs.append((network, str(parsed.network_address.__class__(value))))
+    return pairs
+
+
+def _same_text(ours: object, theirs: object) -> bool:
+    return str(ours).casefold() == str(theirs).casefold()
+
+
+COMPARISONS = (
+    Comparison(
+        "parse[ipv4]",
+        partial(corpora.ipv4_corpus, port_ratio=0.0),
+        _each(lambda address: IPAddress(address).num),
+        _each(lambda address: int(ipaddress.ip_address(address))),
+    ),
+    Comparison(
+        "parse[ipv6]",
+        partial(corpora.ipv6_corpus, port_ratio=0.0),
+        _each(lambda address: IPAddress(address).num),
+        _each(lambda address: int(ipaddress.ip_address(address))),
+    ),
+    Comparison(
+        "validate",
+        _without_ports,
+        _each(ip_validator),
+        _each(_stdlib_valid),
+    ),
+    Comparison(
+        "format[ipv4]",
+        corpora.ipv4_values,
+        _each(lambda value: PureAddress(value).num_to_ipv4()),
+        _each(lambda value: str(ipaddress.IPv4Address(value))),
+    ),
+    Comparison(
+        "format[ipv6 exploded]",
+        corpora.ipv6_values,
+        _each(lambda value: PureAddress(value).num_to_ipv6(AddressFormat.DEFAULT)),
+        _each(lambda value: ipaddress.IPv6Address(value).exploded),
+        same=_same_text,
+    ),
+    Comparison(
+        "format[ipv6 compressed]",
+        _without_mapped(corpora.ipv6_values),
+        _each(lambda value: PureAddress(value).num_to_ipv6(COMPRESSED)),
+        _each(lambda value: ipaddress.IPv6Address(value).compressed),
+        same=_same_text,
+    ),
+    Comparison(
+        "format_ipv4_many",
+        corpora.ipv4_values,
+        format_ipv4_many,
+        lambda values: [str(ipaddress.IPv4Address(value)) for value in values],
+    ),
+    Comparison(
+        "format_ipv6_many",
+        _without_mapped(corpora.ipv6_values),
+        lambda values: format_ipv6_many(values, address_format=COMPRESSED),
+        lambda values: [ipaddress.IPv6Address(value).compressed for value in values],
+        same=_same_text,
+    ),
+    Comparison(
+        "network",
+        partial(corpora.network_corpus, host_bits_ratio=0.25),
+        _each(_our_network),
+        _each(_their_network),
+    ),
+    Comparison(
+        "network contains",
+        _membership_corpus,
+        lambda pairs: [address in network for network, address in pairs],
+        lambda pairs: [address in network for network, address in pairs],
+        prepare_ours=lambda pairs: [(IPNetwork(network), IPAddress(address)) for network, address in pairs],
+        prepare_theirs=lambda pairs: [
+            (ipaddress.ip_network(network), ipaddress.ip_address(address)) for network, address in pairs
+        ],
+    ),
+)
+
+
+def run_comparison(comparison: Comparison, size: int, repeat: int, seed: int) -> tuple[list[str], list[str]]:
+    """Time both sides of a comparison and check their results, returning a table row and any mismatches."""
+    corpus = comparison.corpus(size, seed)
+    our_input = comparison.prepare_ours(corpus)
+    their_input = comparison.prepare_theirs(corpus)
+
+    our_time = min(time_runs(lambda: comparison.ours(our_input), repeat))
+    their_time = min(time_runs(lambda: comparison.theirs(their_input), repeat))
+
+    mismatches = [
+        f"{comparison.name}: {item!r} -> iplib3 {ours!r}, ipaddress {theirs!r}"
+        for item, ours, theirs in zip(corpus, comparison.ours(our_input), comparison.theirs(their_input), strict=True)
+        if not comparison.same(ours, theirs)
+    ]
+
+    row = [
+        comparison.name,
+        f"{len(corpus) / our_time:,.0f}",
+        f"{len(corpus) / their_time:,.0f}",
+        f"{their_time / our_time:.2f}x",
+        f"{len(corpus):,}",
+        f"{len(mismatches):,}",
+    ]
+    return row, mismatches
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Parse the command line, run the comparisons and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size", type=int, default=DEFAULT_SIZE, help="number of inputs per comparison")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="timed runs per side, the best counts")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="seed for the generated corpora")
+    parser.add_argument(
+        "--filter", "-k", action="append", help="only run comparisons whose name contains this, can be repeated"
+    )
+    parser.add_argument(
+        "--format", choices=("text", "markdown"), default="text", help="table format, Markdown for tickets"
+    )
+    args = parser.parse_args(argv)
+
+    rows = []
+    mismatches = []
+    for comparison in COMPARISONS:
+        if args.filter and not any(part in comparison.name for part in args.filter):
+            continue
+        row, found = run_comparison(comparison, args.size, args.repeat, args.seed)
+        rows.append(row)
+        mismatches.extend(found[:SHOWN_MISMATCHES])
+
+    headers = ["operation", "iplib3 ops/sec", "ipaddress ops/sec", "speed-up", "checked", "mismatches"]
+    print(render_table(headers, rows, args.format))
+
+    if mismatches:
+        print("\nFirst mismatches:")
+        print("\n".join(mismatches))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,445 @@
+"""
+Benchmark suite for parsing, formatting, validation and subnet masks.
+
+Runs offline on generated corpora, and reports the throughput and the
+memory left allocated per operation. Results can be saved as JSON, so
+that two revisions can be compared:
+
+    PYTHONPATH=src python benchmarks/suite.py run --output before.json
+    git switch my-branch
+    PYTHONPATH=src python benchmarks/suite.py run --output after.json
+    python benchmarks/suite.py compare before.json after.json
+
+Cases whose API doesn't exist in the revision being measured are skipped,
+and cases that raise an exception are recorded as errors.
+
+With a tolerance, comparing fails when a case has slowed down by more
+than that share, so a saved baseline can gate changes to the hot paths:
+
+    PYTHONPATH=src python benchmarks/suite.py run --baseline before.json --tolerance 0.1
+
+Tables are printed as plain text, or as Markdown with --format markdown.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import UTC, datetime
+from functools import partial
+from importlib import import_module
+from operator import methodcaller
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+import corpora
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+DEFAULT_SIZE = 20_000
+DEFAULT_REPEAT = 5
+DEFAULT_SEED = 0
+DEFAULT_TOLERANCE = 0.1
+SCHEMA_VERSION = 2
+
+
+class Case(NamedTuple):
+    """
+    A single benchmark.
+
+    `corpus` builds the inputs from a size and a seed. `make` returns the
+    operation to time, and is free to raise ImportError or AttributeError
+    when the revision being measured lacks what it needs. Batch operations
+    are called once with the whole corpus, others once per item.
+    """
+
+    name: str
+    corpus: Callable[[int, int], Sequence[Any]]
+    make: Callable[[], Callable[[Any], object]]
+    batch: bool = False
+
+
+def _iplib3(path: str) -> Any:  # noqa: ANN401
+    """Resolve a dotted path like 'validators.try_parse' within iplib3, the first part being the module."""
+    module_name, *attributes = path.split(".")
+    target = import_module(f"iplib3.{module_name}")
+    for attribute in attributes:
+        target = getattr(target, attribute)
+    return target
+
+
+def _call(path: str, *arguments: str) -> Callable[[], Callable[[Any], object]]:
+    """Make a factory calling an iplib3 function with each item, followed by iplib3 attributes as arguments."""
+
+    def make() -> Callable[[Any], object]:
+        function = _iplib3(path)
+        resolved = [_iplib3(argument) for argument in arguments]
+        return lambda item: function(item, *resolved)
+
+    return make
+
+
+def _method(name: str, *args: str) -> Callable[[], Callable[[Any], object]]:
+    """Make a factory calling a method on each item, with iplib3 attributes as arguments."""
+
+    def make() -> Callable[[Any], object]:
+        return methodcaller(name, *(_iplib3(arg) for arg in args))
+
+    return make
+
+
+def _pure_addresses(values: Callable[[int, int], list[int]]) -> Callable[[int, int], list[Any]]:
+    """Make a corpus of PureAddress objects out of a corpus of address values."""
+
+    def corpus(size: int, seed: int) -> list[Any]:
+        pure_address = _iplib3("address.PureAddress")
+        return [pure_address(num) for num in values(size, seed)]
+
+    return corpus
+
+
+_IPV4 = partial(corpora.ipv4_corpus, port_ratio=0.0)
+_IPV4_PORTS = partial(corpora.ipv4_corpus, port_ratio=1.0)
+_IPV6 = partial(corpora.ipv6_corpus, port_ratio=0.0)
+_IPV6_PORTS = partial(corpora.ipv6_corpus, port_ratio=1.0)
+_PURE_IPV4 = _pure_addresses(corpora.ipv4_values)
+_PURE_IPV6 = _pure_addresses(corpora.ipv6_values)
+
+CASES = (
+    # Construction
+    Case("address.IPAddress[ipv4]", _IPV4, _call("address.IPAddress")),
+    Case("address.IPAddress[ipv6]", _IPV6, _call("address.IPAddress")),
+    Case("address.IPAddress[int]", corpora.ipv4_values, _call("address.IPAddress")),
+    Case("address.IPv4", _IPV4, _call("address.IPv4")),
+    Case("address.IPv4[port]", _IPV4_PORTS, _call("address.IPv4")),
+    Case("address.IPv6", _IPV6, _call("address.IPv6")),
+    Case("address.IPv6[port]", _IPV6_PORTS, _call("address.IPv6")),
+    Case("address.IPv4.from_int", corpora.ipv4_values, _call("address.IPv4.from_int")),
+    Case("address.IPv6.from_int", corpora.ipv6_values, _call("address.IPv6.from_int")),
+    # Formatting
+    Case("address.num_to_ipv4", _PURE_IPV4, _method("num_to_ipv4")),
+    Case("address.num_to_ipv6[DEFAULT]", _PURE_IPV6, _method("num_to_ipv6", "address.AddressFormat.DEFAULT")),
+    Case("address.num_to_ipv6[SHORTEN]", _PURE_IPV6, _method("num_to_ipv6", "address.AddressFormat.SHORTEN")),
+    Case(
+        "address.num_to_ipv6[REMOVE_ZEROES]",
+        _PURE_IPV6,
+        _method("num_to_ipv6", "address.AddressFormat.REMOVE_ZEROES"),
+    ),
+    Case(
+        "address.num_to_ipv6[SHORTEN|REMOVE_ZEROES]",
+        _PURE_IPV6,
+        lambda: methodcaller(
+            "num_to_ipv6",
+            _iplib3("address.AddressFormat.SHORTEN") | _iplib3("address.AddressFormat.REMOVE_ZEROES"),
+        ),
+    ),
+    # Validation
+    Case("validators.ip_validator", corpora.mixed_corpus, _call("validators.ip_validator")),
+    Case("validators.ipv4_validator", corpora.mixed_corpus, _call("validators.ipv4_validator")),
+    Case(
+        "validators.ipv4_validator[relaxed]",
+        corpora.mixed_corpus,
+        _call("validators.ipv4_validator", "validators.ValidationMode.RELAXED"),
+    ),
+    Case("validators.ipv6_validator", corpora.mixed_corpus, _call("validators.ipv6_validator")),
+    Case(
+        "validators.ipv6_validator[relaxed]",
+        corpora.mixed_corpus,
+        _call("validators.ipv6_validator", "validators.ValidationMode.RELAXED"),
+    ),
+    Case("validators.port_validator", corpora.ports_corpus, _call("validators.port_validator")),
+    Case("validators.subnet_validator[ipv4]", corpora.ipv4_subnet_corpus, _call("validators.subnet_validator")),
+    Case(
+        "validators.subnet_validator[ipv6]",
+        corpora.ipv6_subnet_corpus,
+        _call("validators.subnet_validator", "constants.SubnetType.IPV6"),
+    ),
+    Case("validators.try_parse", corpora.mixed_corpus, _call("validators.try_parse")),
+    Case("validators.validate_many", corpora.mixed_corpus, _call("validators.validate_many"), batch=True),
+    # Subnet masks
+    Case(
+        "subnet.SubnetMask[ipv4]",
+        corpora.ipv4_subnet_corpus,
+        _call("subnet.SubnetMask", "constants.SubnetType.IPV4"),
+    ),
+    Case(
+        "subnet.SubnetMask[ipv6]",
+        corpora.ipv6_subnet_corpus,
+        _call("subnet.SubnetMask", "constants.SubnetType.IPV6"),
+    ),
+    # Bulk operations
+    Case("bulk.parse_ipv4_many", _IPV4_PORTS, _call("bulk.parse_ipv4_many"), batch=True),
+    Case("bulk.parse_ipv6_many", _IPV6_PORTS, _call("bulk.parse_ipv6_many"), batch=True),
+    Case("bulk.format_ipv4_many", corpora.ipv4_values, _call("bulk.format_ipv4_many"), batch=True),
+    Case("bulk.format_ipv6_many", corpora.ipv6_values, _call("bulk.format_ipv6_many"), batch=True),
+)
+
+
+def run_case(case: Case, size: int, repeat: int, seed: int) -> dict[str, Any]:
+    """Time a case and measure its memory use, returning a JSON-compatible result."""
+    try:
+        operation = case.make()
+        corpus = case.corpus(size, seed)
+    except (AttributeError, ImportError) as err:
+        return {"skipped": str(err)}
+
+    def run() -> list[object]:
+        if case.batch:
+            return [operation(corpus)]
+        return [operation(item) for item in corpus]
+
+    try:
+        timings = time_runs(run, repeat)
+        blocks, retained = _retained_memory(run)
+    except Exception as err:  # noqa: BLE001
+        return {"error": f"{err.__class__.__name__}: {err}"}
+
+    best = min(timings)
+    return {
+        "ops": len(corpus),
+        "best_seconds": best,
+        "median_seconds": sorted(timings)[len(timings) // 2],
+        "ops_per_sec": len(corpus) / best,
+        "retained_blocks_per_op": blocks / len(corpus),
+        "retained_bytes_per_op": retained / len(corpus),
+    }
+
+
+def time_runs(run: Callable[[], object], repeat: int) -> list[float]:
+    """Time a function the given number of times after a warm-up run, returning the timings in seconds."""
+    run()  # Warm up caches, and fail early
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def _retained_memory(run: Callable[[], list[object]]) -> tuple[int, int]:
+    """
+    Count the memory blocks and bytes the results of a run hold on to.
+
+    Temporary objects freed during the run aren't counted, so this measures
+    what each operation leaves behind, ie. its result and anything it caches,
+    not how many allocations it makes.
+    """
+    gc.collect()
+    blocks_before = sys.getallocatedblocks()
+    results = run()
+    blocks = sys.getallocatedblocks() - blocks_before
+    del results
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        results = run()
+        retained, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del results
+
+    return max(blocks, 0), retained
+
+
+def environment() -> dict[str, Any]:
+    """Describe the interpreter, machine and revision the results come from."""
+    import iplib3  # noqa: PLC0415
+
+    try:
+        revision = subprocess.run(
+            ["git", "rev-parse", "HEAD"],  # noqa: S607
+            capture_output=True,
+            check=True,
+            text=True,
+            cwd=Path(__file__).parent,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        revision = None
+
+    return {
+        "python": sys.version,
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "platform": platform.platform(),
+        "iplib3_version": iplib3.__version__,
+        "iplib3_path": str(Path(iplib3.__file__).parent),
+        "revision": revision,
+        "timestamp": datetime.now(UTC).isoformat(timespec="seconds"),
+    }
+
+
+def render_table(headers: Sequence[str], rows: Sequence[Sequence[str]], table_format: str = "text") -> str:
+    """Render rows as a plain text or Markdown table, the first column aligned left and the others right."""
+    if table_format == "markdown":
+        headers = [cell.replace("|", "\\|") for cell in headers]
+        rows = [[cell.replace("|", "\\|") for cell in row] for row in rows]
+    widths = [max(len(row[idx]) for row in [headers, *rows]) for idx in range(len(headers))]
+
+    def line(cells: Sequence[str]) -> str:
+        aligned = [
+            cell.ljust(width) if idx == 0 else cell.rjust(width)
+            for idx, (cell, width) in enumerate(zip(cells, widths, strict=True))
+        ]
+        if table_format == "markdown":
+            return f"| {' | '.join(aligned)} |"
+        return "  ".join(aligned).rstrip()
+
+    if table_format == "markdown":
+        separator = ["-" * width if idx == 0 else "-" * (width - 1) + ":" for idx, width in enumerate(widths)]
+        return "\n".join([line(headers), f"| {' | '.join(separator)} |", *map(line, rows)])
+    return "\n".join([line(headers), *map(line, rows)])
+
+
+def run(args: argparse.Namespace) -> int:
+    """Run the selected cases, print a table, optionally save the results and compare them with a baseline."""
+    cases = [case for case in CASES if not args.filter or any(part in case.name for part in args.filter)]
+    baseline = load(args.baseline)["results"] if args.baseline else None
+    results: dict[str, dict[str, Any]] = {}
+    rows = []
+
+    for case in cases:
+        result = run_case(case, args.size, args.repeat, args.seed)
+        results[case.name] = result
+        if "ops_per_sec" in result:
+            rows.append(
+                [
+                    case.name,
+                    f"{result['ops_per_sec']:,.0f}",
+                    f"{result['retained_blocks_per_op']:.2f}",
+                    f"{result['retained_bytes_per_op']:.1f}",
+                ]
+            )
+        else:
+            rows.append([case.name, result.get("error") or "skipped: " + result["skipped"], "", ""])
+
+    if baseline is None:
+        print(render_table(["case", "ops/sec", "retained blocks/op", "retained bytes/op"], rows, args.format))
+
+    if args.output:
+        report = {
+            "schema": SCHEMA_VERSION,
+            "environment": environment(),
+            "settings": {"size": args.size, "repeat": args.repeat, "seed": args.seed},
+            "results": results,
+        }
+        args.output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+        print(f"Results saved to {args.output}")
+
+    if baseline is None:
+        return 0
+    # Cases left out by the filter aren't missing, they just weren't run
+    baseline = {name: result for name, result in baseline.items() if name in results}
+    return _report_changes(baseline, results, args.tolerance, args.format)
+
+
+def load(path: Path) -> dict[str, Any]:
+    """Load saved results."""
+    report: dict[str, Any] = json.loads(path.read_text(encoding="utf-8"))
+    if report.get("schema") != SCHEMA_VERSION:
+        msg = f"{path} has an unsupported schema version: {report.get('schema')}"
+        raise ValueError(msg)
+    return report
+
+
+def compare(args: argparse.Namespace) -> int:
+    """Print the change in throughput and memory use between two saved results."""
+    return _report_changes(load(args.base)["results"], load(args.head)["results"], args.tolerance, args.format)
+
+
+def _report_changes(
+    base: dict[str, dict[str, Any]],
+    head: dict[str, dict[str, Any]],
+    tolerance: float | None,
+    table_format: str,
+) -> int:
+    """
+    Print the changes between two sets of results, returning 1 if any case regressed.
+
+    A case regresses when its throughput dropped by more than the
+    tolerance. Without a tolerance the changes are only reported.
+    """
+    rows = []
+    regressions = 0
+    for name in [*base, *(name for name in head if name not in base)]:
+        old, new = base.get(name, {}), head.get(name, {})
+        if "ops_per_sec" not in old or "ops_per_sec" not in new:
+            status = "only in head" if name not in base else "only in base" if name not in head else "not comparable"
+            rows.append([name, "", "", "", "", status])
+            continue
+
+        change = new["ops_per_sec"] / old["ops_per_sec"] - 1
+        regressed = tolerance is not None and change < -tolerance
+        regressions += regressed
+        rows.append(
+            [
+                name,
+                f"{old['ops_per_sec']:,.0f}",
+                f"{new['ops_per_sec']:,.0f}",
+                f"{change:+.1%}",
+                f"{old['retained_blocks_per_op']:.2f} -> {new['retained_blocks_per_op']:.2f}",
+                "REGRESSION" if regressed else "",
+            ]
+        )
+
+    print(
+        render_table(
+            ["case", "base ops/sec", "head ops/sec", "change", "retained blocks/op", "status"], rows, table_format
+        )
+    )
+
+    if regressions:
+        print(f"\n{regressions} case(s) slowed down by more than {tolerance:.0%}")
+        return 1
+    return 0
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Parse the command line and run the chosen command."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="run the benchmarks")
+    run_parser.add_argument("--output", "-o", type=Path, help="save the results as JSON")
+    run_parser.add_argument("--size", type=int, default=DEFAULT_SIZE, help="number of inputs per case")
+    run_parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="timed runs per case, the best counts")
+    run_parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="seed for the generated corpora")
+    run_parser.add_argument(
+        "--filter", "-k", action="append", help="only run cases whose name contains this, can be repeated"
+    )
+    run_parser.add_argument("--baseline", type=Path, help="compare the results with these saved ones")
+    run_parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=DEFAULT_TOLERANCE,
+        help=f"allowed slowdown compared with the baseline, as a fraction (default: {DEFAULT_TOLERANCE})",
+    )
+    run_parser.set_defaults(handler=run)
+
+    compare_parser = commands.add_parser("compare", help="compare two saved results")
+    compare_parser.add_argument("base", type=Path)
+    compare_parser.add_argument("head", type=Path)
+    compare_parser.add_argument(
+        "--tolerance", type=float, help="fail if a case slowed down by more than this fraction, eg. 0.1"
+    )
+    compare_parser.set_defaults(handler=compare)
+
+    for command_parser in (run_parser, compare_parser):
+        command_parser.add_argument(
+            "--format", choices=("text", "markdown"), default="text", help="table format, Markdown for tickets"
+        )
+
+    args = parser.parse_args(argv)
+    handler: Callable[[argparse.Namespace], int] = args.handler
+    return handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
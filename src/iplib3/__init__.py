@@ -1,14 +1,139 @@
-"""A pathlib-equivalent library for IP addresses."""
+"""
+A pathlib-equivalent library for IP addresses.
 
-import importlib.metadata
+Submodules, and the names they export, are only imported when they're
+first accessed, so importing iplib3 for a single function doesn't pay
+for the rest. The same goes for looking up __version__.
+"""
 
-from iplib3.address import *
-from iplib3.subnet import *
-from iplib3.validators import *
+from __future__ import annotations
 
-try:
-    __version__ = importlib.metadata.version(__name__)
-except importlib.metadata.PackageNotFoundError:
-    __version__ = "0.0.0"
+from importlib import import_module
+
+# Not imported from typing, which is slow to import
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from iplib3.address import *
+    from iplib3.arrays import *
+    from iplib3.bulk import *
+    from iplib3.cache import *
+    from iplib3.constants.ipv4 import IPV4_SEGMENT_BIT_COUNT
+    from iplib3.index import *
+    from iplib3.network import *
+    from iplib3.parallel import *
+    from iplib3.ranges import *
+    from iplib3.scanner import *
+    from iplib3.streams import *
+    from iplib3.subnet import *
+    from iplib3.table import *
+    from iplib3.validators import *
+
+    __version__: str
 
 __all__ = ("IPAddress", "IPv4", "IPv6", "port_validator")
+
+# The submodule each name is imported from, including names the package exposed before it was made lazy
+_EXPORTS = {
+    "FrozenIPv4": "address",
+    "FrozenIPv6": "address",
+    "IPAddress": "address",
+    "IPv4": "address",
+    "IPv6": "address",
+    "LazyIPAddress": "address",
+    "IPAddressArray": "arrays",
+    "IPv4Batch": "bulk",
+    "IPv6Batch": "bulk",
+    "format_ipv4_many": "bulk",
+    "format_ipv6_many": "bulk",
+    "parse_ipv4_many": "bulk",
+    "parse_ipv6_many": "bulk",
+    "AddressCache": "cache",
+    "IPV4_SEGMENT_BIT_COUNT": "constants.ipv4",
+    "IndexRecord": "index",
+    "MmapRangeIndex": "index",
+    "build_range_index": "index",
+    "IPNetwork": "network",
+    "parse_file_parallel": "parallel",
+    "threads_run_in_parallel": "parallel",
+    "AddressRangeSet": "ranges",
+    "collapse_sorted": "ranges",
+    "ScanMatch": "scanner",
+    "scan": "scanner",
+    "InvalidLine": "streams",
+    "aiter_addresses": "streams",
+    "IPV4_MAX_SUBNET_VALUE": "subnet",
+    "IPV4_MIN_SEGMENT_COUNT": "subnet",
+    "IPV4_MIN_SUBNET_VALUE": "subnet",
+    "IPV4_PREFIX_LENGTHS_BY_MASK": "subnet",
+    "IPV4_PREFIX_LENGTHS_BY_STRING": "subnet",
+    "IPV4_SUBNET_MASK_STRINGS": "subnet",
+    "IPV6_MAX_SUBNET_VALUE": "subnet",
+    "IPV6_MIN_SUBNET_VALUE": "subnet",
+    "PureSubnetMask": "subnet",
+    "SubnetMask": "subnet",
+    "SubnetType": "subnet",
+    "CompiledPrefixTable": "table",
+    "PrefixTable": "table",
+    "AddressKind": "validators",
+    "ParseErrorCode": "validators",
+    "ParsedAddress": "validators",
+    "ip_validator": "validators",
+    "ipv4_validator": "validators",
+    "ipv6_validator": "validators",
+    "port_validator": "validators",
+    "subnet_validator": "validators",
+    "try_parse": "validators",
+    "validate_many": "validators",
+}
+
+_SUBMODULES = frozenset(
+    (
+        "address",
+        "arrays",
+        "bulk",
+        "cache",
+        "constants",
+        "index",
+        "network",
+        "parallel",
+        "ranges",
+        "scanner",
+        "stats",
+        "streams",
+        "subnet",
+        "table",
+        "validators",
+    )
+)
+
+
+# Hidden from type checkers, so that they still catch misspelled names
+if not TYPE_CHECKING:
+
+    def __getattr__(name: str) -> object:
+        """Import submodules, their exports and the version on first access."""
+        if name == "__version__":
+            value: object = _version()
+        elif name in _SUBMODULES:
+            value = import_module(f"{__name__}.{name}")
+        elif name in _EXPORTS:
+            value = getattr(import_module(f"{__name__}.{_EXPORTS[name]}"), name)
+        else:
+            msg = f"module '{__name__}' has no attribute '{name}'"
+            raise AttributeError(msg)
+
+        globals()[name] = value
+        return value
+
+    def __dir__() -> list[str]:
+        """List the names available, whether they've been imported yet or not."""
+        return sorted({*globals(), *_EXPORTS, *_SUBMODULES, "__version__"})
+
+
+def _version() -> str:
+    import importlib.metadata  # noqa: PLC0415
+
+    try:
+        return importlib.metadata.version(__name__)
+    except importlib.metadata.PackageNotFoundError:
+        return "0.0.0"
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import sys
+import warnings
+from _thread import allocate_lock
 from enum import IntFlag, auto
-from itertools import groupby
 from typing import TYPE_CHECKING, Self
 
 from iplib3.constants.address import (
@@ -15,25 +17,40 @@
     IPV4_MAX_SEGMENT_VALUE,
     IPV4_MAX_VALUE,
     IPV4_MIN_VALUE,
+    IPV4_PACKED_SIZE,
 )
 from iplib3.constants.ipv6 import (
     IPV6_MAX_SEGMENT_COUNT,
     IPV6_MAX_SEGMENT_VALUE,
     IPV6_MAX_VALUE,
-    IPV6_MIN_SEGMENT_VALUE,
+    IPV6_MIN_VALUE,
     IPV6_NUMBER_BIT_COUNT,
+    IPV6_PACKED_SIZE,
     IPV6_SEGMENT_BIT_COUNT,
 )
 from iplib3.constants.port import (
     PORT_NUMBER_MAX_VALUE,
     PORT_NUMBER_MIN_VALUE,
 )
-from iplib3.validators import port_validator
+from iplib3.constants.subnet import SubnetType
+from iplib3.stats import instrumented
+from iplib3.validators import ParsedAddress, port_validator, try_parse
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from iplib3.subnet import SubnetMask
 
-__all__ = ("IPAddress", "IPv4", "IPv6")
+__all__ = ("FrozenIPv4", "FrozenIPv6", "IPAddress", "IPv4", "IPv6", "LazyIPAddress")
+
+# Sorts IPv4 before IPv6, without comparing the enum's strings
+_VERSION_ORDER = {SubnetType.IPV4: 4, SubnetType.IPV6: 6}
+_IPV4_ORDER = _VERSION_ORDER[SubnetType.IPV4]
+_IPV6_ORDER = _VERSION_ORDER[SubnetType.IPV6]
+# Sorts addresses without a port before the same address with any port
+_NO_PORT_ORDER = -1
+# Lets only one thread store the result of parsing a lazy address, from _thread as threading is slow to import
+_parse_lock = allocate_lock()
 
 
 class AddressFormat(IntFlag):
@@ -60,7 +77,7 @@ def __eq__(self, other: object) -> bool:
         return False
 
     def __hash__(self) -> int:
-        return hash(self._num)
+        return hash((self.num, self.port))
 
     def __ne__(self, other: object) -> bool:
         return not self == other
@@ -87,10 +104,11 @@ def port(self) -> int | None:
 
         TODO: Consider whether invalid port numbers should raise an exception
         """
-        if self._port is None:
+        port = self._port
+        if port is None:
             return None
 
-        return min(max(PORT_NUMBER_MIN_VALUE, self._port), PORT_NUMBER_MAX_VALUE)
+        return min(max(PORT_NUMBER_MIN_VALUE, port), PORT_NUMBER_MAX_VALUE)
 
     @port.setter
     def port(self, value: int | None) -> None:
@@ -125,6 +143,7 @@ def num_to_ipv6(self, address_format: AddressFormat = AddressFormat.SHORTEN) ->
         return self._num_to_ipv6(self.num, address_format)
 
     @staticmethod
+    @instrumented
     def _num_to_ipv4(num: int) -> str:
         """Generate an IPv4 string from an integer."""
         segments = []
@@ -134,6 +153,7 @@ def _num_to_ipv4(num: int) -> str:
         return ".".join(str(segment) for segment in reversed(segments))
 
     @staticmethod
+    @instrumented
     def _num_to_ipv6(num: int, address_format: AddressFormat) -> str:
         """Generate an IPv6 string from an integer, with optional zero removal and shortening."""
         segment_min_length = (IPV6_SEGMENT_BIT_COUNT // IPV6_NUMBER_BIT_COUNT) * (
@@ -146,19 +166,42 @@ def _num_to_ipv6(num: int, address_format: AddressFormat) -> str:
             num, segment = divmod(num, IPV6_MAX_SEGMENT_VALUE + 1)
             segments.append(f"{segment:0{segment_min_length}X}")
 
-        if AddressFormat.REMOVE_ZEROES in address_format and zero_segment in segments:
-            # Goes over the segments to find the
-            # longest strip with nothing but zeroes
-            # and replaces it with an empty string.
-            # The final str.join will turn to '::'.
+        address = ":".join(reversed(segments))
+
+        if AddressFormat.REMOVE_ZEROES in address_format:
+            return _remove_zeroes(address, zero_segment)
+
+        return address
+
 
-            longest_idx, length = max(
-                (idx, len(list(group))) for idx, (item, group) in enumerate(groupby(segments)) if item == zero_segment
-            )
+def _remove_zeroes(address: str, zero_segment: str) -> str:
+    """
+    Replace the longest run of zero segments in an IPv6 string with '::'.
 
-            segments[longest_idx : longest_idx + length] = ["", ""]
+    As per RFC 5952, a single zero segment is left alone
+    and the first of equally long runs is replaced.
+    """
+    wrapped = f":{address}:"
+    runs = _ZERO_RUNS[zero_segment]
 
-        return ":".join(reversed(segments))
+    # The shortest run is the most likely to be missing
+    if runs[-1] not in wrapped:
+        return address
+
+    # Checking the longest runs first, the first match is the leftmost of the longest
+    for run in runs:
+        idx = wrapped.find(run)
+        if idx != -1:
+            return f"{wrapped[1:idx]}::{wrapped[idx + len(run) : -1]}"
+
+    return address
+
+
+# The ':'-delimited runs of zero segments worth replacing, longest first, for both segment widths
+_ZERO_RUNS = {
+    zero_segment: tuple(":" + f"{zero_segment}:" * length for length in range(IPV6_MAX_SEGMENT_COUNT, 1, -1))
+    for zero_segment in ("0", "0000")
+}
 
 
 class IPAddress(PureAddress):
@@ -166,6 +209,7 @@ class IPAddress(PureAddress):
 
     __slots__ = ("_ipv4", "_ipv6", "_submask")
 
+    @instrumented
     def __new__(cls: type[Self], address: int | str | None = None, port_num: int | None = None) -> Self:
         """Create PureAddress."""
         _class: type[Self | IPv4 | IPv6] = cls
@@ -173,9 +217,16 @@ def __new__(cls: type[Self], address: int | str | None = None, port_num: int | N
             # Only IPv4-addresses have '.', ':' is used in both IPv4 and IPv6
             _class = IPv4 if "." in address else IPv6
 
+            if issubclass(cls, _class):
+                # Keep subclasses, such as the frozen variants
+                _class = cls
+
         self = object.__new__(_class)
 
-        self.__init__(address=address, port_num=port_num)  # type: ignore[misc]
+        if not isinstance(self, cls):
+            # Python only calls __init__ by itself for instances of cls,
+            # calling it here too would parse the address twice
+            self.__init__(address=address, port_num=port_num)  # type: ignore[misc]
         return self  # type: ignore[return-value]
 
     def __init__(self, address: int | None = IPV4_LOCALHOST, port_num: int | None = None) -> None:
@@ -186,69 +237,282 @@ def __init__(self, address: int | None = IPV4_LOCALHOST, port_num: int | None =
         self._submask: SubnetMask | None = None
 
     def __eq__(self, other: object) -> bool:
-        """Compare equality."""
-        # To accommodate strings
-        if str(self) == str(other):
-            return True
+        """
+        Compare equality by version, value and port.
+
+        Comparing with strings, which compares the text, is deprecated. Addresses
+        hash on their value and port, so they hash differently from their text.
+        """
+        if isinstance(other, IPAddress):
+            return self.sort_key == other.sort_key
+
+        if isinstance(other, str):
+            _warn_string_comparison()
+            return str(self) == other
 
         return super().__eq__(other)
 
     def __hash__(self) -> int:
         """Hash the address."""
-        return hash(str(self))
+        return hash((self.num, self.port))
+
+    def __reduce__(self) -> tuple[Callable[..., Self], tuple[int, int | None]]:
+        """Pickle only the value and the port, leaving out cached objects."""
+        return self.__class__, (self.num, self.port)
+
+    def __lt__(self, other: object) -> bool:
+        """Compare order by version, value and port."""
+        if isinstance(other, IPAddress):
+            return self.sort_key < other.sort_key
+
+        return NotImplemented
+
+    def __le__(self, other: object) -> bool:
+        """Compare order by version, value and port."""
+        if isinstance(other, IPAddress):
+            return self.sort_key <= other.sort_key
+
+        return NotImplemented
+
+    def __gt__(self, other: object) -> bool:
+        """Compare order by version, value and port."""
+        if isinstance(other, IPAddress):
+            return self.sort_key > other.sort_key
+
+        return NotImplemented
+
+    def __ge__(self, other: object) -> bool:
+        """Compare order by version, value and port."""
+        if isinstance(other, IPAddress):
+            return self.sort_key >= other.sort_key
+
+        return NotImplemented
 
     def __str__(self) -> str:
         """Str variant."""
-        if IPV4_MIN_VALUE <= self.num <= IPV4_MAX_VALUE:
-            if self._ipv4 is None:
-                self._ipv4 = self.as_ipv4
-            return str(self._ipv4)
-
-        if IPV4_MAX_VALUE < self.num <= IPV6_MAX_VALUE:
-            if self._ipv6 is None:
-                self._ipv6 = self.as_ipv6
-            return str(self._ipv6)
+        # The versions are cached without the port, which can change, and each
+        # attribute is read once, so threads sharing the address never see a mix
+        num = self.num
+        port = self.port
+        if IPV4_MIN_VALUE <= num <= IPV4_MAX_VALUE:
+            ipv4 = self._ipv4
+            if ipv4 is None:
+                ipv4 = self._ipv4 = IPv4.from_int(num)
+            return str(ipv4) if port is None else f"{ipv4}:{port}"
+
+        if IPV4_MAX_VALUE < num <= IPV6_MAX_VALUE:
+            ipv6 = self._ipv6
+            if ipv6 is None:
+                ipv6 = self._ipv6 = IPv6.from_int(num)
+            return str(ipv6) if port is None else f"[{ipv6}]:{port}"
 
         msg = f"No valid address representation exists for {self.num}"
         raise ValueError(msg)
 
+    @property
+    def version(self) -> SubnetType:
+        """Return the version of the address, going by its value."""
+        return SubnetType.IPV4 if self.num <= IPV4_MAX_VALUE else SubnetType.IPV6
+
+    @property
+    def sort_key(self) -> tuple[int, int, int]:
+        """
+        Return a tuple of integers that sorts addresses numerically.
+
+        IPv4 addresses come before IPv6 ones, and an address without
+        a port comes before the same address with any port.
+        """
+        port = self.port
+        return _VERSION_ORDER[self.version], self.num, _NO_PORT_ORDER if port is None else port
+
     @property
     def as_ipv4(self) -> IPv4:
         """Creates and returns an IPv4 version of the address, if possible."""
-        return IPv4(self.num_to_ipv4(), port_num=self.port)
+        return IPv4.from_int(self.num & IPV4_MAX_VALUE, port_num=self.port)
 
     @property
     def as_ipv6(self) -> IPv6:
         """Creates and returns an IPv6-version of the address."""
-        return IPv6(self.num_to_ipv6(), port_num=self.port)
+        return IPv6.from_int(self.num & IPV6_MAX_VALUE, port_num=self.port)
+
+    @staticmethod
+    def _parse_num(address: str, version: SubnetType) -> int:
+        """
+        Parse and validate the address part of an address string.
+
+        Raises ValueError on invalid format.
+        """
+        return IPAddress._parse(address, version).num
+
+    @staticmethod
+    @instrumented
+    def _parse(address: str, version: SubnetType) -> ParsedAddress:
+        """
+        Parse and validate an address string, along with its port if it has one.
+
+        Raises ValueError on invalid format.
+        """
+        parsed = try_parse(address, version=version)
+        if isinstance(parsed, ParsedAddress):
+            return parsed
+
+        name = "IPv4" if version == SubnetType.IPV4 else "IPv6"
+        msg = f"Invalid {name} address format; {parsed.message} ('{address}')"
+        raise ValueError(msg)
+
+
+def _warn_string_comparison() -> None:
+    """Warn that comparing addresses with strings is deprecated, pointing at the first caller outside this module."""
+    stacklevel = 2
+    frame = sys._getframe(1)  # noqa: SLF001
+    while frame.f_back is not None and frame.f_globals.get("__name__") == __name__:
+        frame = frame.f_back
+        stacklevel += 1
+
+    warnings.warn(
+        "Comparing addresses with strings is deprecated, compare with IPAddress(text) instead",
+        DeprecationWarning,
+        stacklevel=stacklevel,
+    )
+
+
+class _VersionAddress(IPAddress):
+    """
+    Base class of IPv4 and IPv6, whose value and port are validated on creation.
+
+    Addresses of the same class have the same version, so they're compared
+    and hashed directly on their value and port, skipping the properties.
+    """
+
+    __slots__ = ()
+
+    def __eq__(self, other: object) -> bool:
+        """Compare equality by version, value and port."""
+        if other.__class__ is self.__class__:
+            return self._num == other._num and self._port == other._port
+
+        return super().__eq__(other)
+
+    def __hash__(self) -> int:
+        """Hash the address."""
+        return hash((self._num, self._port))
+
+    def __lt__(self, other: object) -> bool:
+        """Compare order by version, value and port."""
+        if other.__class__ is self.__class__:
+            return _order(self) < _order(other)
 
+        return super().__lt__(other)
 
-class IPv4(IPAddress):
+    def __le__(self, other: object) -> bool:
+        """Compare order by version, value and port."""
+        if other.__class__ is self.__class__:
+            return _order(self) <= _order(other)
+
+        return super().__le__(other)
+
+    def __gt__(self, other: object) -> bool:
+        """Compare order by version, value and port."""
+        if other.__class__ is self.__class__:
+            return _order(self) > _order(other)
+
+        return super().__gt__(other)
+
+    def __ge__(self, other: object) -> bool:
+        """Compare order by version, value and port."""
+        if other.__class__ is self.__class__:
+            return _order(self) >= _order(other)
+
+        return super().__ge__(other)
+
+
+def _order(address: _VersionAddress) -> tuple[int, int]:
+    """Return the value and port of an address as a tuple that sorts like its sort key, within its version."""
+    port = address._port  # noqa: SLF001
+    return address._num, _NO_PORT_ORDER if port is None else port  # noqa: SLF001
+
+
+class IPv4(_VersionAddress):
     """An IPAddress subclass specific to IPv4."""
 
     __slots__ = ("_address",)
 
     def __init__(self, address: str | None = None, port_num: int | None = None) -> None:
         """Init IPv4."""
-        new_address = self._num_to_ipv4(IPV4_LOCALHOST) if address is None else address
-
-        _address, *_port = new_address.split(":")
+        if address is None:
+            self._address: str | None = self._num_to_ipv4(IPV4_LOCALHOST)
+            super().__init__(address=IPV4_LOCALHOST, port_num=port_num)
+            return
 
-        if _port:
-            new_address = _address
+        # The address and its port are parsed together, and only once
+        parsed = self._parse(address, SubnetType.IPV4)
+        if parsed.port is not None:
+            address = address.strip().partition(":")[0]
 
             if port_num is None:
-                port_num = int(_port[0])
+                port_num = parsed.port
 
-        self._address = new_address
-        super().__init__(address=self._ipv4_to_num(), port_num=port_num)
+        self._address = address
+        super().__init__(address=parsed.num, port_num=port_num)
 
     def __str__(self) -> str:
         """Str variant."""
-        if self.port is not None:
-            return f"{self._address}:{self.port}"
+        address = self._address
+        if address is None:
+            address = self._address = self._num_to_ipv4(self.num)
 
-        return self._address
+        port = self.port
+        if port is not None:
+            return f"{address}:{port}"
+
+        return address
+
+    def __reduce__(self) -> tuple[Callable[..., Self], tuple[int, int | None]]:
+        """Pickle only the value and the port, the class tells the version."""
+        return self.__class__.from_int, (self._num, self._port)
+
+    @property
+    def version(self) -> SubnetType:
+        """Return the version of the address."""
+        return SubnetType.IPV4
+
+    @property
+    def packed(self) -> bytes:
+        """Return the address as 4 bytes in network order."""
+        return self._num.to_bytes(IPV4_PACKED_SIZE, "big")
+
+    @property
+    def sort_key(self) -> tuple[int, int, int]:
+        """Return a tuple of integers that sorts addresses numerically."""
+        # The value and port are validated on creation, so they need no clamping
+        port = self._port
+        return _IPV4_ORDER, self._num, _NO_PORT_ORDER if port is None else port
+
+    @classmethod
+    def from_int(cls, num: int, port_num: int | None = None) -> Self:
+        """
+        Create an IPv4 address directly from its integer value.
+
+        Unlike the regular constructor no string is parsed,
+        the text form is only generated when first needed.
+        """
+        if not IPV4_MIN_VALUE <= num <= IPV4_MAX_VALUE:
+            msg = f"Number '{num}' not in valid IPv4 range ({IPV4_MIN_VALUE}-{IPV4_MAX_VALUE})"
+            raise ValueError(msg)
+
+        self = object.__new__(cls)
+        self._address = None
+        IPAddress.__init__(self, address=num, port_num=port_num)
+        return self
+
+    @classmethod
+    def from_bytes(cls, data: bytes | bytearray | memoryview, port_num: int | None = None) -> Self:
+        """Create an IPv4 address from the 4 bytes returned by `packed`."""
+        if len(data) != IPV4_PACKED_SIZE:
+            msg = f"IPv4 addresses are {IPV4_PACKED_SIZE} bytes long, got {len(data)}"
+            raise ValueError(msg)
+
+        return cls.from_int(int.from_bytes(data, "big"), port_num)
 
     def _ipv4_to_num(self) -> int:
         """
@@ -256,42 +520,94 @@ def _ipv4_to_num(self) -> int:
 
         Raises ValueError on invalid IPv4 format.
         """
-        segments = map(int, reversed(self._address.split(".")))
-        total = 0
-
-        for idx, num in enumerate(segments):
-            total += num * 2 ** (idx * 8)
+        if self._address is None:
+            # Created from a number, nothing to parse
+            return self.num
 
-        return total
+        return self._parse_num(self._address, SubnetType.IPV4)
 
 
-class IPv6(IPAddress):
+class IPv6(_VersionAddress):
     """An IPAddress subclass specific to IPv6."""
 
     __slots__ = ("_address",)
 
     def __init__(self, address: str | None = None, port_num: int | None = None) -> None:
         """Init IPv6."""
-        new_address = self._num_to_ipv6(IPV6_LOCALHOST, AddressFormat.SHORTEN) if address is None else address
-
-        _address, *_port = new_address.split("]:")
-
-        if _port:
+        if address is None:
+            self._address: str | None = self._num_to_ipv6(IPV6_LOCALHOST, AddressFormat.SHORTEN)
+            super().__init__(address=IPV6_LOCALHOST, port_num=port_num)
+            return
+
+        # The address and its port are parsed together, and only once
+        parsed = self._parse(address, SubnetType.IPV6)
+        if parsed.port is not None:
             # Removes the opening square bracket
-            new_address = _address[1:]
+            address = address.strip().partition("]:")[0][1:]
 
             if port_num is None:
-                port_num = int(_port[0])
+                port_num = parsed.port
 
-        self._address = new_address
-        super().__init__(address=self._ipv6_to_num(), port_num=port_num)
+        self._address = address
+        super().__init__(address=parsed.num, port_num=port_num)
 
     def __str__(self) -> str:
         """Str variant."""
-        if self.port is not None:
-            return f"[{self._address}]:{self.port}"
+        address = self._address
+        if address is None:
+            address = self._address = self._num_to_ipv6(self.num, AddressFormat.SHORTEN)
 
-        return self._address
+        port = self.port
+        if port is not None:
+            return f"[{address}]:{port}"
+
+        return address
+
+    def __reduce__(self) -> tuple[Callable[..., Self], tuple[int, int | None]]:
+        """Pickle only the value and the port, the class tells the version."""
+        return self.__class__.from_int, (self._num, self._port)
+
+    @property
+    def version(self) -> SubnetType:
+        """Return the version of the address."""
+        return SubnetType.IPV6
+
+    @property
+    def packed(self) -> bytes:
+        """Return the address as 16 bytes in network order."""
+        return self._num.to_bytes(IPV6_PACKED_SIZE, "big")
+
+    @property
+    def sort_key(self) -> tuple[int, int, int]:
+        """Return a tuple of integers that sorts addresses numerically."""
+        # The value and port are validated on creation, so they need no clamping
+        return _IPV6_ORDER, self._num, _NO_PORT_ORDER if self._port is None else self._port
+
+    @classmethod
+    def from_int(cls, num: int, port_num: int | None = None) -> Self:
+        """
+        Create an IPv6 address directly from its integer value.
+
+        Unlike the regular constructor no string is parsed,
+        the text form is only generated when first needed.
+        """
+        if not IPV6_MIN_VALUE <= num <= IPV6_MAX_VALUE:
+            msg = f"Number '{num}' not in valid IPv6 range ({IPV6_MIN_VALUE}-{IPV6_MAX_VALUE})"
+            raise ValueError(msg)
+
+        self = object.__new__(cls)
+        self._address = None
+        IPAddress.__init__(self, address=num, port_num=port_num)
+        return self
+
+    @classmethod
+    def from_bytes(cls, data: bytes | bytearray | memoryview, port_num: int | None = None) -> Self:
+        """Create an IPv6 address from the 16 bytes returned by `packed`."""
+        if len(data) != IPV6_PACKED_SIZE:
+            msg = f"IPv6 addresses are {IPV6_PACKED_SIZE} bytes long, got {len(data)}"
+            raise ValueError(msg)
+
+        return cls.from_int(int.from_bytes(data, "big"), port_num)
 
     def _ipv6_to_num(self) -> int:
         """
@@ -299,65 +615,136 @@ def _ipv6_to_num(self) -> int:
 
         Raises ValueError on invalid IPv6 format.
         """
-        halves = self._address.split("::")
-        segments = []
+        if self._address is None:
+            # Created from a number, nothing to parse
+            return self.num
 
-        if len(halves) == 2:  # noqa: PLR2004
-            # Address with zero-skip part
-            left, right = (half.split(":") for half in halves)
-            total_length = len(left) + len(right)
+        return self._parse_num(self._address, SubnetType.IPV6)
 
-            if halves[0]:
-                segments.extend(left)
-            else:
-                segments.append("0000")
 
-            segments.extend(["0000" for _ in range(IPV6_MAX_SEGMENT_COUNT - total_length)])
+class LazyIPAddress(IPAddress):
+    """
+    An IPAddress that only parses its address when the value is needed.
+
+    The original text is kept as-is, so forwarding the address costs nothing.
+    Parsing happens on first access to the number, the port or any other
+    value-based property, or when comparing or hashing the address. Invalid
+    addresses therefore only raise an exception at that point.
+    """
 
-            if halves[1]:
-                segments.extend(right)
+    __slots__ = ("_source", "_source_port")
+
+    def __new__(cls: type[Self], address: str, port_num: int | None = None) -> Self:  # noqa: ARG004
+        """Create LazyIPAddress."""
+        return object.__new__(cls)
+
+    def __init__(self, address: str, port_num: int | None = None) -> None:
+        """Init LazyIPAddress."""
+        if not isinstance(address, str):
+            msg = f"Lazy addresses must be strings, not '{address.__class__.__name__}'"
+            raise TypeError(msg)
+
+        self._source = address
+        self._source_port = port_num
+        self._ipv4: IPv4 | None = None
+        self._ipv6: IPv6 | None = None
+        self._submask: SubnetMask | None = None
+
+    def __eq__(self, other: object) -> bool:
+        """Compare equality."""
+        return self.parsed == other
+
+    def __hash__(self) -> int:
+        """Hash the address."""
+        return hash(self.parsed)
+
+    def __reduce__(self) -> tuple[Callable[..., Self], tuple[str, int | None]]:  # type: ignore[override]
+        """Pickle the text, so the address stays unparsed until it's needed."""
+        if self.is_parsed:
+            # The port may have been changed since
+            return self.__class__, (str(self.parsed), None)
+        return self.__class__, (self._source, self._source_port)
+
+    def __str__(self) -> str:
+        """Str variant."""
+        if self._source_port is None and not self.is_parsed:
+            return self._source
+
+        return str(self.parsed)
+
+    @property
+    def is_parsed(self) -> bool:
+        """Tell whether the address has been parsed yet."""
+        return self._parsed() is not None
+
+    @property
+    def parsed(self) -> IPv4 | IPv6:
+        """Parse the address on first use and return the version-specific address."""
+        parsed = self._parsed()
+        if parsed is not None:
+            return parsed
+
+        address: IPv4 | IPv6 = IPAddress(self._source, self._source_port)  # type: ignore[arg-type,assignment]
+        with _parse_lock:
+            # Another thread may have parsed it meanwhile, and changed the port of its result
+            parsed = self._parsed()
+            if parsed is not None:
+                return parsed
+            if isinstance(address, IPv4):
+                self._ipv4 = address
             else:
-                segments.append("0000")
+                self._ipv6 = address
+        return address
 
-        elif len(halves) == 1:
-            # Full address
-            segments.extend(halves[0].split(":"))
+    def _parsed(self) -> IPv4 | IPv6 | None:
+        ipv4 = self._ipv4
+        return ipv4 if ipv4 is not None else self._ipv6
 
-        else:
-            msg = "Invalid IPv6 address format; only one zero-skip allowed"
-            raise ValueError(msg)
+    @property
+    def version(self) -> SubnetType:
+        """Return the version of the address, parsing it if needed."""
+        return self.parsed.version
+
+    @property
+    def num(self) -> int:
+        """Return the numerical value of the address, parsing it if needed."""
+        return self.parsed.num
+
+    @property
+    def port(self) -> int | None:
+        """Return the port in the address, or None if no port is specified."""
+        return self.parsed.port
+
+    @port.setter
+    def port(self, value: int | None) -> None:
+        """Set a new port value, parsing the address if needed."""
+        self.parsed.port = value
+
+
+class _FrozenAddress(PureAddress):
+    """Mixin that makes the port of an address read-only."""
+
+    __slots__ = ()
+
+    @property
+    def port(self) -> int | None:
+        """Return the port in the address, or None if no port is specified."""
+        return super().port
+
+    @port.setter
+    def port(self, value: int | None) -> None:
+        """Refuse to change the port, as the address may be shared."""
+        msg = f"Cannot set port to '{value}'; {self.__class__.__name__} is immutable"
+        raise AttributeError(msg)
+
+
+class FrozenIPv4(_FrozenAddress, IPv4):
+    """An IPv4 address that cannot be modified after creation."""
+
+    __slots__ = ()
+
+
+class FrozenIPv6(_FrozenAddress, IPv6):
+    """An IPv6 address that cannot be modified after creation."""
 
-        try:
-            processed_segments: list[int] = [
-                int(segment, IPV6_SEGMENT_BIT_COUNT) if segment else 0 for segment in reversed(segments)
-            ]
-        except ValueError as err:
-            msg = "Invalid IPv6 address format; address contains invalid characters"
-            raise ValueError(msg) from err
-
-        segment_count = len(processed_segments)
-        if segment_count > IPV6_MAX_SEGMENT_COUNT:
-            msg = f"Invalid IPv6 address format; too many segments ({segment_count} > {IPV6_MAX_SEGMENT_COUNT})"
-            raise ValueError(
-                msg,
-            )
-
-        highest = max(processed_segments)
-        if highest > IPV6_MAX_SEGMENT_VALUE:
-            msg = f"Invalid IPv6 address format; segment max value passed ({highest} > {IPV6_MAX_SEGMENT_VALUE})"
-            raise ValueError(
-                msg,
-            )
-
-        lowest = min(processed_segments)
-        if lowest < IPV6_MIN_SEGMENT_VALUE:
-            msg = f"Invalid IPv6 address format; segment min value passed ({lowest} < 0)"
-            raise ValueError(
-                msg,
-            )
-
-        total = 0
-        for idx, num in enumerate(processed_segments):
-            total += num * 2 ** (idx * 16)
-
-        return total
+    __slots__ = ()
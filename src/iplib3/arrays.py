@@ -0,0 +1,555 @@
+"""
+iplib3's functionality for storing many addresses compactly.
+
+Arrays can be saved in a fixed-width binary format, one column per file:
+
+- Addresses are stored back to back in network byte order, as 4 bytes
+  per IPv4 address and 16 bytes per IPv6 address, the same as `packed`.
+- Ports, if any, are stored as big-endian signed 32-bit integers,
+  with -1 for a missing port.
+
+There is no header, so the number of addresses follows from the size.
+Columns can be read without iplib3, eg. with NumPy:
+
+    numpy.fromfile(path, dtype=">u4")  # IPv4 addresses
+    numpy.fromfile(path, dtype=[("high", ">u8"), ("low", ">u8")])  # IPv6 addresses
+    numpy.fromfile(path, dtype=">i4")  # Ports
+
+or with the array module, swapping the bytes on little-endian machines.
+"""
+
+from __future__ import annotations
+
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from heapq import merge
+from itertools import compress, groupby, islice
+from typing import TYPE_CHECKING, Literal, overload
+
+from iplib3.address import IPAddress, IPv4, IPv6
+from iplib3.bulk import NO_PORT, IPv4Batch, IPv6Batch
+from iplib3.constants.ipv4 import IPV4_MAX_VALUE, IPV4_MIN_VALUE, IPV4_PACKED_SIZE
+from iplib3.constants.ipv6 import IPV6_MAX_VALUE, IPV6_MIN_VALUE, IPV6_PACKED_SIZE
+from iplib3.constants.port import PORT_NUMBER_MAX_VALUE
+from iplib3.constants.subnet import SubnetType
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+__all__ = ("IPAddressArray",)
+
+_HALF_BIT_COUNT = 64
+_HALF_MASK = (1 << _HALF_BIT_COUNT) - 1
+_PORT_BIT_COUNT = 17  # Ports are stored as port + 1 so that NO_PORT fits
+_PORT_MASK = (1 << _PORT_BIT_COUNT) - 1
+_PORT_PACKED_SIZE = 4
+# Sorting holds this many keys at a time as Python integers, the sorted runs are merged
+_SORT_RUN_SIZE = 1 << 20
+# The binary format is big-endian, so columns need swapping on little-endian machines
+_SWAP_BYTES = sys.byteorder == "little"
+
+
+class _SortKeys:
+    """Sequence of the sort keys of an array, computed from its columns as they're needed."""
+
+    __slots__ = ("_high", "_low", "_ports")
+
+    def __init__(self, low: memoryview, high: memoryview | None, ports: memoryview | None) -> None:
+        self._low = low
+        self._high = high
+        self._ports = ports
+
+    def __len__(self) -> int:
+        return len(self._low)
+
+    def __getitem__(self, index: int) -> int:
+        key: int = self._low[index]
+        if self._high is not None:
+            key |= self._high[index] << _HALF_BIT_COUNT
+        if self._ports is not None:
+            key = key << _PORT_BIT_COUNT | (self._ports[index] + 1)
+        return key
+
+    def __iter__(self) -> Iterator[int]:
+        nums = _iter_nums(self._low, self._high)
+        if self._ports is None:
+            return iter(nums)
+        return (num << _PORT_BIT_COUNT | (port + 1) for num, port in zip(nums, self._ports, strict=True))
+
+
+class IPAddressArray:
+    """
+    Compact, array-backed sequence of addresses of a single version.
+
+    IPv4 addresses are stored as unsigned 32-bit integers, IPv6 addresses
+    as pairs of unsigned 64-bit integers, and ports (if any) in a separate
+    signed 32-bit column where NO_PORT stands for a missing port.
+    Address objects are only created when individual elements are accessed,
+    and slicing returns a view that shares memory with the original.
+    """
+
+    __slots__ = ("_high", "_low", "_ports", "_sorted", "_version")
+
+    def __init__(
+        self,
+        nums: Iterable[int] = (),
+        version: SubnetType = SubnetType.IPV4,
+        ports: Iterable[int | None] | None = None,
+    ) -> None:
+        """Create IPAddressArray from integer address values, and optionally ports."""
+        self._version = SubnetType(version)
+        self._low, self._high, self._ports = _columns(nums, self._version, ports)
+        self._sorted = False
+
+    @classmethod
+    def from_addresses(cls, addresses: Iterable[IPAddress]) -> IPAddressArray:
+        """
+        Create IPAddressArray from address objects.
+
+        The version is taken from the first address, IPv4 if there are none.
+        Ports are stored only if at least one of the addresses has one.
+        """
+        items = list(addresses)
+        version = items[0].version if items else SubnetType.IPV4
+        ports = [address.port for address in items]
+        has_ports = any(port is not None for port in ports)
+        return cls((address.num for address in items), version, ports if has_ports else None)
+
+    @classmethod
+    def from_batch(cls, batch: IPv4Batch | IPv6Batch) -> IPAddressArray:
+        """
+        Create IPAddressArray from the results of `parse_ipv4_many` or `parse_ipv6_many`.
+
+        Invalid entries are left out. The arrays are copied only
+        if they contain invalid entries.
+        """
+        if isinstance(batch, IPv4Batch):
+            invalid = set(batch.invalid)
+            valid = [idx not in invalid for idx in range(len(batch.addresses))] if invalid else None
+            return cls._from_columns(
+                SubnetType.IPV4,
+                memoryview(_compress(batch.addresses, valid)),
+                None,
+                memoryview(_compress(batch.ports, valid)),
+            )
+
+        mask = batch.valid if batch.valid.count(0) else None
+        return cls._from_columns(
+            SubnetType.IPV6,
+            memoryview(_compress(batch.low, mask)),
+            memoryview(_compress(batch.high, mask)),
+            memoryview(_compress(batch.ports, mask)),
+        )
+
+    @classmethod
+    def from_bytes(
+        cls,
+        data: bytes | bytearray | memoryview,
+        version: SubnetType = SubnetType.IPV4,
+        ports: bytes | bytearray | memoryview | None = None,
+    ) -> IPAddressArray:
+        """Create IPAddressArray from an address column, and optionally a port column, in the binary format."""
+        version = SubnetType(version)
+        size = IPV4_PACKED_SIZE if version == SubnetType.IPV4 else IPV6_PACKED_SIZE
+        if len(data) % size:
+            msg = f"{version} address data must be a multiple of {size} bytes long, got {len(data)}"
+            raise ValueError(msg)
+
+        values = _unpack_column("I" if version == SubnetType.IPV4 else "Q", data)
+        if version == SubnetType.IPV4:
+            low, high = values, None
+        else:
+            low, high = values[1::2], memoryview(values[0::2])
+
+        port_column = None
+        if ports is not None:
+            if len(ports) != len(low) * _PORT_PACKED_SIZE:
+                msg = f"Got {len(ports) // _PORT_PACKED_SIZE} ports for {len(low)} addresses"
+                raise ValueError(msg)
+            port_values = _unpack_column("i", ports)
+            if not _valid_ports(port_values):
+                msg = f"Port numbers not in valid range ({NO_PORT}-{PORT_NUMBER_MAX_VALUE})"
+                raise ValueError(msg)
+            port_column = memoryview(port_values)
+
+        return cls._from_columns(version, memoryview(low), high, port_column)
+
+    def __len__(self) -> int:
+        """Return the number of addresses."""
+        return len(self._low)
+
+    @overload
+    def __getitem__(self, index: int) -> IPv4 | IPv6: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> IPAddressArray: ...
+
+    def __getitem__(self, index: int | slice) -> IPv4 | IPv6 | IPAddressArray:
+        """Return the address at the index, or a view of the slice."""
+        if isinstance(index, slice):
+            return self._from_columns(
+                self._version,
+                self._low[index],
+                None if self._high is None else self._high[index],
+                None if self._ports is None else self._ports[index],
+                is_sorted=self._sorted and index.step in {None, 1},
+            )
+
+        port = None if self._ports is None else self._ports[index]
+        if port == NO_PORT:
+            port = None
+
+        if self._high is None:
+            return IPv4.from_int(self._low[index], port)
+        return IPv6.from_int(self._high[index] << _HALF_BIT_COUNT | self._low[index], port)
+
+    def __iter__(self) -> Iterator[IPv4 | IPv6]:
+        """Iterate over the addresses, creating each object only when it's reached."""
+        for idx in range(len(self)):
+            yield self[idx]
+
+    def __contains__(self, item: object) -> bool:
+        """
+        Tell whether the array contains an address.
+
+        Integers are compared against the address values, address
+        objects against both the value and the port. Sorted arrays
+        are searched with bisection, others are scanned.
+        """
+        key = self._item_key(item)
+        if key is None:
+            return False
+
+        keys = self._key_sequence()
+        any_port = isinstance(item, int) and self._ports is not None
+
+        if self._sorted:
+            idx = bisect_left(keys, key)
+            if idx == len(keys):
+                return False
+            return keys[idx] >> _PORT_BIT_COUNT == item if any_port else keys[idx] == key
+
+        if any_port:
+            return any(num == item for num in _iter_nums(self._low, self._high))
+        return key in keys
+
+    def __eq__(self, other: object) -> bool:
+        """Compare equality."""
+        if isinstance(other, IPAddressArray):
+            return (
+                self._version == other._version
+                and (self._ports is None) == (other._ports is None)
+                and self._low == other._low
+                and self._high == other._high
+                and self._ports == other._ports
+            )
+
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        """Str representation."""
+        return f"iplib3.{self.__class__.__name__}(<{len(self)} addresses>, version='{self._version}')"
+
+    @property
+    def version(self) -> SubnetType:
+        """Return the version of the stored addresses."""
+        return self._version
+
+    @property
+    def is_sorted(self) -> bool:
+        """Tell whether the array is known to be sorted."""
+        return self._sorted
+
+    @property
+    def high(self) -> memoryview | None:
+        """Return the upper 64 bits of IPv6 addresses, None for IPv4."""
+        return self._high
+
+    @property
+    def low(self) -> memoryview:
+        """Return the IPv4 addresses, or the lower 64 bits of IPv6 addresses."""
+        return self._low
+
+    @property
+    def ports(self) -> memoryview | None:
+        """Return the ports with NO_PORT for missing ones, or None if the array has no port column."""
+        return self._ports
+
+    @property
+    def nbytes(self) -> int:
+        """Return the number of bytes used by the stored values."""
+        columns = (self._high, self._low, self._ports)
+        return sum(column.nbytes for column in columns if column is not None)
+
+    def nums(self) -> list[int]:
+        """Return the address values as integers."""
+        if self._high is None:
+            return self._low.tolist()
+        return list(_iter_nums(self._low, self._high))
+
+    def to_bytes(self) -> bytes:
+        """Return the address column in the binary format."""
+        if self._high is None:
+            return _pack_column("I", self._low)
+
+        values = array("Q", bytes(len(self._low) * IPV6_PACKED_SIZE))
+        values[0::2] = array("Q", self._high.tobytes())
+        values[1::2] = array("Q", self._low.tobytes())
+        return _pack_column("Q", memoryview(values))
+
+    def ports_to_bytes(self) -> bytes | None:
+        """Return the port column in the binary format, or None if the array has no port column."""
+        if self._ports is None:
+            return None
+        return _pack_column("i", self._ports)
+
+    def sort(self) -> IPAddressArray:
+        """
+        Return a sorted copy, ordered by address value and then by port.
+
+        The addresses are sorted in runs of a bounded size that are then
+        merged, so only one run at a time is held as Python integers.
+        """
+        return self._from_sorted_keys(self._sorted_keys())
+
+    def unique(self) -> IPAddressArray:
+        """Return a sorted copy without duplicates."""
+        return self._from_sorted_keys(_unique(self._sorted_keys()))
+
+    def searchsorted(self, value: int | IPAddress, side: Literal["left", "right"] = "left") -> int:
+        """
+        Find the index where the address would be inserted to keep the array sorted.
+
+        The array must be sorted. With a port column, integers are placed
+        before every port of the same address on the left side and after
+        them on the right side.
+        """
+        if not self._sorted:
+            msg = "The array must be sorted first"
+            raise ValueError(msg)
+
+        key = self._item_key(value, side)
+        if key is None:
+            msg = f"Cannot search for '{value!r}' in an array of {self._version} addresses"
+            raise TypeError(msg)
+
+        search = bisect_left if side == "left" else bisect_right
+        return search(self._key_sequence(), key)
+
+    def union(self, other: IPAddressArray) -> IPAddressArray:
+        """Return the sorted, unique addresses found in either array."""
+        self._check_compatible(other)
+        return self._from_sorted_keys(_unique(merge(self._sorted_keys(), other._sorted_keys())))
+
+    def intersection(self, other: IPAddressArray) -> IPAddressArray:
+        """Return the sorted, unique addresses found in both arrays."""
+        self._check_compatible(other)
+        return self._from_sorted_keys(
+            _match_sorted(_unique(self._sorted_keys()), _unique(other._sorted_keys()), found=True)
+        )
+
+    def difference(self, other: IPAddressArray) -> IPAddressArray:
+        """Return the sorted, unique addresses found only in this array."""
+        self._check_compatible(other)
+        return self._from_sorted_keys(
+            _match_sorted(_unique(self._sorted_keys()), _unique(other._sorted_keys()), found=False)
+        )
+
+    __or__ = union
+    __and__ = intersection
+    __sub__ = difference
+
+    @classmethod
+    def _from_columns(
+        cls,
+        version: SubnetType,
+        low: memoryview,
+        high: memoryview | None,
+        ports: memoryview | None,
+        *,
+        is_sorted: bool = False,
+    ) -> IPAddressArray:
+        self = cls.__new__(cls)
+        self._version = version
+        self._low = low
+        self._high = high
+        self._ports = ports
+        self._sorted = is_sorted
+        return self
+
+    def _check_compatible(self, other: IPAddressArray) -> None:
+        if not isinstance(other, IPAddressArray):
+            msg = f"Expected an IPAddressArray, got '{other.__class__.__name__}'"
+            raise TypeError(msg)
+        if self._version != other._version:
+            msg = f"Cannot combine {self._version} and {other._version} addresses"
+            raise ValueError(msg)
+        if (self._ports is None) != (other._ports is None):
+            msg = "Cannot combine arrays with and without ports"
+            raise ValueError(msg)
+
+    def _item_key(self, item: object, side: Literal["left", "right"] = "left") -> int | None:
+        """Turn an integer or address into a sort key, or return None if it can't be in the array."""
+        if isinstance(item, int):
+            if self._ports is None:
+                return item
+            # Integers have no port, so they match every port of the address
+            return item << _PORT_BIT_COUNT | (0 if side == "left" else _PORT_MASK)
+
+        # Going by version and value, so lazy and generic addresses work too
+        if not isinstance(item, IPAddress) or item.version != self._version:
+            return None
+
+        if self._ports is None:
+            return item.num
+        return item.num << _PORT_BIT_COUNT | ((NO_PORT if item.port is None else item.port) + 1)
+
+    def _key_sequence(self) -> memoryview | _SortKeys:
+        """Return the sort keys, the address column itself for IPv4 without ports."""
+        if self._high is None and self._ports is None:
+            return self._low
+        return self._keys()
+
+    def _keys(self) -> _SortKeys:
+        """Combine the columns into one integer per address that sorts by value and then by port."""
+        return _SortKeys(self._low, self._high, self._ports)
+
+    def _sorted_keys(self) -> Iterator[int]:
+        """Iterate over the sort keys in order, sorting them a run at a time and merging the runs."""
+        keys = iter(self._keys())
+        if self._sorted:
+            return keys
+
+        runs = []
+        while run := sorted(islice(keys, _SORT_RUN_SIZE)):
+            sorted_run = self._from_sorted_keys(run)
+            runs.append(_SortKeys(sorted_run.low, sorted_run.high, sorted_run.ports))
+        return merge(*runs)
+
+    def _from_sorted_keys(self, keys: Iterable[int]) -> IPAddressArray:
+        """Split sort keys back into columns, one key at a time."""
+        low = array("I" if self._high is None else "Q")
+        high = None if self._high is None else array("Q")
+        ports = None if self._ports is None else array("i")
+
+        if high is None and ports is None:
+            low.extend(keys)
+        else:
+            for key in keys:
+                num = key
+                if ports is not None:
+                    ports.append((key & _PORT_MASK) - 1)
+                    num >>= _PORT_BIT_COUNT
+                if high is not None:
+                    high.append(num >> _HALF_BIT_COUNT)
+                    num &= _HALF_MASK
+                low.append(num)
+
+        return self._from_columns(
+            self._version,
+            memoryview(low),
+            None if high is None else memoryview(high),
+            None if ports is None else memoryview(ports),
+            is_sorted=True,
+        )
+
+
+def _columns(
+    nums: Iterable[int], version: SubnetType, ports: Iterable[int | None] | None
+) -> tuple[memoryview, memoryview | None, memoryview | None]:
+    """Pack address values and ports into (low, high, ports) columns, without collecting them in lists."""
+    high = None
+
+    # The typecodes only fit values in range, so overflowing means a value is out of range
+    if version == SubnetType.IPV4:
+        try:
+            low = array("I", nums)
+        except OverflowError:
+            msg = f"Address values not in valid IPv4 range ({IPV4_MIN_VALUE}-{IPV4_MAX_VALUE})"
+            raise ValueError(msg) from None
+    else:
+        high, low = array("Q"), array("Q")
+        try:
+            for num in nums:
+                high.append(num >> _HALF_BIT_COUNT)
+                low.append(num & _HALF_MASK)
+        except OverflowError:
+            msg = f"Address values not in valid IPv6 range ({IPV6_MIN_VALUE}-{IPV6_MAX_VALUE})"
+            raise ValueError(msg) from None
+
+    high_column = None if high is None else memoryview(high)
+    if ports is None:
+        return memoryview(low), high_column, None
+
+    try:
+        port_column = array("i", (NO_PORT if port is None else port for port in ports))
+    except OverflowError:
+        port_column = None
+    if port_column is None or not _valid_ports(port_column):
+        msg = f"Port numbers not in valid range ({NO_PORT}-{PORT_NUMBER_MAX_VALUE})"
+        raise ValueError(msg)
+    if len(port_column) != len(low):
+        msg = f"Got {len(port_column)} ports for {len(low)} addresses"
+        raise ValueError(msg)
+
+    return memoryview(low), high_column, memoryview(port_column)
+
+
+def _valid_ports(ports: array[int]) -> bool:
+    """Tell whether a port column only holds port numbers and NO_PORT."""
+    return not ports or NO_PORT <= min(ports) <= max(ports) <= PORT_NUMBER_MAX_VALUE
+
+
+def _iter_nums(low: memoryview, high: memoryview | None) -> Iterable[int]:
+    """Iterate over the address values of the columns, combining the halves of IPv6 addresses."""
+    if high is None:
+        return low
+    return (high_bits << _HALF_BIT_COUNT | low_bits for high_bits, low_bits in zip(high, low, strict=True))
+
+
+def _unique(keys: Iterable[int]) -> Iterator[int]:
+    """Drop repeated keys from sorted keys."""
+    return (key for key, _ in groupby(keys))
+
+
+def _match_sorted(keys: Iterable[int], others: Iterable[int], *, found: bool) -> Iterator[int]:
+    """
+    Walk two sorted iterables of unique keys side by side.
+
+    Yields the keys that are also in `others` if `found` is true,
+    and those that aren't if it's false.
+    """
+    other_keys = iter(others)
+    other = next(other_keys, None)
+    for key in keys:
+        while other is not None and other < key:
+            other = next(other_keys, None)
+        if (key == other) is found:
+            yield key
+
+
+def _compress(values: array[int], valid: Iterable[int | bool] | None) -> array[int]:
+    """Drop the invalid entries, or return the values as-is if there are none."""
+    if valid is None:
+        return values
+    return array(values.typecode, compress(values, valid))
+
+
+def _pack_column(typecode: str, values: memoryview) -> bytes:
+    """Convert a column to big-endian bytes."""
+    column = array(typecode, values.tobytes())
+    if _SWAP_BYTES:
+        column.byteswap()
+    return column.tobytes()
+
+
+def _unpack_column(typecode: str, data: bytes | bytearray | memoryview) -> array[int]:
+    """Convert big-endian bytes to a column."""
+    column = array(typecode)
+    column.frombytes(data)
+    if _SWAP_BYTES:
+        column.byteswap()
+    return column
@@ -0,0 +1,437 @@
+"""iplib3's functionality for handling addresses in bulk."""
+
+from __future__ import annotations
+
+import sys
+from array import array
+from functools import cache, partial
+from itertools import islice
+from operator import methodcaller
+from socket import AF_INET, AF_INET6, inet_pton
+from struct import iter_unpack
+from typing import IO, TYPE_CHECKING, NamedTuple, TypeVar, overload
+
+from iplib3.address import AddressFormat, _remove_zeroes
+from iplib3.constants.ipv4 import IPV4_MAX_SEGMENT_VALUE, IPV4_PACKED_SIZE
+from iplib3.constants.ipv6 import (
+    IPV6_MAX_SEGMENT_VALUE,
+    IPV6_NUMBER_BIT_COUNT,
+    IPV6_PACKED_SIZE,
+    IPV6_SEGMENT_BIT_COUNT,
+)
+from iplib3.constants.port import PORT_NUMBER_MAX_VALUE, PORT_NUMBER_MIN_VALUE
+from iplib3.constants.subnet import SubnetType
+from iplib3.validators import ParsedAddress, try_parse
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+
+    import numpy as np
+    import numpy.typing as npt
+
+__all__ = ("IPv4Batch", "IPv6Batch", "format_ipv4_many", "format_ipv6_many", "parse_ipv4_many", "parse_ipv6_many")
+
+NO_PORT = -1  # Stored in port arrays in place of None
+
+B = TypeVar("B", "IPv4Batch", "IPv6Batch")
+
+_CHUNK_SIZE = 4096
+_IPV6_HALF_BIT_COUNT = 64
+_IPV6_HALF_MASK = (1 << _IPV6_HALF_BIT_COUNT) - 1
+
+_inet_pton_ipv4 = partial(inet_pton, AF_INET)
+_inet_pton_ipv6 = partial(inet_pton, AF_INET6)
+_split_port = methodcaller("partition", ":")
+_split_ipv6_port = methodcaller("partition", "]:")
+
+_IPV4_OCTETS = tuple(str(octet) for octet in range(IPV4_MAX_SEGMENT_VALUE + 1))
+_IPV6_HEXTET_WIDTH = IPV6_SEGMENT_BIT_COUNT // IPV6_NUMBER_BIT_COUNT
+
+
+class IPv4Batch(NamedTuple):
+    """
+    IPv4 addresses parsed in bulk.
+
+    All arrays are parallel to the input; entries listed in `invalid`
+    hold zero as their address and NO_PORT as their port.
+    """
+
+    addresses: array[int]
+    ports: array[int]
+    invalid: list[int]
+
+
+class IPv6Batch(NamedTuple):
+    """
+    IPv6 addresses parsed in bulk, split into high and low 64-bit halves.
+
+    All arrays are parallel to the input; `valid` holds 1 for every
+    successfully parsed entry and 0 otherwise. Invalid entries hold
+    zero as their address and NO_PORT as their port.
+    """
+
+    high: array[int]
+    low: array[int]
+    ports: array[int]
+    valid: bytearray
+
+    def to_numpy(self) -> tuple[npt.NDArray[np.void], npt.NDArray[np.bool_]]:
+        """
+        Copy the batch into a NumPy structured array of (hi, lo, port) records and a validity mask.
+
+        Requires NumPy to be installed.
+        """
+        import numpy as np  # noqa: PLC0415
+
+        records = np.empty(len(self.valid), dtype=[("hi", np.uint64), ("lo", np.uint64), ("port", np.int32)])
+        records["hi"] = np.frombuffer(self.high, dtype=np.uint64)
+        records["lo"] = np.frombuffer(self.low, dtype=np.uint64)
+        records["port"] = np.frombuffer(self.ports, dtype=np.int32)
+        return records, np.frombuffer(self.valid, dtype=np.bool_)
+
+
+def parse_ipv4_many(addresses: Iterable[str], *, workers: int = 1) -> IPv4Batch:
+    """
+    Parse many IPv4 addresses, optionally with ports, into packed arrays.
+
+    The addresses are accepted by the same rules as the strict
+    `ipv4_validator`, and their values match `IPv4.num`. Missing ports
+    are stored as NO_PORT. Invalid entries don't raise an exception,
+    their indices are collected instead.
+
+    The arrays support the buffer protocol, so they can be handed to
+    NumPy without copying (eg. `numpy.frombuffer(batch.addresses, numpy.uint32)`).
+
+    With more than one worker, chunks of the addresses are parsed on
+    that many threads if the interpreter runs them in parallel, see
+    `iplib3.parallel.threads_run_in_parallel`.
+    """
+    if workers > 1:
+        return _parse_threaded(parse_ipv4_many, addresses, workers)
+
+    batch = IPv4Batch(array("I"), array("i"), [])
+    iterator = iter(addresses)
+
+    while chunk := list(islice(iterator, _CHUNK_SIZE)):
+        if not _parse_ipv4_chunk(chunk, batch):
+            offset = len(batch.addresses)
+            for idx, address in enumerate(chunk, start=offset):
+                parsed = _parse_ipv4(address)
+                if parsed is None:
+                    batch.invalid.append(idx)
+                    parsed = 0, NO_PORT
+                batch.addresses.append(parsed[0])
+                batch.ports.append(parsed[1])
+
+    return batch
+
+
+def _parse_ipv4_chunk(chunk: list[str], batch: IPv4Batch) -> bool:
+    """
+    Parse a chunk of well-formed addresses at C speed.
+
+    `socket.inet_pton` only accepts canonical dotted-decimal addresses,
+    which are a subset of what `try_parse` accepts. Returns False
+    without touching the batch if anything in the chunk needs the slow path.
+    """
+    try:
+        text = "".join(chunk)
+        if "-" in text:
+            # Negative ports would be mistaken for NO_PORT
+            return False
+
+        if ":" in text:
+            parts = list(map(_split_port, chunk))
+            address_parts = [address for address, _, _ in parts]
+            ports = array("i", [int(port) if separator else NO_PORT for _, separator, port in parts])
+            if max(ports) > PORT_NUMBER_MAX_VALUE:
+                return False
+        else:
+            address_parts = chunk
+            ports = array("i", [NO_PORT]) * len(chunk)
+
+        packed = b"".join(map(_inet_pton_ipv4, address_parts))
+    except (OSError, OverflowError, TypeError, ValueError):
+        return False
+
+    if len(packed) != len(chunk) * IPV4_PACKED_SIZE:
+        return False
+
+    values = array("I")
+    values.frombytes(packed)
+    if sys.byteorder == "little":
+        values.byteswap()
+
+    batch.addresses.extend(values)
+    batch.ports.extend(ports)
+    return True
+
+
+def _parse_ipv4(address: str) -> tuple[int, int] | None:
+    """Parse a single IPv4 address into an (address, port) pair, or return None if it's not valid."""
+    return _parse_single(address, SubnetType.IPV4)
+
+
+def parse_ipv6_many(addresses: Iterable[str], *, workers: int = 1) -> IPv6Batch:
+    """
+    Parse many IPv6 addresses, optionally with ports, into packed arrays.
+
+    Zero-skips (`::`) and bracketed addresses with ports (`[::1]:80`)
+    are handled the same way as in `IPv6`, and the addresses are accepted
+    by the same rules as the strict `ipv6_validator`. The address value
+    is split into its high and low 64 bits, so `IPv6.num` equals
+    `high << 64 | low`. Missing ports are stored as NO_PORT.
+
+    Threads are used the same way as in `parse_ipv4_many`.
+    """
+    if workers > 1:
+        return _parse_threaded(parse_ipv6_many, addresses, workers)
+
+    batch = IPv6Batch(array("Q"), array("Q"), array("i"), bytearray())
+    iterator = iter(addresses)
+
+    while chunk := list(islice(iterator, _CHUNK_SIZE)):
+        if not _parse_ipv6_chunk(chunk, batch):
+            for address in chunk:
+                parsed = _parse_ipv6(address)
+                batch.valid.append(parsed is not None)
+                if parsed is None:
+                    parsed = 0, NO_PORT
+                num, port = parsed
+                batch.high.append(num >> _IPV6_HALF_BIT_COUNT)
+                batch.low.append(num & _IPV6_HALF_MASK)
+                batch.ports.append(port)
+
+    return batch
+
+
+def _parse_ipv6_chunk(chunk: list[str], batch: IPv6Batch) -> bool:
+    """
+    Parse a chunk of well-formed addresses at C speed.
+
+    Apart from embedded IPv4 addresses, which are ruled out beforehand,
+    `socket.inet_pton` accepts a subset of what `try_parse` accepts.
+    Returns False without touching the batch if anything in the chunk
+    needs the slow path.
+    """
+    try:
+        text = "".join(chunk)
+        if "." in text or "-" in text:
+            return False
+
+        if "]" in text:
+            parts = list(map(_split_ipv6_port, chunk))
+            address_parts = [address[1:] if separator else address for address, separator, _ in parts]
+            ports = array("i", [int(port) if separator else NO_PORT for _, separator, port in parts])
+            if max(ports) > PORT_NUMBER_MAX_VALUE:
+                return False
+        else:
+            address_parts = chunk
+            ports = array("i", [NO_PORT]) * len(chunk)
+
+        packed = b"".join(map(_inet_pton_ipv6, address_parts))
+    except (OSError, OverflowError, TypeError, ValueError):
+        return False
+
+    if len(packed) != len(chunk) * IPV6_PACKED_SIZE:
+        return False
+
+    values = array("Q")
+    values.frombytes(packed)
+    if sys.byteorder == "little":
+        values.byteswap()
+
+    batch.high.extend(values[0::2])
+    batch.low.extend(values[1::2])
+    batch.ports.extend(ports)
+    batch.valid.extend(b"\x01" * len(chunk))
+    return True
+
+
+def _parse_ipv6(address: str) -> tuple[int, int] | None:
+    """Parse a single IPv6 address into an (address, port) pair, or return None if it's not valid."""
+    return _parse_single(address, SubnetType.IPV6)
+
+
+def _parse_threaded(parse: Callable[[Iterable[str]], B], addresses: Iterable[str], workers: int) -> B:
+    """Parse chunks of the addresses on threads, and join the batches in order."""
+    from iplib3.parallel import _extend, _map_threaded  # noqa: PLC0415
+
+    batch, *chunks = _map_threaded(parse, addresses, workers)
+    for chunk in chunks:
+        _extend(batch, chunk)
+    return batch
+
+
+def _parse_single(address: str, version: SubnetType) -> tuple[int, int] | None:
+    if not isinstance(address, str):
+        return None
+
+    parsed = try_parse(address, version=version)
+    if not isinstance(parsed, ParsedAddress):
+        return None
+
+    return parsed.num, NO_PORT if parsed.port is None else parsed.port
+
+
+@overload
+def format_ipv4_many(
+    addresses: Iterable[int], ports: Iterable[int] | None = None, *, file: None = None
+) -> list[str]: ...
+
+
+@overload
+def format_ipv4_many(addresses: Iterable[int], ports: Iterable[int] | None = None, *, file: IO[str]) -> None: ...
+
+
+def format_ipv4_many(
+    addresses: Iterable[int], ports: Iterable[int] | None = None, *, file: IO[str] | None = None
+) -> list[str] | None:
+    """
+    Format many IPv4 address values, optionally with ports, as strings.
+
+    This is the reverse of `parse_ipv4_many`, ports are given as
+    a parallel iterable and NO_PORT leaves the port out. Octets are
+    looked up from a table instead of being formatted one at a time.
+
+    Given a file, the addresses are written to it one per line
+    instead of being returned as a list.
+    """
+    octets = _IPV4_OCTETS
+    result: list[str] = []
+
+    for chunk, port_chunk in _chunks(addresses, ports):
+        values = _pack_ipv4(chunk)
+        texts = [f"{octets[a]}.{octets[b]}.{octets[c]}.{octets[d]}" for a, b, c, d in iter_unpack("4B", values)]
+        if port_chunk is not None:
+            texts = [
+                text if port == NO_PORT else f"{text}:{port}" for text, port in zip(texts, port_chunk, strict=True)
+            ]
+        _emit(texts, result, file)
+
+    return None if file is not None else result
+
+
+@overload
+def format_ipv6_many(
+    addresses: Iterable[int],
+    ports: Iterable[int] | None = None,
+    address_format: AddressFormat = AddressFormat.SHORTEN,
+    *,
+    file: None = None,
+) -> list[str]: ...
+
+
+@overload
+def format_ipv6_many(
+    addresses: Iterable[int],
+    ports: Iterable[int] | None = None,
+    address_format: AddressFormat = AddressFormat.SHORTEN,
+    *,
+    file: IO[str],
+) -> None: ...
+
+
+def format_ipv6_many(
+    addresses: Iterable[int],
+    ports: Iterable[int] | None = None,
+    address_format: AddressFormat = AddressFormat.SHORTEN,
+    *,
+    file: IO[str] | None = None,
+) -> list[str] | None:
+    """
+    Format many IPv6 address values, optionally with ports, as strings.
+
+    The addresses are whole 128-bit values, the same as `IPv6.num`,
+    and are formatted like `PureAddress.num_to_ipv6` would. Ports are
+    given as a parallel iterable, NO_PORT leaves the port out.
+    Segments are looked up from a table, which is built on first use.
+
+    Given a file, the addresses are written to it one per line
+    instead of being returned as a list.
+    """
+    width = 0 if AddressFormat.SHORTEN in address_format else _IPV6_HEXTET_WIDTH
+    zero_segment = f"{0:0{width}}"
+    hextets = _hextet_table(width)
+    result: list[str] = []
+
+    for chunk, port_chunk in _chunks(addresses, ports):
+        packed = _pack_ipv6(chunk)
+        texts = [
+            f"{hextets[a]}:{hextets[b]}:{hextets[c]}:{hextets[d]}:{hextets[e]}:{hextets[f]}:{hextets[g]}:{hextets[h]}"
+            for a, b, c, d, e, f, g, h in iter_unpack(">8H", packed)
+        ]
+        if AddressFormat.REMOVE_ZEROES in address_format:
+            texts = [_remove_zeroes(text, zero_segment) for text in texts]
+        if port_chunk is not None:
+            texts = [
+                text if port == NO_PORT else f"[{text}]:{port}" for text, port in zip(texts, port_chunk, strict=True)
+            ]
+        _emit(texts, result, file)
+
+    return None if file is not None else result
+
+
+@cache
+def _hextet_table(width: int) -> tuple[str, ...]:
+    """Return the text of every IPv6 segment value, padded to the given width."""
+    return tuple(f"{hextet:0{width}X}" for hextet in range(IPV6_MAX_SEGMENT_VALUE + 1))
+
+
+def _chunks(addresses: Iterable[int], ports: Iterable[int] | None) -> Iterator[tuple[list[int], list[int] | None]]:
+    """Split addresses and their optional ports into validated chunks of equal length."""
+    address_iterator = iter(addresses)
+    port_iterator = None if ports is None else iter(ports)
+
+    while True:
+        chunk = list(islice(address_iterator, _CHUNK_SIZE))
+        port_chunk = None if port_iterator is None else list(islice(port_iterator, _CHUNK_SIZE))
+
+        if port_chunk is not None:
+            if len(port_chunk) != len(chunk):
+                msg = "Addresses and ports differ in length"
+                raise ValueError(msg)
+            invalid = [
+                port
+                for port in port_chunk
+                if port != NO_PORT and not PORT_NUMBER_MIN_VALUE <= port <= PORT_NUMBER_MAX_VALUE
+            ]
+            if invalid:
+                msg = f"Port number '{invalid[0]}' not in valid range ({PORT_NUMBER_MIN_VALUE}-{PORT_NUMBER_MAX_VALUE})"
+                raise ValueError(msg)
+
+        if not chunk:
+            return
+
+        yield chunk, port_chunk
+
+
+def _pack_ipv4(chunk: list[int]) -> bytes:
+    """Pack IPv4 address values as big-endian bytes."""
+    try:
+        values = array("I", chunk)
+    except (OverflowError, TypeError) as err:
+        msg = f"Address values must be integers in the valid {SubnetType.IPV4} range"
+        raise ValueError(msg) from err
+
+    if sys.byteorder == "little":
+        values.byteswap()
+    return values.tobytes()
+
+
+def _pack_ipv6(chunk: list[int]) -> bytes:
+    """Pack IPv6 address values as big-endian bytes."""
+    try:
+        return b"".join([num.to_bytes(IPV6_PACKED_SIZE, "big") for num in chunk])
+    except (AttributeError, OverflowError) as err:
+        msg = f"Address values must be integers in the valid {SubnetType.IPV6} range"
+        raise ValueError(msg) from err
+
+
+def _emit(texts: list[str], result: list[str], file: IO[str] | None) -> None:
+    """Collect formatted addresses, or write them to the file one per line."""
+    if file is None:
+        result.extend(texts)
+    else:
+        file.write("\n".join(texts))
+        file.write("\n")
@@ -0,0 +1,86 @@
+"""iplib3's functionality for reusing address objects."""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+from iplib3.address import FrozenIPv4, FrozenIPv6
+
+if TYPE_CHECKING:
+    from functools import _CacheInfo
+
+__all__ = ("AddressCache",)
+
+DEFAULT_CACHE_SIZE = 4096
+
+
+class AddressCache:
+    """
+    Bounded interning cache for addresses.
+
+    Calling the cache with an address string, and optionally a port,
+    returns an immutable address object. Repeated inputs return the
+    same instance without parsing the address again, and the least
+    recently used entries are evicted once the cache is full.
+    """
+
+    __slots__ = ("_lookup",)
+
+    def __init__(self, maxsize: int = DEFAULT_CACHE_SIZE) -> None:
+        """Create AddressCache."""
+        if not isinstance(maxsize, int) or maxsize < 1:
+            msg = f"Cache size must be a positive integer, not '{maxsize}'"
+            raise ValueError(msg)
+
+        self._lookup = lru_cache(maxsize=maxsize)(self._create)
+
+    def __call__(self, address: str, port_num: int | None = None) -> FrozenIPv4 | FrozenIPv6:
+        """Return the cached address object, creating it if needed."""
+        if not isinstance(address, str):
+            msg = f"Only string addresses can be cached, not '{address.__class__.__name__}'"
+            raise TypeError(msg)
+
+        return self._lookup(address, port_num)
+
+    def __len__(self) -> int:
+        """Return the number of cached addresses."""
+        return self.cache_info().currsize
+
+    def __repr__(self) -> str:
+        """Str representation."""
+        info = self.cache_info()
+        return (
+            f"iplib3.{self.__class__.__name__}"
+            f"(maxsize={info.maxsize}, size={info.currsize}, hits={info.hits}, misses={info.misses})"
+        )
+
+    @property
+    def maxsize(self) -> int:
+        """Return the maximum number of cached addresses."""
+        return self.cache_info().maxsize or 0
+
+    @property
+    def hits(self) -> int:
+        """Return how many lookups were served from the cache."""
+        return self.cache_info().hits
+
+    @property
+    def misses(self) -> int:
+        """Return how many lookups had to parse the address."""
+        return self.cache_info().misses
+
+    def cache_info(self) -> _CacheInfo:
+        """Return the hit and miss counters along with the current and maximum size."""
+        return self._lookup.cache_info()
+
+    def clear(self) -> None:
+        """Empty the cache and reset its counters."""
+        self._lookup.cache_clear()
+
+    @staticmethod
+    def _create(address: str, port_num: int | None) -> FrozenIPv4 | FrozenIPv6:
+        # Same rule as IPAddress; only IPv4-addresses have '.'
+        if "." in address:
+            return FrozenIPv4(address, port_num)
+        return FrozenIPv6(address, port_num)
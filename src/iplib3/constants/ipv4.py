@@ -8,3 +8,4 @@
 IPV4_MAX_SEGMENT_VALUE = 0xFF  # (255)
 IPV4_MIN_VALUE = 0  # 0x0*0x100**0
 IPV4_MAX_VALUE = 4294967295  # 0xFF_FF_FF_FF (8)
+IPV4_PACKED_SIZE = 4  # Bytes in network order
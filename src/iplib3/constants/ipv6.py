@@ -9,3 +9,4 @@
 IPV6_MAX_SEGMENT_VALUE = 0xFFFF  # (65535)
 IPV6_MIN_VALUE = 0  # 0x0*0x10_000**0
 IPV6_MAX_VALUE = 340282366920938463463374607431768211455  # 0xFFFF_FFFF_FFFF_FFFF_FFFF_FFFF_FFFF_FFFF (32)
+IPV6_PACKED_SIZE = 16  # Bytes in network order
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from enum import StrEnum
+from types import MappingProxyType
 
 from iplib3.constants.ipv4 import IPV4_MAX_SEGMENT_COUNT, IPV4_SEGMENT_BIT_COUNT
 from iplib3.constants.ipv6 import IPV6_MAX_SEGMENT_COUNT, IPV6_SEGMENT_BIT_COUNT
@@ -14,6 +15,22 @@
 IPV6_MIN_SUBNET_VALUE = 0  # Unlike in IPv4, this should *always* be valid
 IPV6_MAX_SUBNET_VALUE = IPV6_SEGMENT_BIT_COUNT * IPV6_MAX_SEGMENT_COUNT - 1  # == 127
 
+# Precomputed masks, indexed by prefix length (including the full-width, single-host one)
+IPV4_SUBNET_BIT_COUNT = IPV4_MAX_SUBNET_VALUE + 1  # == 32
+IPV6_SUBNET_BIT_COUNT = IPV6_MAX_SUBNET_VALUE + 1  # == 128
+IPV4_HOST_MASKS = tuple((1 << (IPV4_SUBNET_BIT_COUNT - prefix)) - 1 for prefix in range(IPV4_SUBNET_BIT_COUNT + 1))
+IPV6_HOST_MASKS = tuple((1 << (IPV6_SUBNET_BIT_COUNT - prefix)) - 1 for prefix in range(IPV6_SUBNET_BIT_COUNT + 1))
+IPV4_SUBNET_MASKS = tuple(IPV4_HOST_MASKS[0] ^ host_mask for host_mask in IPV4_HOST_MASKS)
+IPV6_SUBNET_MASKS = tuple(IPV6_HOST_MASKS[0] ^ host_mask for host_mask in IPV6_HOST_MASKS)
+IPV4_SUBNET_MASK_STRINGS = tuple(
+    ".".join(str(mask >> shift & 0xFF) for shift in (24, 16, 8, 0)) for mask in IPV4_SUBNET_MASKS
+)
+
+# Reverse lookups, from a mask to its prefix length
+IPV4_PREFIX_LENGTHS_BY_MASK = MappingProxyType({mask: prefix for prefix, mask in enumerate(IPV4_SUBNET_MASKS)})
+IPV6_PREFIX_LENGTHS_BY_MASK = MappingProxyType({mask: prefix for prefix, mask in enumerate(IPV6_SUBNET_MASKS)})
+IPV4_PREFIX_LENGTHS_BY_STRING = MappingProxyType({mask: prefix for prefix, mask in enumerate(IPV4_SUBNET_MASK_STRINGS)})
+
 
 class SubnetType(StrEnum):
     """Subnet type."""
@@ -0,0 +1,339 @@
+"""
+iplib3's functionality for on-disk range indexes shared between processes.
+
+A range index is a file of sorted, non-overlapping address ranges, each
+with a payload of bytes. `build_range_index` writes one from a stream of
+networks, and `MmapRangeIndex` memory-maps it, so every process reading
+the same file shares a single copy in the OS page cache.
+
+The file is laid out as follows, all integers being big-endian:
+
+- A 32-byte header: the magic bytes b"IPLIB3RI", the format version (1)
+  and the address version (4 or 6) as one byte each, 6 bytes of padding,
+  the number of records and the offset of the payload section as 8 bytes each.
+- The records, sorted by their start: the first and last address of the
+  range, 4 bytes each for IPv4 and 16 bytes each for IPv6, followed by
+  8 bytes for the offset of the payload within the payload section.
+- The payload section: each payload as a 4-byte length followed by the data.
+  Consecutive ranges with identical payloads share a single copy.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import stat
+import struct
+import tempfile
+from bisect import bisect_right
+from pathlib import Path
+from shutil import copyfileobj
+from typing import TYPE_CHECKING, BinaryIO, NamedTuple
+
+from iplib3.address import IPAddress
+from iplib3.constants.ipv4 import IPV4_PACKED_SIZE
+from iplib3.constants.ipv6 import IPV6_PACKED_SIZE
+from iplib3.constants.subnet import SubnetType
+from iplib3.network import IPNetwork
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from os import PathLike
+    from types import TracebackType
+    from typing import Self, TypeAlias
+
+    from iplib3.subnet import SubnetMask
+
+    RangeItem: TypeAlias = tuple[IPAddress, SubnetMask | int | None] | tuple[IPAddress, SubnetMask | int | None, bytes]
+
+__all__ = ("IndexRecord", "MmapRangeIndex", "build_range_index")
+
+NO_MATCH = -1  # Record index returned when no range contains the address
+
+_MAGIC = b"IPLIB3RI"
+_FORMAT_VERSION = 1
+_HEADER = struct.Struct(">8sBB6xQQ")
+_OFFSET = struct.Struct(">Q")
+_LENGTH = struct.Struct(">I")
+_ADDRESS_SIZES = {SubnetType.IPV4: IPV4_PACKED_SIZE, SubnetType.IPV6: IPV6_PACKED_SIZE}
+_VERSION_NUMBERS = {SubnetType.IPV4: 4, SubnetType.IPV6: 6}
+_FILE_MODE = 0o644  # Mode of new indexes, temporary files start out readable by their owner only
+
+
+class IndexRecord(NamedTuple):
+    """A range in a range index, the payload being a view of the mapped file."""
+
+    start: int
+    end: int
+    payload: memoryview
+
+
+class _Starts:
+    """Sequence of the record starts, read from the mapped file as they're needed by bisection."""
+
+    __slots__ = ("_buffer", "_count", "_record_size", "_size")
+
+    def __init__(self, buffer: memoryview, count: int, size: int) -> None:
+        self._buffer = buffer
+        self._count = count
+        self._size = size
+        self._record_size = 2 * size + _OFFSET.size
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int) -> int:
+        offset = _HEADER.size + index * self._record_size
+        return int.from_bytes(self._buffer[offset : offset + self._size], "big")
+
+
+class MmapRangeIndex:
+    """
+    Read-only, memory-mapped range index.
+
+    Lookups bisect the records in the mapped file directly, without
+    loading or copying them, and payloads are returned as views of
+    the file. Views must be released before the index is closed.
+    Pickling an index pickles its path, so worker processes map
+    the same file.
+    """
+
+    __slots__ = ("_buffer", "_count", "_mmap", "_path", "_payloads", "_record_size", "_size", "_starts", "_version")
+
+    def __init__(self, path: str | PathLike[str]) -> None:
+        """Open and map a range index written by `build_range_index`."""
+        self._path = Path(path)
+        with self._path.open("rb") as file:
+            if os.fstat(file.fileno()).st_size < _HEADER.size:
+                msg = f"'{self._path}' is not an iplib3 range index"
+                raise ValueError(msg)
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._buffer = memoryview(self._mmap)
+
+        try:
+            self._read_header()
+        except ValueError:
+            self.close()
+            raise
+
+        self._starts = _Starts(self._buffer, self._count, self._size)
+
+    def __enter__(self) -> Self:
+        """Use the index as a context manager, closing it on exit."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Close the index."""
+        self.close()
+
+    def __len__(self) -> int:
+        """Return the number of ranges."""
+        return self._count
+
+    def __getitem__(self, index: int) -> IndexRecord:
+        """Return the range at the index."""
+        if not -self._count <= index < self._count:
+            msg = f"Record index {index} out of range"
+            raise IndexError(msg)
+
+        offset = _HEADER.size + (index % self._count) * self._record_size
+        buffer = self._buffer
+        start = int.from_bytes(buffer[offset : offset + self._size], "big")
+        end = int.from_bytes(buffer[offset + self._size : offset + 2 * self._size], "big")
+        (payload_offset,) = _OFFSET.unpack_from(buffer, offset + 2 * self._size)
+
+        payload_offset += self._payloads
+        (length,) = _LENGTH.unpack_from(buffer, payload_offset)
+        payload_offset += _LENGTH.size
+        return IndexRecord(start, end, buffer[payload_offset : payload_offset + length])
+
+    def __iter__(self) -> Iterator[IndexRecord]:
+        """Iterate over the ranges in address order."""
+        for idx in range(self._count):
+            yield self[idx]
+
+    def __contains__(self, address: object) -> bool:
+        """Tell whether a range contains the address."""
+        if not isinstance(address, (int, str, IPAddress)):
+            return False
+        return self.find(address) != NO_MATCH
+
+    def __reduce__(self) -> tuple[type[Self], tuple[Path]]:
+        """Pickle the path, unpickling maps the file again."""
+        return self.__class__, (self._path,)
+
+    def __repr__(self) -> str:
+        """Str representation."""
+        return f"iplib3.{self.__class__.__name__}('{self._path}', <{self._count} ranges>, version='{self._version}')"
+
+    @property
+    def version(self) -> SubnetType:
+        """Return the version of the indexed addresses."""
+        return self._version
+
+    @property
+    def path(self) -> Path:
+        """Return the path of the mapped file."""
+        return self._path
+
+    def find(self, address: int | str | IPAddress) -> int:
+        """
+        Return the index of the range containing the address, or NO_MATCH.
+
+        Integers are treated as addresses of the index's version,
+        addresses of the other version never match.
+        """
+        num = self._address_num(address)
+        if num is None:
+            return NO_MATCH
+
+        index = bisect_right(self._starts, num) - 1
+        if index < 0:
+            return NO_MATCH
+
+        offset = _HEADER.size + index * self._record_size + self._size
+        if int.from_bytes(self._buffer[offset : offset + self._size], "big") < num:
+            return NO_MATCH
+        return index
+
+    def lookup(self, address: int | str | IPAddress) -> memoryview | None:
+        """Return the payload of the range containing the address, or None if there's no such range."""
+        index = self.find(address)
+        return None if index == NO_MATCH else self[index].payload
+
+    def lookup_record(self, address: int | str | IPAddress) -> IndexRecord | None:
+        """Return the range containing the address along with its payload, or None if there's no such range."""
+        index = self.find(address)
+        return None if index == NO_MATCH else self[index]
+
+    def close(self) -> None:
+        """Unmap the file. Raises BufferError if payload views are still in use."""
+        self._buffer.release()
+        try:
+            self._mmap.close()
+        except BufferError:
+            # Keep the index usable, so it can be closed again once the views are released
+            self._buffer = memoryview(self._mmap)
+            self._starts = _Starts(self._buffer, self._count, self._size)
+            raise
+
+    def _read_header(self) -> None:
+        magic, format_version, version_number, count, payloads = _HEADER.unpack_from(self._buffer)
+        versions = {number: version for version, number in _VERSION_NUMBERS.items()}
+        if magic != _MAGIC or version_number not in versions:
+            msg = f"'{self._path}' is not an iplib3 range index"
+            raise ValueError(msg)
+        if format_version != _FORMAT_VERSION:
+            msg = f"'{self._path}' has an unsupported format version: {format_version}"
+            raise ValueError(msg)
+
+        self._version = versions[version_number]
+        self._size = _ADDRESS_SIZES[self._version]
+        self._record_size = 2 * self._size + _OFFSET.size
+        self._count: int = count
+        self._payloads: int = payloads
+
+        if payloads != _HEADER.size + count * self._record_size or payloads > len(self._buffer):
+            msg = f"'{self._path}' is truncated or corrupted"
+            raise ValueError(msg)
+
+    def _address_num(self, address: int | str | IPAddress) -> int | None:
+        """Return the value of an address of the index's version, or None for the other version."""
+        if isinstance(address, str):
+            address = IPAddress(address)  # type: ignore[arg-type]
+
+        if isinstance(address, IPAddress):
+            # Going by version and value, so lazy and generic addresses work too
+            return address.num if address.version == self._version else None
+        if isinstance(address, int):
+            return address
+
+        msg = f"Invalid type for address: '{address.__class__.__name__}'\nExpected int, string, IPv4, or IPv6"
+        raise TypeError(msg)
+
+
+def build_range_index(
+    path: str | PathLike[str],
+    items: Iterable[RangeItem],
+    version: SubnetType = SubnetType.IPV4,
+) -> int:
+    """
+    Write a range index from (address, subnet mask) or (address, subnet mask, payload) items.
+
+    The items are streamed to the file, so they must be sorted by address
+    and must not overlap. Items without a payload get an empty one, and
+    host bits in the addresses are ignored. Returns the number of ranges.
+
+    The index is written to a temporary file that then replaces the target,
+    so processes that have the previous version mapped keep reading it.
+
+    Only the previous payload is kept in memory, so consecutive ranges
+    with identical payloads share one copy, while a payload recurring
+    later on is stored again.
+    """
+    version = SubnetType(version)
+    path = Path(path)
+
+    # Written next to the target and moved over it, as truncating the file would break processes mapping it
+    descriptor, temporary_name = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+    temporary = Path(temporary_name)
+    try:
+        with os.fdopen(descriptor, "wb") as file:
+            count = _write_records(file, items, version)
+        temporary.chmod(stat.S_IMODE(path.stat().st_mode) if path.exists() else _FILE_MODE)
+        temporary.replace(path)
+    except BaseException:
+        temporary.unlink(missing_ok=True)
+        raise
+
+    return count
+
+
+def _write_records(file: BinaryIO, items: Iterable[RangeItem], version: SubnetType) -> int:
+    """Write the header, records and payloads of a range index to a file, returning the number of ranges."""
+    size = _ADDRESS_SIZES[version]
+    last_payload: bytes | None = None
+    payload_offset = 0
+    count = 0
+    last_end = -1
+
+    with tempfile.TemporaryFile() as payloads:
+        file.write(bytes(_HEADER.size))  # Filled in once the counts are known
+
+        for item in items:
+            address, subnet_mask, *rest = item
+            payload = bytes(rest[0]) if rest else b""
+
+            network = IPNetwork(address, subnet_mask, strict=False)
+            if network.version != version:
+                msg = f"Cannot add {network.version} network '{network}' to an index of {version} addresses"
+                raise ValueError(msg)
+            if network.network <= last_end:
+                msg = f"Ranges must be sorted and must not overlap, '{network}' came after address {last_end}"
+                raise ValueError(msg)
+            last_end = network.broadcast
+
+            if payload != last_payload:
+                payload_offset = payloads.tell()
+                payloads.write(_LENGTH.pack(len(payload)))
+                payloads.write(payload)
+                last_payload = payload
+
+            file.write(network.network.to_bytes(size, "big"))
+            file.write(network.broadcast.to_bytes(size, "big"))
+            file.write(_OFFSET.pack(payload_offset))
+            count += 1
+
+        payload_section = file.tell()
+        payloads.seek(0)
+        copyfileobj(payloads, file)
+
+        file.seek(0)
+        file.write(_HEADER.pack(_MAGIC, _FORMAT_VERSION, _VERSION_NUMBERS[version], count, payload_section))
+
+    return count
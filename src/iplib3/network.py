@@ -0,0 +1,223 @@
+"""iplib3's functionality specific to networks."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from iplib3.address import IPAddress, IPv4, IPv6
+from iplib3.constants.subnet import (
+    IPV4_MAX_SUBNET_VALUE,
+    IPV6_MAX_SUBNET_VALUE,
+    SubnetType,
+)
+from iplib3.subnet import SubnetMask
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+__all__ = ("IPNetwork",)
+
+# SubnetMask stops one short of the full width, which is left for single hosts
+_BIT_COUNTS = {
+    SubnetType.IPV4: IPV4_MAX_SUBNET_VALUE + 1,
+    SubnetType.IPV6: IPV6_MAX_SUBNET_VALUE + 1,
+}
+
+
+class IPNetwork:
+    """
+    A block of addresses defined by a network address and a subnet mask.
+
+    The first and last address values are computed once, so membership
+    tests are plain integer comparisons. Addresses are only created
+    when they're accessed, so iterating over or indexing a large IPv6
+    network costs no more than doing the same for a small IPv4 one.
+    """
+
+    __slots__ = ("_address_class", "_broadcast", "_network", "_submask", "_version")
+
+    def __init__(
+        self,
+        network: str | IPAddress,
+        subnet_mask: int | str | SubnetMask | None = None,
+        *,
+        strict: bool = True,
+    ) -> None:
+        """
+        Create IPNetwork from an address and a subnet mask, or a string like '10.0.0.0/8'.
+
+        Without a subnet mask the network contains a single address.
+        Unless strict is False, the address may not have host bits set.
+        """
+        if isinstance(network, str):
+            if "/" in network:
+                if subnet_mask is not None:
+                    msg = f"Subnet mask given twice for '{network}'"
+                    raise ValueError(msg)
+                network, subnet_mask = network.split("/", maxsplit=1)
+            network = IPAddress(network)  # type: ignore[arg-type]
+
+        if not isinstance(network, IPAddress):
+            msg = f"Invalid type for network address: '{network.__class__.__name__}'\nExpected IPv4, IPv6, or string"
+            raise TypeError(msg)
+
+        self._version = network.version
+        self._address_class: type[IPv4 | IPv6] = IPv4 if self._version == SubnetType.IPV4 else IPv6
+        self._submask = self._make_subnet_mask(subnet_mask, self._version)
+
+        host_bits = _BIT_COUNTS[self._version] - self.prefix_length
+        host_mask = (1 << host_bits) - 1
+
+        if strict and network.num & host_mask:
+            msg = f"'{network}/{self.prefix_length}' has host bits set"
+            raise ValueError(msg)
+
+        self._network = network.num & ~host_mask
+        self._broadcast = self._network | host_mask
+
+    def __repr__(self) -> str:
+        """Str representation."""
+        return f"iplib3.{self.__class__.__name__}('{self}')"
+
+    def __str__(self) -> str:
+        """Str conversion."""
+        return f"{self.network_address}/{self.prefix_length}"
+
+    def __eq__(self, other: object) -> bool:
+        """Compare equality."""
+        if isinstance(other, IPNetwork):
+            return (self._version, self._network, self._broadcast) == (
+                other._version,
+                other._network,
+                other._broadcast,
+            )
+
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        """Hash the network."""
+        return hash((self._version, self._network, self._broadcast))
+
+    def __contains__(self, item: object) -> bool:
+        """
+        Tell whether an address, or another network, is part of this network.
+
+        Integers are compared as address values, addresses of the other
+        version are never contained.
+        """
+        if isinstance(item, int):
+            return self._network <= item <= self._broadcast
+
+        if isinstance(item, IPNetwork):
+            return self._version == item.version and self._network <= item.network <= item.broadcast <= self._broadcast
+
+        if isinstance(item, IPAddress):
+            # Compared by value, so lazy and generic addresses are contained too
+            return item.version == self._version and self._network <= item.num <= self._broadcast
+
+        return False
+
+    def __len__(self) -> int:
+        """
+        Return the number of addresses in the network.
+
+        Python limits lengths to sys.maxsize, use `num_addresses` for large IPv6 networks.
+        """
+        return self.num_addresses
+
+    def __getitem__(self, index: int) -> IPv4 | IPv6:
+        """Return the address at the index, counting from the network address."""
+        if not isinstance(index, int):
+            msg = f"Network indices must be integers, not '{index.__class__.__name__}'"
+            raise TypeError(msg)
+
+        size = self.num_addresses
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            msg = f"Index {index} out of range for a network of {size} addresses"
+            raise IndexError(msg)
+
+        return self._address_class.from_int(self._network + index)
+
+    def __iter__(self) -> Iterator[IPv4 | IPv6]:
+        """Iterate over every address in the network, creating each only when it's reached."""
+        from_int = self._address_class.from_int
+        for num in range(self._network, self._broadcast + 1):
+            yield from_int(num)
+
+    @property
+    def version(self) -> SubnetType:
+        """Return the version of the network."""
+        return self._version
+
+    @property
+    def subnet_mask(self) -> SubnetMask:
+        """Return the subnet mask, None as its prefix length for single-address networks."""
+        return self._submask
+
+    @property
+    def prefix_length(self) -> int:
+        """Return the number of bits in the network part."""
+        prefix_length = self._submask.prefix_length
+        return _BIT_COUNTS[self._version] if prefix_length is None else prefix_length
+
+    @property
+    def network(self) -> int:
+        """Return the value of the first address."""
+        return self._network
+
+    @property
+    def broadcast(self) -> int:
+        """Return the value of the last address."""
+        return self._broadcast
+
+    @property
+    def network_address(self) -> IPv4 | IPv6:
+        """Return the first address."""
+        return self._address_class.from_int(self._network)
+
+    @property
+    def broadcast_address(self) -> IPv4 | IPv6:
+        """Return the last address."""
+        return self._address_class.from_int(self._broadcast)
+
+    @property
+    def num_addresses(self) -> int:
+        """Return the number of addresses in the network."""
+        return self._broadcast - self._network + 1
+
+    def hosts(self) -> Iterator[IPv4 | IPv6]:
+        """
+        Iterate over the usable host addresses.
+
+        Like in the standard library, IPv4 networks leave out the network
+        and broadcast addresses and IPv6 networks the network address,
+        unless the network is too small to have any other addresses.
+        """
+        first, last = self._network, self._broadcast
+        if self.num_addresses > 2:  # noqa: PLR2004
+            first += 1
+            if self._version == SubnetType.IPV4:
+                last -= 1
+
+        from_int = self._address_class.from_int
+        for num in range(first, last + 1):
+            yield from_int(num)
+
+    @staticmethod
+    def _make_subnet_mask(subnet_mask: int | str | SubnetMask | None, version: SubnetType) -> SubnetMask:
+        if isinstance(subnet_mask, SubnetMask):
+            if subnet_mask.prefix_length is not None and subnet_mask.prefix_length >= _BIT_COUNTS[version]:
+                msg = f"Subnet '{subnet_mask}' not valid for {version}"
+                raise ValueError(msg)
+            return subnet_mask
+
+        if isinstance(subnet_mask, str) and subnet_mask.strip().isdigit():
+            subnet_mask = int(subnet_mask)
+
+        if subnet_mask == _BIT_COUNTS[version]:
+            # Written out, but not representable by SubnetMask
+            subnet_mask = None
+
+        return SubnetMask(subnet_mask, version)
@@ -0,0 +1,268 @@
+"""
+iplib3's functionality for parsing addresses on several cores.
+
+Files are split into chunks on line boundaries, and each chunk is parsed
+by the bulk parsers in a worker process. Workers hand their packed arrays
+back through shared memory rather than pickling them, so the main process
+only copies bytes into the result.
+
+The bulk parsers and validators can also use threads, which only run
+Python code in parallel on free-threaded builds of CPython.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from pathlib import Path
+from typing import TYPE_CHECKING, Literal, TypeVar, overload
+
+from iplib3.bulk import IPv4Batch, IPv6Batch, parse_ipv4_many, parse_ipv6_many
+from iplib3.constants.subnet import SubnetType
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+    from concurrent.futures import Future
+
+    Progress = Callable[[int, int], None]
+
+__all__ = ("parse_file_parallel", "threads_run_in_parallel")
+
+DEFAULT_CHUNK_BYTES = 16 << 20
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Chunks given to threads are at least this long, smaller ones cost more to hand over than they save
+_MIN_THREAD_CHUNK = 4096
+_THREAD_CHUNKS_PER_WORKER = 4
+
+# On Windows a shared memory block is freed as soon as no process has it open,
+# so workers keep their latest blocks open until the main process has read them
+_KEEP_BLOCKS_OPEN = sys.platform == "win32"
+_blocks_kept = 0
+_open_blocks: deque[SharedMemory] = deque()
+
+
+@overload
+def parse_file_parallel(
+    path: str | os.PathLike[str],
+    version: Literal[SubnetType.IPV4] = SubnetType.IPV4,
+    *,
+    workers: int | None = None,
+    chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+    progress: Progress | None = None,
+) -> IPv4Batch: ...
+
+
+@overload
+def parse_file_parallel(
+    path: str | os.PathLike[str],
+    version: Literal[SubnetType.IPV6],
+    *,
+    workers: int | None = None,
+    chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+    progress: Progress | None = None,
+) -> IPv6Batch: ...
+
+
+def parse_file_parallel(
+    path: str | os.PathLike[str],
+    version: SubnetType = SubnetType.IPV4,
+    *,
+    workers: int | None = None,
+    chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+    progress: Progress | None = None,
+) -> IPv4Batch | IPv6Batch:
+    """
+    Parse a file of addresses, one per line, on several processes.
+
+    The result is the same as that of `parse_ipv4_many` or `parse_ipv6_many`
+    on the lines of the file, in the same order. Only newlines end lines,
+    and a carriage return before one is removed. The file is split into
+    chunks of about `chunk_bytes`, which are parsed by `workers` processes
+    (by default one per CPU). If given, `progress` is called with the number
+    of bytes parsed so far and the size of the file after every chunk.
+    """
+    version = SubnetType(version)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1 or chunk_bytes < 1:
+        msg = f"workers and chunk_bytes must be positive, got {workers} and {chunk_bytes}"
+        raise ValueError(msg)
+
+    path = Path(path)
+    size = path.stat().st_size
+    batch = IPv4Batch(array("I"), array("i"), []) if version == SubnetType.IPV4 else _empty_ipv6_batch()
+    chunks = _chunk_bounds(path, size, chunk_bytes)
+
+    def report(end: int) -> None:
+        if progress is not None:
+            progress(end, size)
+
+    if workers == 1 or size <= chunk_bytes:
+        for start, end in chunks:
+            _extend(batch, _parse_lines(path, start, end, version))
+            report(end)
+        return batch
+
+    # Chunks are submitted as earlier ones are collected, which bounds the memory in use
+    window = 2 * workers
+    if not _KEEP_BLOCKS_OPEN:
+        # Started before the workers so they share it, and it sees the blocks they create being unlinked here
+        resource_tracker.ensure_running()
+    pending: deque[tuple[Future[tuple[str, int, list[int]]], int]] = deque()
+    with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(window,)) as executor:
+        try:
+            for start, end in chunks:
+                pending.append((executor.submit(_parse_chunk, path, start, end, version), end))
+                if len(pending) == window:
+                    future, done = pending.popleft()
+                    _collect(batch, *future.result())
+                    report(done)
+            while pending:
+                future, done = pending.popleft()
+                _collect(batch, *future.result())
+                report(done)
+        finally:
+            for future, _ in pending:
+                if not future.cancel() and future.exception() is None:
+                    _discard(future.result()[0])
+
+    return batch
+
+
+def _empty_ipv6_batch() -> IPv6Batch:
+    return IPv6Batch(array("Q"), array("Q"), array("i"), bytearray())
+
+
+def _columns(batch: IPv4Batch | IPv6Batch) -> list[array[int] | bytearray]:
+    """Return the packed columns of a batch, in the order they're stored in shared memory."""
+    if isinstance(batch, IPv4Batch):
+        return [batch.addresses, batch.ports]
+    return [batch.high, batch.low, batch.ports, batch.valid]
+
+
+def _chunk_bounds(path: Path, size: int, chunk_bytes: int) -> Iterator[tuple[int, int]]:
+    """Split a file into (start, end) byte ranges of about chunk_bytes, ending on line boundaries."""
+    with path.open("rb") as file:
+        start = 0
+        while start < size:
+            end = start + chunk_bytes
+            if end < size:
+                file.seek(end - 1)
+                file.readline()
+                end = file.tell()
+            end = min(end, size)
+            yield start, end
+            start = end
+
+
+def _parse_lines(path: Path, start: int, end: int, version: SubnetType) -> IPv4Batch | IPv6Batch:
+    with path.open("rb") as file:
+        file.seek(start)
+        text = file.read(end - start).decode(errors="replace")
+
+    # Only "\n" ends a line, str.splitlines would also split on characters such as "\x0c" and "\u2028"
+    lines = [line.removesuffix("\r") for line in text.removesuffix("\n").split("\n")] if text else []
+    return parse_ipv4_many(lines) if version == SubnetType.IPV4 else parse_ipv6_many(lines)
+
+
+def _extend(batch: IPv4Batch | IPv6Batch, chunk: IPv4Batch | IPv6Batch) -> None:
+    """Append a batch parsed from a chunk to the result, offsetting the invalid indices."""
+    if isinstance(batch, IPv4Batch) and isinstance(chunk, IPv4Batch):
+        batch.invalid.extend(idx + len(batch.addresses) for idx in chunk.invalid)
+    for column, values in zip(_columns(batch), _columns(chunk), strict=True):
+        column.extend(values)
+
+
+def _init_worker(window: int) -> None:
+    global _blocks_kept  # noqa: PLW0603
+    _blocks_kept = window if _KEEP_BLOCKS_OPEN else 0
+
+
+def _parse_chunk(path: Path, start: int, end: int, version: SubnetType) -> tuple[str, int, list[int]]:
+    """
+    Parse a chunk of the file in a worker process.
+
+    The columns are copied back to back into a new shared memory block,
+    and its name is returned along with the number of lines and the
+    indices of the invalid ones for IPv4.
+    """
+    batch = _parse_lines(path, start, end, version)
+    columns = _columns(batch)
+    block = SharedMemory(create=True, size=max(1, sum(memoryview(column).nbytes for column in columns)))
+
+    offset = 0
+    for column in columns:
+        with memoryview(column).cast("B") as data:
+            block.buf[offset : offset + len(data)] = data  # type: ignore[index]
+            offset += len(data)
+
+    # The main process reads each block before submitting `window` more chunks,
+    # so every block older than this worker's latest `window` ones has been read
+    _open_blocks.append(block)
+    while len(_open_blocks) > _blocks_kept:
+        _open_blocks.popleft().close()
+
+    return block.name, len(batch.ports), batch.invalid if isinstance(batch, IPv4Batch) else []
+
+
+def _collect(batch: IPv4Batch | IPv6Batch, name: str, count: int, invalid: list[int]) -> None:
+    """Append the columns a worker left in shared memory to the result, and free the block."""
+    if isinstance(batch, IPv4Batch):
+        batch.invalid.extend(idx + len(batch.addresses) for idx in invalid)
+
+    block = SharedMemory(name)
+    try:
+        offset = 0
+        for column in _columns(batch):
+            size = count * (column.itemsize if isinstance(column, array) else 1)
+            with block.buf[offset : offset + size] as data:  # type: ignore[index]
+                if isinstance(column, bytearray):
+                    column.extend(data)
+                else:
+                    column.frombytes(data)
+            offset += size
+    finally:
+        _free(block)
+
+
+def _discard(name: str) -> None:
+    _free(SharedMemory(name))
+
+
+def _free(block: SharedMemory) -> None:
+    block.close()
+    if not _KEEP_BLOCKS_OPEN:
+        block.unlink()
+
+
+def threads_run_in_parallel() -> bool:
+    """Tell whether threads can run Python code in parallel, which needs a free-threaded build with the GIL disabled."""
+    is_gil_enabled: Callable[[], bool] | None = getattr(sys, "_is_gil_enabled", None)
+    return is_gil_enabled is not None and not is_gil_enabled()
+
+
+def _map_threaded(function: Callable[[Iterable[T]], R], items: Iterable[T], workers: int) -> list[R]:
+    """
+    Apply a function to chunks of the items on a thread pool, returning the results in order.
+
+    With the GIL enabled threads would only take turns, so the function
+    is applied to all items at once in the calling thread instead.
+    """
+    if workers <= 1 or not threads_run_in_parallel():
+        return [function(items)]
+
+    items = list(items)
+    size = max(_MIN_THREAD_CHUNK, -(-len(items) // (workers * _THREAD_CHUNKS_PER_WORKER)))
+    if len(items) <= size:
+        return [function(items)]
+
+    with ThreadPoolExecutor(workers) as executor:
+        return list(executor.map(function, (items[idx : idx + size] for idx in range(0, len(items), size))))
@@ -0,0 +1,314 @@
+"""iplib3's functionality for sets of address ranges."""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from typing import TYPE_CHECKING
+
+from iplib3.address import IPAddress, IPv4, IPv6
+from iplib3.constants.subnet import SubnetType
+from iplib3.network import _BIT_COUNTS, IPNetwork
+from iplib3.subnet import SubnetMask
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from typing import TypeAlias
+
+    AddressRange: TypeAlias = int | str | IPAddress | IPNetwork | tuple[int | str | IPAddress, int | str | IPAddress]
+
+__all__ = ("AddressRangeSet", "collapse_sorted")
+
+
+class AddressRangeSet:
+    """
+    Set of addresses of a single version, stored as sorted, disjoint ranges.
+
+    Addresses, networks and (first, last) ranges are merged with their
+    neighbours as they're added, so the set always holds the fewest
+    possible ranges no matter how many addresses went in.
+    Set operations walk both sets once, in linear time.
+    """
+
+    __slots__ = ("_ends", "_starts", "_version")
+
+    def __init__(self, ranges: Iterable[AddressRange] = (), version: SubnetType = SubnetType.IPV4) -> None:
+        """Create AddressRangeSet from addresses, networks or (first, last) ranges."""
+        self._version = SubnetType(version)
+        self._starts: list[int] = []
+        self._ends: list[int] = []
+
+        for item in ranges:
+            self.add(item)
+
+    @classmethod
+    def from_sorted(cls, ranges: Iterable[AddressRange], version: SubnetType = SubnetType.IPV4) -> AddressRangeSet:
+        """Create AddressRangeSet in linear time from ranges sorted by their first address."""
+        version = SubnetType(version)
+        return cls._build(_merge_sorted(_interval(item, version) for item in ranges), version)
+
+    def __len__(self) -> int:
+        """Return the number of disjoint ranges."""
+        return len(self._starts)
+
+    def __iter__(self) -> Iterator[tuple[int, int]]:
+        """Iterate over the (first, last) address values of the ranges, in order."""
+        return zip(self._starts, self._ends, strict=True)
+
+    def __contains__(self, item: object) -> bool:
+        """Tell whether an address, network or (first, last) range is entirely part of the set."""
+        try:
+            start, end = self._interval(item)  # type: ignore[arg-type]
+        except (TypeError, ValueError):
+            return False
+
+        idx = bisect_right(self._starts, start) - 1
+        return idx >= 0 and end <= self._ends[idx]
+
+    def __eq__(self, other: object) -> bool:
+        """Compare equality."""
+        if isinstance(other, AddressRangeSet):
+            return self._version == other.version and list(self) == list(other)
+
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        """Str representation."""
+        return f"iplib3.{self.__class__.__name__}(<{len(self)} ranges>, version='{self._version}')"
+
+    @property
+    def version(self) -> SubnetType:
+        """Return the version of the addresses in the set."""
+        return self._version
+
+    @property
+    def num_addresses(self) -> int:
+        """Return the number of addresses in the set."""
+        return sum(self._ends) - sum(self._starts) + len(self._starts)
+
+    def add(self, item: AddressRange) -> None:
+        """Add an address, network or (first, last) range, merging it with overlapping and adjacent ranges."""
+        start, end = self._interval(item)
+
+        # Ranges that end right before the new one starts, or start right after it ends, are merged too
+        lo = bisect_left(self._ends, start - 1)
+        hi = bisect_right(self._starts, end + 1)
+
+        if lo < hi:
+            start = min(start, self._starts[lo])
+            end = max(end, self._ends[hi - 1])
+
+        self._starts[lo:hi] = [start]
+        self._ends[lo:hi] = [end]
+
+    def discard(self, item: AddressRange) -> None:
+        """Remove an address, network or (first, last) range, splitting ranges if needed."""
+        start, end = self._interval(item)
+
+        lo = bisect_left(self._ends, start)
+        hi = bisect_right(self._starts, end)
+        if lo >= hi:
+            return
+
+        starts, ends = [], []
+        if self._starts[lo] < start:
+            starts.append(self._starts[lo])
+            ends.append(start - 1)
+        if self._ends[hi - 1] > end:
+            starts.append(end + 1)
+            ends.append(self._ends[hi - 1])
+
+        self._starts[lo:hi] = starts
+        self._ends[lo:hi] = ends
+
+    def union(self, other: AddressRangeSet) -> AddressRangeSet:
+        """Return the addresses found in either set."""
+        self._check_compatible(other)
+        return self._build(_merge_sorted(_merge_by_start(list(self), list(other))), self._version)
+
+    def intersection(self, other: AddressRangeSet) -> AddressRangeSet:
+        """Return the addresses found in both sets."""
+        self._check_compatible(other)
+        intervals = []
+        ours, theirs = list(self), list(other)
+        idx = jdx = 0
+
+        while idx < len(ours) and jdx < len(theirs):
+            start = max(ours[idx][0], theirs[jdx][0])
+            end = min(ours[idx][1], theirs[jdx][1])
+            if start <= end:
+                intervals.append((start, end))
+
+            # Whichever range ends first can't overlap anything else
+            if ours[idx][1] < theirs[jdx][1]:
+                idx += 1
+            else:
+                jdx += 1
+
+        return self._build(intervals, self._version)
+
+    def difference(self, other: AddressRangeSet) -> AddressRangeSet:
+        """Return the addresses found only in this set."""
+        self._check_compatible(other)
+        intervals = []
+        theirs = list(other)
+        jdx = 0
+
+        for first, end in self:
+            start = first
+            # Skip the ranges that end before this one starts
+            while jdx < len(theirs) and theirs[jdx][1] < start:
+                jdx += 1
+
+            while jdx < len(theirs) and theirs[jdx][0] <= end:
+                if theirs[jdx][0] > start:
+                    intervals.append((start, theirs[jdx][0] - 1))
+                start = theirs[jdx][1] + 1
+                if theirs[jdx][1] > end:
+                    break
+                jdx += 1
+
+            if start <= end:
+                intervals.append((start, end))
+
+        return self._build(intervals, self._version)
+
+    __or__ = union
+    __and__ = intersection
+    __sub__ = difference
+
+    def to_cidrs(self) -> Iterator[tuple[IPv4 | IPv6, SubnetMask]]:
+        """
+        Iterate over the smallest set of CIDR blocks covering the set, as (network address, SubnetMask) pairs.
+
+        Single addresses have a subnet mask with a prefix length of None.
+        """
+        for start, end in self:
+            yield from _cidrs(start, end, self._version)
+
+    @classmethod
+    def _build(cls, intervals: Iterable[tuple[int, int]], version: SubnetType) -> AddressRangeSet:
+        """Create AddressRangeSet from intervals that are already sorted and merged."""
+        self = cls(version=version)
+        for start, end in intervals:
+            self._starts.append(start)
+            self._ends.append(end)
+        return self
+
+    def _check_compatible(self, other: AddressRangeSet) -> None:
+        if not isinstance(other, AddressRangeSet):
+            msg = f"Expected an AddressRangeSet, got '{other.__class__.__name__}'"
+            raise TypeError(msg)
+        if self._version != other.version:
+            msg = f"Cannot combine {self._version} and {other.version} addresses"
+            raise ValueError(msg)
+
+    def _interval(self, item: AddressRange) -> tuple[int, int]:
+        return _interval(item, self._version)
+
+
+def collapse_sorted(
+    ranges: Iterable[AddressRange], version: SubnetType = SubnetType.IPV4
+) -> Iterator[tuple[IPv4 | IPv6, SubnetMask]]:
+    """
+    Collapse addresses, networks or (first, last) ranges sorted by their first address into CIDR blocks.
+
+    Works on streams of any length in constant memory, as only the range
+    being built is kept around. Raises ValueError if the input isn't sorted.
+    """
+    version = SubnetType(version)
+    for start, end in _merge_sorted(_interval(item, version) for item in ranges):
+        yield from _cidrs(start, end, version)
+
+
+def _merge_sorted(intervals: Iterable[tuple[int, int]]) -> Iterator[tuple[int, int]]:
+    """Merge overlapping and adjacent intervals, which must be sorted by their start."""
+    current: tuple[int, int] | None = None
+
+    for start, end in intervals:
+        if current is None:
+            current = start, end
+        elif start < current[0]:
+            msg = f"Ranges must be sorted, {start} came after {current[0]}"
+            raise ValueError(msg)
+        elif start <= current[1] + 1:
+            current = current[0], max(current[1], end)
+        else:
+            yield current
+            current = start, end
+
+    if current is not None:
+        yield current
+
+
+def _merge_by_start(first: list[tuple[int, int]], second: list[tuple[int, int]]) -> Iterator[tuple[int, int]]:
+    """Interleave two lists of intervals sorted by their start."""
+    idx = jdx = 0
+    while idx < len(first) and jdx < len(second):
+        if first[idx] <= second[jdx]:
+            yield first[idx]
+            idx += 1
+        else:
+            yield second[jdx]
+            jdx += 1
+
+    yield from first[idx:]
+    yield from second[jdx:]
+
+
+def _cidrs(start: int, end: int, version: SubnetType) -> Iterator[tuple[IPv4 | IPv6, SubnetMask]]:
+    """Split an interval into the fewest CIDR blocks, largest possible first."""
+    bits = _BIT_COUNTS[version]
+    address_class = IPv4 if version == SubnetType.IPV4 else IPv6
+
+    while start <= end:
+        # The block can't be larger than the alignment of its start, nor than what's left
+        alignment = (start & -start).bit_length() - 1 if start else bits
+        host_bits = min(alignment, (end - start + 1).bit_length() - 1)
+        prefix_length = bits - host_bits
+
+        yield (
+            address_class.from_int(start),
+            SubnetMask(None if prefix_length == bits else prefix_length, version),
+        )
+        start += 1 << host_bits
+
+
+def _interval(item: AddressRange, version: SubnetType) -> tuple[int, int]:
+    """Turn an address, network or (first, last) range into a pair of address values."""
+    if isinstance(item, tuple):
+        if len(item) != 2:  # noqa: PLR2004
+            msg = f"Ranges must be (first, last) pairs, got {len(item)} items"
+            raise ValueError(msg)
+        start, _ = _interval(item[0], version)
+        _, end = _interval(item[1], version)
+        if start > end:
+            msg = f"Range start {start} is after its end {end}"
+            raise ValueError(msg)
+        return start, end
+
+    if isinstance(item, str):
+        item = IPNetwork(item, strict=False) if "/" in item else IPAddress(item)  # type: ignore[arg-type]
+
+    if isinstance(item, IPNetwork):
+        if item.version != version:
+            msg = f"Cannot add {item.version} network '{item}' to a set of {version} addresses"
+            raise ValueError(msg)
+        return item.network, item.broadcast
+
+    if isinstance(item, IPAddress):
+        if item.version != version:
+            msg = f"Cannot add {item.version} address '{item}' to a set of {version} addresses"
+            raise ValueError(msg)
+        num = item.num
+        return num, num
+
+    if isinstance(item, int):
+        if not 0 <= item < 1 << _BIT_COUNTS[version]:
+            msg = f"Address value {item} not in valid {version} range"
+            raise ValueError(msg)
+        return item, item
+
+    msg = f"Invalid type for address range: '{item.__class__.__name__}'"
+    raise TypeError(msg)
@@ -0,0 +1,131 @@
+"""iplib3's functionality for finding addresses in text."""
+
+from __future__ import annotations
+
+import os
+import re
+from typing import IO, TYPE_CHECKING, NamedTuple
+
+from iplib3.bulk import NO_PORT, _parse_ipv4, _parse_ipv6
+from iplib3.constants.subnet import SubnetType
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+__all__ = ("ScanMatch", "scan")
+
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+# No match is longer than this ('[' + 39 characters + ']:' + 5 digits),
+# so anything further away from the end of a chunk is already final.
+_MATCH_MARGIN = 64
+# Characters kept in front of the carried-over text for the lookbehind
+_CONTEXT_LENGTH = 1
+
+_PATTERN = (
+    r"(?<![\w.:])"
+    r"(?:"
+    r"\[(?P<ipv6_bracketed>[0-9A-Fa-f:]{2,39})\](?::(?P<ipv6_port>\d{1,5}))?"
+    r"|(?P<ipv4>(?:\d{1,3}\.){3}\d{1,3})(?::(?P<ipv4_port>\d{1,5}))?"
+    r"|(?P<ipv6>[0-9A-Fa-f]{0,4}(?::[0-9A-Fa-f]{0,4}){2,8})"
+    r")"
+    r"(?![\w:]|\.\d)"
+)
+_TEXT_PATTERN = re.compile(_PATTERN, re.ASCII)
+_BYTES_PATTERN = re.compile(_PATTERN.encode("ascii"))
+
+
+class ScanMatch(NamedTuple):
+    """An address found by `scan`."""
+
+    offset: int
+    num: int
+    port: int | None
+    version: SubnetType
+
+
+def scan(
+    source: str | os.PathLike[str] | IO[bytes] | IO[str],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[ScanMatch]:
+    """
+    Find every IPv4 and IPv6 address, with or without a port, in a file or stream.
+
+    Strings and path-like objects are treated as file paths, other
+    sources must have a `read` method returning either bytes or text.
+    Offsets count bytes for binary sources and characters for text.
+
+    The source is read in fixed-size chunks, so memory use stays
+    constant regardless of its size. Candidates are accepted by the
+    same rules as the strict validators, and addresses that merely
+    look like one (eg. '999.1.1.1' or '12:34:56') are skipped.
+    """
+    if chunk_size < 1:
+        msg = f"Chunk size must be positive, not '{chunk_size}'"
+        raise ValueError(msg)
+
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as file:  # noqa: PTH123
+            yield from _scan_stream(file, chunk_size)
+    else:
+        yield from _scan_stream(source, chunk_size)
+
+
+def _scan_stream(stream: IO[bytes] | IO[str], chunk_size: int) -> Iterator[ScanMatch]:
+    buffer = stream.read(chunk_size)
+    pattern: re.Pattern[str] | re.Pattern[bytes] = _TEXT_PATTERN if isinstance(buffer, str) else _BYTES_PATTERN
+
+    base_offset = 0  # Offset of the start of the buffer in the source
+    position = 0  # Where in the buffer to continue searching
+
+    while True:
+        chunk = stream.read(chunk_size)
+        at_end = not chunk
+        safe_end = len(buffer) if at_end else len(buffer) - _MATCH_MARGIN
+        cut = max(safe_end, position)
+
+        for match in pattern.finditer(buffer, position):  # type: ignore[arg-type]
+            if match.end() > safe_end:
+                # Might continue in the next chunk, search again once it's there. A longer candidate
+                # could also start before this match (eg. the '[' of a bracketed address cut off by
+                # the end of the buffer), but not before safe_end, as no match is longer than the margin.
+                cut = min(match.start(), cut)
+                break
+
+            result = _match_to_address(match, base_offset)
+            if result is not None:
+                yield result
+
+        if at_end:
+            return
+
+        keep_from = max(cut - _CONTEXT_LENGTH, 0)
+        buffer = buffer[keep_from:] + chunk  # type: ignore[operator]
+        base_offset += keep_from
+        position = cut - keep_from
+
+
+def _match_to_address(match: re.Match[str] | re.Match[bytes], base_offset: int) -> ScanMatch | None:
+    """Validate a candidate match, returning None if it isn't an address after all."""
+    groups = {
+        name: value.decode("ascii") if isinstance(value, bytes) else value
+        for name, value in match.groupdict().items()
+        if value is not None
+    }
+    offset = base_offset + match.start()
+
+    if "ipv4" in groups:
+        address, port, version, parse = groups["ipv4"], groups.get("ipv4_port"), SubnetType.IPV4, _parse_ipv4
+        with_port = f"{address}:{port}"
+    else:
+        address = groups.get("ipv6_bracketed") or groups["ipv6"]
+        port, version, parse = groups.get("ipv6_port"), SubnetType.IPV6, _parse_ipv6
+        with_port = f"[{address}]:{port}"
+
+    # Numbers that aren't valid ports aren't treated as part of the address
+    parsed = (port is not None and parse(with_port)) or parse(address)
+    if not parsed:
+        return None
+
+    num, port_num = parsed
+    return ScanMatch(offset, num, None if port_num == NO_PORT else port_num, version)
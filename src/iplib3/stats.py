@@ -0,0 +1,137 @@
+"""
+iplib3's optional instrumentation of its hot paths.
+
+Set the IPLIB3_STATS environment variable to a true value, such as 1,
+before importing iplib3 to count the calls to address parsing and
+formatting, the validators and subnet mask construction, along with
+the time spent in them. Without it nothing is wrapped, so the
+instrumentation costs nothing.
+
+Counters are cumulative, so rates come from the difference between two
+snapshots taken some time apart. Address caches keep their own hit and
+miss counters, see AddressCache.cache_info.
+"""
+
+from __future__ import annotations
+
+import os
+from _thread import allocate_lock
+from collections.abc import Callable
+from functools import wraps
+from time import perf_counter
+from typing import NamedTuple, ParamSpec, TypeVar
+
+__all__ = ("CallStats", "add_hook", "remove_hook", "reset", "snapshot")
+
+ENV_VAR = "IPLIB3_STATS"
+FALSE_VALUES = frozenset(("", "0", "false", "no", "off"))
+
+ENABLED = os.environ.get(ENV_VAR, "").strip().lower() not in FALSE_VALUES
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+Hook = Callable[[str, float, bool], None]
+
+# Calls, failures and seconds, by name
+_counters: dict[str, list[float]] = {}
+_hooks: list[Hook] = []
+# Keeps the counters of calls from several threads consistent, from _thread as threading is slow to import
+_lock = allocate_lock()
+
+
+class CallStats(NamedTuple):
+    """
+    Snapshot of the counters of an instrumented function.
+
+    Failures are calls that raised an exception or, like a failed
+    validation, returned False. Calls to `try_parse` returning an
+    error code are failures too.
+    """
+
+    calls: int
+    failures: int
+    seconds: float
+
+
+def _returned_false(result: object) -> bool:
+    return result is False
+
+
+def instrumented(function: Callable[P, R], *, is_failure: Callable[[R], bool] = _returned_false) -> Callable[P, R]:
+    """
+    Count the calls to a function and the time spent in it, if instrumentation is enabled.
+
+    Calls raising an exception, or whose result `is_failure` accepts,
+    are counted as failures. Without instrumentation the function is
+    returned as is.
+    """
+    if not ENABLED:
+        return function
+
+    name = function.__qualname__
+    counter = _counters.setdefault(name, [0, 0, 0.0])
+
+    @wraps(function)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        failed = True
+        start = perf_counter()
+        try:
+            result = function(*args, **kwargs)
+            failed = is_failure(result)
+            return result
+        finally:
+            elapsed = perf_counter() - start
+            with _lock:
+                counter[0] += 1
+                counter[1] += failed
+                counter[2] += elapsed
+            for hook in _hooks:
+                hook(name, elapsed, failed)
+
+    return wrapper
+
+
+def instrumented_with(is_failure: Callable[[R], bool]) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """Return a decorator instrumenting a function, counting the results `is_failure` accepts as failures."""
+
+    def decorator(function: Callable[P, R]) -> Callable[P, R]:
+        return instrumented(function, is_failure=is_failure)
+
+    return decorator
+
+
+def snapshot() -> dict[str, CallStats]:
+    """Return the current counters of the instrumented functions, empty if instrumentation is disabled."""
+    with _lock:
+        return {
+            name: CallStats(calls=int(calls), failures=int(failures), seconds=seconds)
+            for name, (calls, failures, seconds) in _counters.items()
+        }
+
+
+def reset() -> None:
+    """Set all counters back to zero."""
+    with _lock:
+        for counter in _counters.values():
+            counter[:] = [0, 0, 0.0]
+
+
+def add_hook(hook: Hook) -> None:
+    """
+    Call a function after every instrumented call.
+
+    The hook gets the name of the instrumented function, the seconds
+    the call took and whether it failed. Hooks are only called if
+    instrumentation is enabled.
+    """
+    _hooks.append(hook)
+
+
+def remove_hook(hook: Hook) -> None:
+    """Stop calling a hook added with add_hook."""
+    try:
+        _hooks.remove(hook)
+    except ValueError:
+        msg = f"Hook '{hook!r}' isn't registered"
+        raise ValueError(msg) from None
@@ -0,0 +1,118 @@
+"""iplib3's functionality for reading addresses from asyncio streams."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, NamedTuple
+
+from iplib3.address import IPAddress
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable
+    from concurrent.futures import Executor
+
+    from iplib3.address import IPv4, IPv6
+
+__all__ = ("InvalidLine", "aiter_addresses")
+
+DEFAULT_CHUNK_SIZE = 1 << 16
+DEFAULT_BATCH_SIZE = 1024
+DEFAULT_OFFLOAD_THRESHOLD = 256
+DEFAULT_MAX_LINE_LENGTH = 1 << 16  # The same as asyncio.StreamReader's default limit
+
+
+class InvalidLine(NamedTuple):
+    """A line `aiter_addresses` couldn't parse, numbered from 1."""
+
+    line_number: int
+    text: str
+    message: str
+
+
+async def aiter_addresses(
+    reader: asyncio.StreamReader,
+    *,
+    on_invalid: Callable[[InvalidLine], object] | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    executor: Executor | None = None,
+    offload_threshold: int = DEFAULT_OFFLOAD_THRESHOLD,
+    max_line_length: int = DEFAULT_MAX_LINE_LENGTH,
+) -> AsyncIterator[IPv4 | IPv6]:
+    """
+    Parse addresses from a stream, one per line, without blocking the event loop.
+
+    The stream is read in chunks of `chunk_size` bytes, and the complete
+    lines in it are parsed in batches of up to `batch_size` lines, giving
+    other tasks a turn between batches. Each line is parsed like
+    `IPAddress(line)` would, empty lines are skipped.
+
+    Invalid lines don't raise an exception. They're passed to `on_invalid`,
+    if given, before the addresses of their batch are yielded. If an
+    executor is given, batches of at least `offload_threshold` lines are
+    parsed in it rather than in the event loop.
+
+    Lines longer than `max_line_length` bytes are reported as invalid with
+    their start as the text. Only that much of a line is kept while waiting
+    for its end, so a stream without newlines doesn't fill up memory.
+    """
+    loop = asyncio.get_running_loop()
+    line_number = 1
+    partial_line = b""
+
+    while True:
+        data = await reader.read(chunk_size)
+        if data:
+            lines = (partial_line + data).split(b"\n")
+            # Two bytes more than allowed tell a line that's too long even if one is a carriage return
+            partial_line = lines.pop()[: max_line_length + 2]
+        else:
+            lines = [partial_line] if partial_line else []
+
+        for start in range(0, len(lines), batch_size):
+            batch = lines[start : start + batch_size]
+            if executor is not None and len(batch) >= offload_threshold:
+                addresses, invalid = await loop.run_in_executor(
+                    executor, _parse_batch, batch, line_number, max_line_length
+                )
+            else:
+                addresses, invalid = _parse_batch(batch, line_number, max_line_length)
+            line_number += len(batch)
+
+            if on_invalid is not None:
+                for line in invalid:
+                    on_invalid(line)
+            for address in addresses:
+                yield address
+
+            # Reading doesn't suspend while the stream has data buffered
+            await asyncio.sleep(0)
+
+        if not data:
+            return
+
+
+def _parse_batch(
+    lines: list[bytes], first_line_number: int, max_line_length: int
+) -> tuple[list[IPv4 | IPv6], list[InvalidLine]]:
+    """Parse a batch of lines, returning the addresses and the invalid lines."""
+    addresses: list[IPv4 | IPv6] = []
+    invalid = []
+
+    # Decoding errors can't introduce line breaks, so the lines stay lined up
+    texts = b"\n".join(lines).decode(errors="replace").split("\n")
+    for line_number, (raw_line, text) in enumerate(zip(lines, texts, strict=True), start=first_line_number):
+        line = text.removesuffix("\r")
+        if len(raw_line.removesuffix(b"\r")) > max_line_length:
+            message = f"Line is longer than {max_line_length} bytes"
+            invalid.append(InvalidLine(line_number, line[:max_line_length], message))
+            continue
+        if not line:
+            continue
+
+        try:
+            addresses.append(IPAddress(line))  # type: ignore[arg-type]
+        except ValueError as err:
+            invalid.append(InvalidLine(line_number, line, str(err)))
+
+    return addresses, invalid
@@ -2,19 +2,20 @@
 
 from __future__ import annotations
 
-from typing import overload
+from typing import ClassVar, Self, overload
 
-from iplib3.constants.ipv4 import (
-    IPV4_MIN_SEGMENT_COUNT,
-    IPV4_SEGMENT_BIT_COUNT,
-)
+from iplib3.constants.ipv4 import IPV4_MIN_SEGMENT_COUNT
 from iplib3.constants.subnet import (
     IPV4_MAX_SUBNET_VALUE,
     IPV4_MIN_SUBNET_VALUE,
+    IPV4_PREFIX_LENGTHS_BY_MASK,
+    IPV4_PREFIX_LENGTHS_BY_STRING,
+    IPV4_SUBNET_MASK_STRINGS,
     IPV6_MAX_SUBNET_VALUE,
     IPV6_MIN_SUBNET_VALUE,
     SubnetType,
 )
+from iplib3.stats import instrumented
 
 
 class PureSubnetMask:
@@ -67,33 +68,81 @@ def prefix_length(self: PureSubnetMask) -> int | None:
 
 
 class SubnetMask(PureSubnetMask):
-    """Subnet mask for defining subnets."""
+    """
+    Subnet mask for defining subnets.
+
+    Subnet masks are immutable, so there is only ever one instance per
+    prefix length and subnet type. Once created, it's found again with
+    a single dictionary lookup from any of its common spellings.
+    """
 
     __slots__ = ("_subnet_type",)
 
-    def __init__(
-        self: SubnetMask, subnet_mask: int | str | None = None, subnet_type: SubnetType = SubnetType.IPV6
-    ) -> None:
-        """Create SubnetMask."""
+    _subnet_type: SubnetType
+    # Keyed by (class, argument type, argument, subnet type), the argument type keeps eg. 24.0 from matching 24
+    _instances: ClassVar[dict[tuple[type[SubnetMask], type, object, str], SubnetMask]] = {}
+
+    @instrumented
+    def __new__(cls, subnet_mask: int | str | None = None, subnet_type: SubnetType = SubnetType.IPV6) -> Self:
+        """Return the shared SubnetMask for the given subnet mask and subnet type."""
+        try:
+            return cls._instances[cls, subnet_mask.__class__, subnet_mask, subnet_type]  # type: ignore[return-value]
+        except (KeyError, TypeError):
+            pass
+
         subnet_type = SubnetType(subnet_type)
-        super().__init__()
 
         if isinstance(subnet_mask, str) and "." in subnet_mask:
             # Only subnets for IPv4 use strings
             subnet_type = SubnetType.IPV4
 
-        self._prefix_length: int | None = self._subnet_to_num(subnet_mask, subnet_type)
-        self._subnet_type = subnet_type
+        prefix_length = cls._subnet_to_num(subnet_mask, subnet_type)
+
+        key = (cls, prefix_length.__class__, prefix_length, subnet_type)
+        instance = cls._instances.get(key)
+        if instance is None:
+            new_instance = super().__new__(cls)
+            new_instance._prefix_length = prefix_length
+            new_instance._subnet_type = subnet_type
+            # setdefault is atomic, so threads racing to create the same mask all get the first one
+            instance = cls._instances.setdefault(key, new_instance)
+            if instance is new_instance:
+                for alias, alias_type in cls._aliases(prefix_length, subnet_type):
+                    cls._instances[cls, alias.__class__, alias, alias_type] = instance
+
+        return instance  # type: ignore[return-value]
+
+    def __init__(
+        self: SubnetMask, subnet_mask: int | str | None = None, subnet_type: SubnetType = SubnetType.IPV6
+    ) -> None:
+        """Create SubnetMask, the work is done once by `__new__`."""
+
+    def __reduce__(self: SubnetMask) -> tuple[type[SubnetMask], tuple[int | None, SubnetType]]:
+        """Pickle the prefix length and subnet type, so unpickling and copying return the shared instance."""
+        return self.__class__, (self._prefix_length, self._subnet_type)
 
     def __repr__(self: SubnetMask) -> str:
         """Str representation."""
         if self._subnet_type == SubnetType.IPV4 and self._prefix_length is not None:
-            return (
-                f"iplib3.{self.__class__.__name__}"
-                f"('{self._prefix_to_subnet_mask(self._prefix_length, self._subnet_type)}')"
-            )
+            return f"iplib3.{self.__class__.__name__}('{IPV4_SUBNET_MASK_STRINGS[self._prefix_length]}')"
         return super().__repr__()
 
+    @staticmethod
+    def _aliases(prefix_length: int | None, subnet_type: SubnetType) -> list[tuple[int | str | None, SubnetType]]:
+        """List the arguments that always create the subnet mask, for the instance cache."""
+        if prefix_length is None:
+            return [(None, subnet_type)]
+
+        aliases: list[tuple[int | str | None, SubnetType]] = [
+            (prefix_length, subnet_type),
+            (str(prefix_length), subnet_type),
+        ]
+        if subnet_type == SubnetType.IPV4:
+            # Dotted strings are IPv4 whatever the subnet type argument
+            mask_string = IPV4_SUBNET_MASK_STRINGS[prefix_length]
+            aliases.extend((mask_string, alias_type) for alias_type in SubnetType)
+        return aliases
+
     @overload
     @staticmethod
     def _subnet_to_num(subnet_mask: None, subnet_type: SubnetType) -> None: ...
@@ -135,7 +184,10 @@ def _subnet_to_num(subnet_mask: int | str | None, subnet_type: SubnetType = Subn
     @staticmethod
     def _ipv4_subnet_to_num(subnet_mask: int | str) -> int:
         if isinstance(subnet_mask, str):
-            if "." in subnet_mask:
+            if subnet_mask in IPV4_PREFIX_LENGTHS_BY_STRING:
+                subnet_mask = IPV4_PREFIX_LENGTHS_BY_STRING[subnet_mask]
+
+            elif "." in subnet_mask:
                 segments = tuple(int(s) for s in reversed(subnet_mask.split(".")))
                 if len(segments) != IPV4_MIN_SEGMENT_COUNT:
                     msg = f"Subnet value not valid; '{subnet_mask}' is not a valid string representation"
@@ -144,13 +196,11 @@ def _ipv4_subnet_to_num(subnet_mask: int | str) -> int:
                     )
 
                 segment_sum = sum(s << (8 * idx) for idx, s in enumerate(segments))
-                subnet_bits = f"{segment_sum:b}".rstrip("0")
-
-                if "0" in subnet_bits:
+                if segment_sum not in IPV4_PREFIX_LENGTHS_BY_MASK:
                     msg = f"'{subnet_mask}' is an invalid subnet mask"
                     raise ValueError(msg)
 
-                subnet_mask = len(subnet_bits)
+                subnet_mask = IPV4_PREFIX_LENGTHS_BY_MASK[segment_sum]
 
             try:
                 subnet_mask = int(subnet_mask)
@@ -180,9 +230,4 @@ def _prefix_to_subnet_mask(prefix_length: int, subnet_type: SubnetType) -> str:
             msg = f"Invalid subnet value for IPv4: '{prefix_length}'"
             raise ValueError(msg)
 
-        segments = [0, 0, 0, 0]
-
-        for idx, _ in enumerate(segments):
-            segments[idx] = 2 ** max(min(IPV4_SEGMENT_BIT_COUNT, prefix_length), 0) - 1
-            prefix_length -= IPV4_SEGMENT_BIT_COUNT
-        return ".".join(map(str, segments))
+        return IPV4_SUBNET_MASK_STRINGS[prefix_length]
@@ -0,0 +1,454 @@
+"""iplib3's functionality for longest-prefix matching."""
+
+from __future__ import annotations
+
+from array import array
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+from iplib3.address import IPAddress, IPv4, IPv6
+from iplib3.arrays import IPAddressArray
+from iplib3.constants.subnet import SubnetType
+from iplib3.network import _BIT_COUNTS, IPNetwork
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from typing import TypeAlias
+
+    import numpy as np
+    import numpy.typing as npt
+
+    from iplib3.subnet import SubnetMask
+
+    Prefix: TypeAlias = IPNetwork | str | tuple[str | IPAddress, int | str | SubnetMask | None]
+
+__all__ = ("CompiledPrefixTable", "PrefixTable")
+
+NO_MATCH = -1  # Value index returned when no prefix matches
+
+_HALF_BIT_COUNT = 64
+_HALF_MASK = (1 << _HALF_BIT_COUNT) - 1
+_IPV6_DTYPE = [("hi", "u8"), ("lo", "u8")]
+
+T = TypeVar("T")
+
+
+class _Node:
+    """
+    A node in a path-compressed binary trie.
+
+    The key holds the network value with its host bits cleared, and
+    nodes without a value of their own only exist to join two branches.
+    """
+
+    __slots__ = ("children", "key", "length", "value")
+
+    def __init__(self, key: int, length: int, value: int = NO_MATCH) -> None:
+        self.key = key
+        self.length = length
+        self.value = value
+        self.children: list[_Node | None] = [None, None]
+
+
+class PrefixTable(Generic[T]):
+    """
+    Routing table mapping networks to values, with longest-prefix-match lookups.
+
+    IPv4 and IPv6 prefixes are kept in separate path-compressed binary
+    tries (Patricia tries), so lookups follow at most one node per
+    distinct prefix length on the path instead of scanning every prefix.
+
+    Values are stored in slots whose indexes stay the same for as long
+    as the prefix is in the table; `lookup_many` returns these indexes
+    and `value_at` turns them back into values.
+    """
+
+    __slots__ = ("_free", "_roots", "_size", "_values")
+
+    def __init__(self, items: Iterable[tuple[Prefix, T]] = ()) -> None:
+        """Create PrefixTable, optionally filled with (prefix, value) pairs."""
+        self._roots = {version: _Node(0, 0) for version in SubnetType}
+        self._values: list[T | None] = []
+        self._free: list[int] = []
+        self._size = 0
+
+        for prefix, value in items:
+            self[prefix] = value
+
+    def __len__(self) -> int:
+        """Return the number of prefixes."""
+        return self._size
+
+    def __repr__(self) -> str:
+        """Str representation."""
+        return f"iplib3.{self.__class__.__name__}(<{self._size} prefixes>)"
+
+    def __setitem__(self, prefix: Prefix, value: T) -> None:
+        """Add a prefix, or replace the value of an existing one."""
+        version, key, length = self._prefix_key(prefix)
+        node = self._insert(self._roots[version], key, length, _BIT_COUNTS[version])
+
+        if node.value == NO_MATCH:
+            if self._free:
+                node.value = self._free.pop()
+                self._values[node.value] = value
+            else:
+                node.value = len(self._values)
+                self._values.append(value)
+            self._size += 1
+        else:
+            self._values[node.value] = value
+
+    def __getitem__(self, prefix: Prefix) -> T:
+        """Return the value of the exact prefix."""
+        version, key, length = self._prefix_key(prefix)
+        path = self._find(self._roots[version], key, length, _BIT_COUNTS[version])
+        if not path or path[-1].value == NO_MATCH:
+            raise KeyError(prefix)
+
+        return self._values[path[-1].value]  # type: ignore[return-value]
+
+    def __delitem__(self, prefix: Prefix) -> None:
+        """Remove the exact prefix."""
+        version, key, length = self._prefix_key(prefix)
+        bits = _BIT_COUNTS[version]
+        path = self._find(self._roots[version], key, length, bits)
+        if not path or path[-1].value == NO_MATCH:
+            raise KeyError(prefix)
+
+        node = path[-1]
+        self._values[node.value] = None
+        self._free.append(node.value)
+        node.value = NO_MATCH
+        self._size -= 1
+
+        # Remove nodes that no longer have a purpose, the root always stays
+        for idx in range(len(path) - 1, 0, -1):
+            node, parent = path[idx], path[idx - 1]
+            children = [child for child in node.children if child is not None]
+            if node.value != NO_MATCH or len(children) > 1:
+                break
+
+            bit = (node.key >> (bits - 1 - parent.length)) & 1
+            parent.children[bit] = children[0] if children else None
+            if children:
+                break
+
+    def __contains__(self, prefix: object) -> bool:
+        """Tell whether the exact prefix is in the table."""
+        try:
+            self[prefix]  # type: ignore[index]
+        except (KeyError, TypeError, ValueError):
+            return False
+        return True
+
+    def __iter__(self) -> Iterator[IPNetwork]:
+        """Iterate over the prefixes, IPv4 first, each in address order."""
+        for version, node in self._nodes():
+            yield self._network(version, node)
+
+    def items(self) -> Iterator[tuple[IPNetwork, T]]:
+        """Iterate over (prefix, value) pairs, IPv4 first, each in address order."""
+        for version, node in self._nodes():
+            yield self._network(version, node), self._values[node.value]  # type: ignore[misc]
+
+    def get(self, prefix: Prefix, default: T | None = None) -> T | None:
+        """Return the value of the exact prefix, or the default if it's not in the table."""
+        try:
+            return self[prefix]
+        except KeyError:
+            return default
+
+    def lookup(self, address: int | str | IPAddress, version: SubnetType = SubnetType.IPV4) -> T | None:
+        """
+        Return the value of the longest prefix containing the address, or None if there's no such prefix.
+
+        Integers are treated as addresses of the given version,
+        the version of other addresses is detected.
+        """
+        index = self.lookup_index(address, version)
+        return None if index == NO_MATCH else self._values[index]
+
+    def lookup_prefix(
+        self, address: int | str | IPAddress, version: SubnetType = SubnetType.IPV4
+    ) -> tuple[IPNetwork, T] | None:
+        """Return the longest prefix containing the address along with its value, or None if there's no such prefix."""
+        version, num = self._address_key(address, version)
+        node = self._lookup(self._roots[version], num, _BIT_COUNTS[version])
+        if node.value == NO_MATCH:
+            return None
+
+        return self._network(version, node), self._values[node.value]  # type: ignore[return-value]
+
+    def lookup_index(self, address: int | str | IPAddress, version: SubnetType = SubnetType.IPV4) -> int:
+        """Return the value index of the longest prefix containing the address, or NO_MATCH."""
+        version, num = self._address_key(address, version)
+        return self._lookup(self._roots[version], num, _BIT_COUNTS[version]).value
+
+    def lookup_many(self, nums: Iterable[int] | IPAddressArray, version: SubnetType = SubnetType.IPV4) -> array[int]:
+        """
+        Find the longest matching prefix for many address values.
+
+        Returns the value index for every address, NO_MATCH where no prefix
+        matches. Address arrays use their own version.
+        """
+        if isinstance(nums, IPAddressArray):
+            version = nums.version
+            nums = nums.nums()
+
+        root, bits = self._roots[SubnetType(version)], _BIT_COUNTS[SubnetType(version)]
+        lookup = self._lookup
+        return array("l", [lookup(root, num, bits).value for num in nums])
+
+    def value_at(self, index: int) -> T:
+        """Return the value stored at a value index."""
+        if index < 0:
+            msg = f"No value at index {index}"
+            raise IndexError(msg)
+
+        return self._values[index]  # type: ignore[return-value]
+
+    def compile(self) -> CompiledPrefixTable[T]:
+        """
+        Create a frozen snapshot of the table for vectorized lookups.
+
+        Requires NumPy to be installed. Later changes to the table
+        don't affect the snapshot, the value indexes are shared.
+        """
+        ipv4, ipv6 = (
+            _flatten(
+                ((node.key, node.length, node.value) for version, node in self._nodes() if version == subnet_type),
+                _BIT_COUNTS[subnet_type],
+            )
+            for subnet_type in (SubnetType.IPV4, SubnetType.IPV6)
+        )
+        return CompiledPrefixTable(ipv4, ipv6, list(self._values))
+
+    def _nodes(self) -> Iterator[tuple[SubnetType, _Node]]:
+        """Iterate over the nodes that hold a value, in address order."""
+        for version, root in self._roots.items():
+            stack = [root]
+            while stack:
+                node = stack.pop()
+                if node.value != NO_MATCH:
+                    yield version, node
+                stack.extend(child for child in reversed(node.children) if child is not None)
+
+    @staticmethod
+    def _network(version: SubnetType, node: _Node) -> IPNetwork:
+        address_class = IPv4 if version == SubnetType.IPV4 else IPv6
+        return IPNetwork(address_class.from_int(node.key), node.length)
+
+    @staticmethod
+    def _lookup(root: _Node, num: int, bits: int) -> _Node:
+        """Return the node of the longest matching prefix, or the root if there's none."""
+        best = root
+        node: _Node | None = root
+
+        while node is not None and not (num ^ node.key) >> (bits - node.length):
+            if node.value != NO_MATCH:
+                best = node
+            if node.length == bits:
+                break
+            node = node.children[(num >> (bits - 1 - node.length)) & 1]
+
+        return best
+
+    @staticmethod
+    def _find(root: _Node, key: int, length: int, bits: int) -> list[_Node]:
+        """Return the path from the root to the node of the exact prefix, or an empty list."""
+        path = [root]
+        node = root
+
+        while node.length < length:
+            child = node.children[(key >> (bits - 1 - node.length)) & 1]
+            if child is None or child.length > length or (key ^ child.key) >> (bits - child.length):
+                return []
+            path.append(child)
+            node = child
+
+        return path if node.length == length and node.key == key else []
+
+    @staticmethod
+    def _insert(root: _Node, key: int, length: int, bits: int) -> _Node:
+        """Return the node of the prefix, creating it (and splitting edges) if needed."""
+        node = root
+
+        while node.length < length:
+            bit = (key >> (bits - 1 - node.length)) & 1
+            child = node.children[bit]
+
+            if child is None:
+                child = node.children[bit] = _Node(key, length)
+                return child
+
+            common = min(bits - (key ^ child.key).bit_length(), child.length, length)
+            if common == child.length:
+                node = child
+                continue
+
+            # The new prefix branches off in the middle of the edge to the child
+            new = _Node(key, length)
+            if common == length:
+                branch = new
+            else:
+                branch = _Node(key >> (bits - common) << (bits - common), common)
+                branch.children[(key >> (bits - 1 - common)) & 1] = new
+
+            branch.children[(child.key >> (bits - 1 - common)) & 1] = child
+            node.children[bit] = branch
+            return new
+
+        return node
+
+    @staticmethod
+    def _prefix_key(prefix: Prefix) -> tuple[SubnetType, int, int]:
+        if isinstance(prefix, tuple):
+            prefix = IPNetwork(*prefix)
+        elif isinstance(prefix, str):
+            prefix = IPNetwork(prefix)
+        elif not isinstance(prefix, IPNetwork):
+            msg = f"Invalid type for prefix: '{prefix.__class__.__name__}'\nExpected IPNetwork, string, or tuple"
+            raise TypeError(msg)
+
+        return prefix.version, prefix.network, prefix.prefix_length
+
+    @staticmethod
+    def _address_key(address: int | str | IPAddress, version: SubnetType) -> tuple[SubnetType, int]:
+        if isinstance(address, str):
+            address = IPAddress(address)  # type: ignore[arg-type]
+
+        if isinstance(address, IPAddress):
+            # Going by version and value, so lazy and generic addresses work too
+            return address.version, address.num
+        if isinstance(address, int):
+            return SubnetType(version), address
+
+        msg = f"Invalid type for address: '{address.__class__.__name__}'\nExpected int, string, IPv4, or IPv6"
+        raise TypeError(msg)
+
+
+class CompiledPrefixTable(Generic[T]):
+    """
+    Frozen form of a PrefixTable for resolving whole NumPy arrays at once.
+
+    The nested prefixes are flattened into sorted, disjoint ranges, each
+    holding the value index of the longest prefix covering it, so a
+    lookup is a single binary search done by `numpy.searchsorted`.
+    Create instances with `PrefixTable.compile`.
+    """
+
+    __slots__ = ("_ipv4_indexes", "_ipv4_starts", "_ipv6_high", "_ipv6_indexes", "_ipv6_starts", "_values")
+
+    def __init__(
+        self,
+        ipv4: tuple[list[int], list[int]],
+        ipv6: tuple[list[int], list[int]],
+        values: list[T | None],
+    ) -> None:
+        """Create CompiledPrefixTable from (range starts, value indexes) pairs."""
+        import numpy as np  # noqa: PLC0415
+
+        self._ipv4_starts = np.array(ipv4[0], dtype=np.uint32)
+        self._ipv4_indexes = np.array(ipv4[1], dtype=np.int64)
+
+        self._ipv6_starts = np.empty(len(ipv6[0]), dtype=_IPV6_DTYPE)
+        self._ipv6_starts["hi"] = [start >> _HALF_BIT_COUNT for start in ipv6[0]]
+        self._ipv6_starts["lo"] = [start & _HALF_MASK for start in ipv6[0]]
+        self._ipv6_high = np.ascontiguousarray(self._ipv6_starts["hi"])
+        self._ipv6_indexes = np.array(ipv6[1], dtype=np.int64)
+
+        self._values = values
+
+    def __repr__(self) -> str:
+        """Str representation."""
+        return (
+            f"iplib3.{self.__class__.__name__}"
+            f"(<{len(self._ipv4_starts)} IPv4 ranges>, <{len(self._ipv6_starts)} IPv6 ranges>)"
+        )
+
+    def lookup_ipv4(self, nums: npt.ArrayLike) -> npt.NDArray[np.int64]:
+        """
+        Find the longest matching prefix for an array of IPv4 address values.
+
+        Accepts anything NumPy can turn into a uint32 array, such as the
+        arrays of `parse_ipv4_many`. Returns the value index per element,
+        NO_MATCH where no prefix matches.
+        """
+        import numpy as np  # noqa: PLC0415
+
+        nums = np.asarray(nums, dtype=np.uint32)
+        positions = np.searchsorted(self._ipv4_starts, nums, side="right") - 1
+        return self._ipv4_indexes[positions]
+
+    def lookup_ipv6(self, high: npt.ArrayLike, low: npt.ArrayLike) -> npt.NDArray[np.int64]:
+        """
+        Find the longest matching prefix for IPv6 addresses split into high and low 64-bit halves.
+
+        Accepts anything NumPy can turn into uint64 arrays, such as the
+        arrays of `parse_ipv6_many`. Returns the value index per element,
+        NO_MATCH where no prefix matches.
+        """
+        import numpy as np  # noqa: PLC0415
+
+        high = np.asarray(high, dtype=np.uint64)
+        low = np.asarray(low, dtype=np.uint64)
+
+        # Searching the high halves alone is enough, and much faster,
+        # unless a range starts in the same /64 as the address
+        counts = np.searchsorted(self._ipv6_high, high, side="left")
+        ties = np.searchsorted(self._ipv6_high, high, side="right") != counts
+
+        if ties.any():
+            keys = np.empty(np.count_nonzero(ties), dtype=_IPV6_DTYPE)
+            keys["hi"] = high[ties]
+            keys["lo"] = low[ties]
+            counts[ties] = np.searchsorted(self._ipv6_starts, keys, side="right")
+
+        return self._ipv6_indexes[counts - 1]
+
+    def value_at(self, index: int) -> T:
+        """Return the value stored at a value index."""
+        if index < 0:
+            msg = f"No value at index {index}"
+            raise IndexError(msg)
+
+        return self._values[index]  # type: ignore[return-value]
+
+
+def _flatten(nodes: Iterable[tuple[int, int, int]], bits: int) -> tuple[list[int], list[int]]:
+    """
+    Turn nested prefixes into sorted, disjoint ranges.
+
+    Takes (key, length, value index) triples in address order with
+    shorter prefixes first, and returns the start of every range
+    along with the value index of the longest prefix covering it.
+    """
+    starts: list[int] = []
+    indexes: list[int] = []
+
+    def add(start: int, index: int) -> None:
+        if starts and starts[-1] == start:
+            # An empty range, the new one starts at the same address
+            starts.pop()
+            indexes.pop()
+        if not indexes or indexes[-1] != index:
+            starts.append(start)
+            indexes.append(index)
+
+    add(0, NO_MATCH)
+    enclosing: list[tuple[int, int]] = []  # (last address, value index) of the prefixes we're inside
+
+    for key, length, index in nodes:
+        while enclosing and enclosing[-1][0] < key:
+            last, _ = enclosing.pop()
+            add(last + 1, enclosing[-1][1] if enclosing else NO_MATCH)
+
+        add(key, index)
+        enclosing.append((key | ((1 << (bits - length)) - 1), index))
+
+    while enclosing:
+        last, _ = enclosing.pop()
+        if last < (1 << bits) - 1:
+            add(last + 1, enclosing[-1][1] if enclosing else NO_MATCH)
+
+    return starts, indexes
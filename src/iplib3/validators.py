@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 from enum import IntEnum, auto
+from functools import partial
+from typing import TYPE_CHECKING, Literal, NamedTuple, overload
 
 from iplib3.constants.ipv4 import (
     IPV4_MAX_SEGMENT_COUNT,
@@ -28,12 +30,29 @@
 from iplib3.constants.subnet import (
     IPV4_MAX_SUBNET_VALUE,
     IPV4_MIN_SUBNET_VALUE,
+    IPV4_PREFIX_LENGTHS_BY_MASK,
+    IPV4_PREFIX_LENGTHS_BY_STRING,
     IPV6_MAX_SUBNET_VALUE,
     IPV6_MIN_SUBNET_VALUE,
     SubnetType,
 )
-
-__all__ = ("ip_validator", "ipv4_validator", "ipv6_validator", "port_validator", "subnet_validator")
+from iplib3.stats import instrumented, instrumented_with
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+__all__ = (
+    "AddressKind",
+    "ParseErrorCode",
+    "ParsedAddress",
+    "ip_validator",
+    "ipv4_validator",
+    "ipv6_validator",
+    "port_validator",
+    "subnet_validator",
+    "try_parse",
+    "validate_many",
+)
 
 
 class ValidationMode(IntEnum):
@@ -43,6 +62,59 @@ class ValidationMode(IntEnum):
     STRICT = auto()
 
 
+class AddressKind(IntEnum):
+    """Kind of input, as told apart by `validate_many`."""
+
+    INVALID = 0
+    IPV4 = auto()
+    IPV6 = auto()
+    IPV4_ENDPOINT = auto()  # IPv4 address with a port
+    IPV6_ENDPOINT = auto()  # IPv6 address with a port
+
+
+class ParseErrorCode(IntEnum):
+    """Reason for `try_parse` to reject an address."""
+
+    INVALID_TYPE = auto()
+    INVALID_PORT = auto()
+    PORT_OUT_OF_RANGE = auto()
+    MULTIPLE_ZERO_SKIPS = auto()
+    INVALID_CHARACTERS = auto()
+    TOO_MANY_SEGMENTS = auto()
+    TOO_FEW_SEGMENTS = auto()
+    SEGMENT_TOO_HIGH = auto()
+    SEGMENT_TOO_LOW = auto()
+    VALUE_OUT_OF_RANGE = auto()
+
+    @property
+    def message(self) -> str:
+        """Return a human-readable description of the error."""
+        return _PARSE_ERROR_MESSAGES[self]
+
+
+_PARSE_ERROR_MESSAGES = {
+    ParseErrorCode.INVALID_TYPE: "only strings and integers are supported",
+    ParseErrorCode.INVALID_PORT: "port is not a valid integer",
+    ParseErrorCode.PORT_OUT_OF_RANGE: f"port not in valid range ({PORT_NUMBER_MIN_VALUE}-{PORT_NUMBER_MAX_VALUE})",
+    ParseErrorCode.MULTIPLE_ZERO_SKIPS: "only one zero-skip allowed",
+    ParseErrorCode.INVALID_CHARACTERS: "address contains invalid characters",
+    ParseErrorCode.TOO_MANY_SEGMENTS: "too many segments",
+    ParseErrorCode.TOO_FEW_SEGMENTS: "too few segments",
+    ParseErrorCode.SEGMENT_TOO_HIGH: "segment max value passed",
+    ParseErrorCode.SEGMENT_TOO_LOW: "segment min value passed",
+    ParseErrorCode.VALUE_OUT_OF_RANGE: "value not in valid range",
+}
+
+
+class ParsedAddress(NamedTuple):
+    """An address successfully parsed by `try_parse`."""
+
+    version: SubnetType
+    num: int
+    port: int | None
+
+
+@instrumented
 def port_validator(port_num: int | None) -> bool:
     """
     Validate an address port.
@@ -60,6 +132,7 @@ def port_validator(port_num: int | None) -> bool:
     return isinstance(port_num, int) and PORT_NUMBER_MIN_VALUE <= port_num <= PORT_NUMBER_MAX_VALUE
 
 
+@instrumented
 def ip_validator(address: str | int, validation_mode: ValidationMode = ValidationMode.STRICT) -> bool:
     """
     Validate an IP address of any kind, returning a boolean.
@@ -67,55 +140,160 @@ def ip_validator(address: str | int, validation_mode: ValidationMode = Validatio
     Under strict mode ensures that the numerical values
     don't exceed legal bounds, otherwise focuses on form.
     """
-    if ipv4_validator(address, validation_mode):
-        return True
-    return ipv6_validator(address, validation_mode)
+    return isinstance(try_parse(address, validation_mode), ParsedAddress)
 
 
-def ipv4_validator(address: str | int, validation_mode: ValidationMode = ValidationMode.STRICT) -> bool:
+@instrumented_with(lambda result: isinstance(result, ParseErrorCode))
+def try_parse(
+    address: str | int,
+    validation_mode: ValidationMode = ValidationMode.STRICT,
+    version: SubnetType | None = None,
+) -> ParsedAddress | ParseErrorCode:
     """
-    Validate an IPv4 address, returning a boolean.
+    Parse and validate an IP address in a single pass, without raising exceptions.
+
+    Returns the version, value and port of the address, or an error code
+    telling why it was rejected. Without a version, strings containing '.'
+    are tried as IPv4 first and everything else as IPv6, and integers
+    within the IPv4 range are treated as IPv4.
 
     Under strict mode ensures that the numerical values
     don't exceed legal bounds, otherwise focuses on form.
     """
-    valid = False
+    strict = validation_mode == ValidationMode.STRICT
 
-    if isinstance(address, str) and "." in address:
-        portless_address, _, valid = _port_stripper(address, protocol=SubnetType.IPV4, validation_mode=validation_mode)
-
-        if valid:
-            valid = _ipv4_address_validator(portless_address, validation_mode=validation_mode)
+    if isinstance(address, str):
+        if version is None:
+            if "." not in address:
+                return _parse_ipv6(address, strict=strict)
+
+            result = _parse_ipv4(address, strict=strict)
+            if isinstance(result, ParsedAddress):
+                return result
+            # The IPv4 error is more telling than the IPv6 one for addresses with '.'
+            fallback = _parse_ipv6(address, strict=strict)
+            return fallback if isinstance(fallback, ParsedAddress) else result
+
+        # Converting the version is slow, and addresses pass a SubnetType on every call
+        if version is not SubnetType.IPV4 and version is not SubnetType.IPV6:
+            version = SubnetType(version)
+        if version == SubnetType.IPV4:
+            return _parse_ipv4(address, strict=strict)
+        return _parse_ipv6(address, strict=strict)
 
     if isinstance(address, int):
-        valid = IPV4_MIN_VALUE <= address <= IPV4_MAX_VALUE
+        if version != SubnetType.IPV6 and IPV4_MIN_VALUE <= address <= IPV4_MAX_VALUE:
+            return ParsedAddress(SubnetType.IPV4, address, None)
+        if version != SubnetType.IPV4 and IPV6_MIN_VALUE <= address <= IPV6_MAX_VALUE:
+            return ParsedAddress(SubnetType.IPV6, address, None)
+        return ParseErrorCode.VALUE_OUT_OF_RANGE
+
+    return ParseErrorCode.INVALID_TYPE
+
+
+@overload
+def validate_many(
+    addresses: Iterable[str | int],
+    validation_mode: ValidationMode = ...,
+    *,
+    with_values: Literal[False] = ...,
+    workers: int = ...,
+) -> bytearray: ...
+
+
+@overload
+def validate_many(
+    addresses: Iterable[str | int],
+    validation_mode: ValidationMode = ...,
+    *,
+    with_values: Literal[True],
+    workers: int = ...,
+) -> tuple[bytearray, list[int]]: ...
+
+
+def validate_many(
+    addresses: Iterable[str | int],
+    validation_mode: ValidationMode = ValidationMode.STRICT,
+    *,
+    with_values: bool = False,
+    workers: int = 1,
+) -> bytearray | tuple[bytearray, list[int]]:
+    """
+    Validate and classify many IP addresses, parsing each only once.
 
-    return valid
+    Returns an AddressKind code per input, packed in a bytearray
+    (eg. for `numpy.frombuffer(kinds, numpy.uint8)`). An input is valid
+    exactly when `ip_validator` would accept it. If with_values is True,
+    a list of the address values (zero for invalid inputs) is returned too.
+
+    With more than one worker, chunks of the addresses are validated on
+    that many threads if the interpreter runs them in parallel, see
+    `iplib3.parallel.threads_run_in_parallel`.
+    """
+    if workers > 1:
+        from iplib3.parallel import _map_threaded  # noqa: PLC0415
+
+        validate = partial(_validate_many, validation_mode=validation_mode, with_values=with_values)
+        (kinds, nums), *chunks = _map_threaded(validate, addresses, workers)
+        for chunk_kinds, chunk_nums in chunks:
+            kinds += chunk_kinds
+            nums += chunk_nums
+    else:
+        kinds, nums = _validate_many(addresses, validation_mode, with_values=with_values)
 
+    if with_values:
+        return kinds, nums
+    return kinds
 
-def ipv6_validator(address: str | int, validation_mode: ValidationMode = ValidationMode.STRICT) -> bool:
+
+def _validate_many(
+    addresses: Iterable[str | int], validation_mode: ValidationMode, *, with_values: bool
+) -> tuple[bytearray, list[int]]:
+    kinds = bytearray()
+    nums: list[int] = []
+
+    for address in addresses:
+        result = try_parse(address, validation_mode)
+
+        if isinstance(result, ParsedAddress):
+            kinds.append(_ADDRESS_KINDS[result.version, result.port is not None])
+            num = result.num
+        else:
+            kinds.append(AddressKind.INVALID)
+            num = 0
+
+        if with_values:
+            nums.append(num)
+
+    return kinds, nums
+
+
+@instrumented
+def ipv4_validator(address: str | int, validation_mode: ValidationMode = ValidationMode.STRICT) -> bool:
     """
-    Validate an IPv6 address, returning a boolean.
+    Validate an IPv4 address, returning a boolean.
 
     Under strict mode ensures that the numerical values
     don't exceed legal bounds, otherwise focuses on form.
     """
-    valid = False
-
-    if isinstance(address, str):
-        portless_address, _, valid = _port_stripper(address, protocol=SubnetType.IPV6, validation_mode=validation_mode)
+    if isinstance(address, str) and "." not in address:
+        return False
 
-        if not valid:
-            return valid
+    return isinstance(try_parse(address, validation_mode, SubnetType.IPV4), ParsedAddress)
 
-        valid = _ipv6_address_validator(portless_address, validation_mode=validation_mode)
 
-    if isinstance(address, int):
-        valid = IPV6_MIN_VALUE <= address <= IPV6_MAX_VALUE
+@instrumented
+def ipv6_validator(address: str | int, validation_mode: ValidationMode = ValidationMode.STRICT) -> bool:
+    """
+    Validate an IPv6 address, returning a boolean.
 
-    return valid
+    Under strict mode ensures that the numerical values
+    don't exceed legal bounds, otherwise focuses on form.
+    """
+    return isinstance(try_parse(address, validation_mode, SubnetType.IPV6), ParsedAddress)
 
 
+@instrumented
 def subnet_validator(subnet: str | int, protocol: SubnetType = SubnetType.IPV4) -> bool:
     """
     Validate a given subnet mask, defaulting to IPv4 protocol.
@@ -148,17 +326,18 @@ def _ipv4_subnet_validator(subnet: str | int) -> bool:
     of the used type.
     """
     if isinstance(subnet, str):
-        segments = tuple(int(s) for s in reversed(subnet.split(".")))
-        if len(segments) != IPV4_MIN_SEGMENT_COUNT:
-            return False
-
-        segment_sum = sum(s << (8 * idx) for idx, s in enumerate(segments))
-        subnet_bits = f"{segment_sum:b}".rstrip("0")
+        if subnet in IPV4_PREFIX_LENGTHS_BY_STRING:
+            subnet = IPV4_PREFIX_LENGTHS_BY_STRING[subnet]
+        else:
+            segments = tuple(int(s) for s in reversed(subnet.split(".")))
+            if len(segments) != IPV4_MIN_SEGMENT_COUNT:
+                return False
 
-        if "0" in subnet_bits:
-            return False
+            segment_sum = sum(s << (8 * idx) for idx, s in enumerate(segments))
+            if segment_sum not in IPV4_PREFIX_LENGTHS_BY_MASK:
+                return False
 
-        subnet = len(subnet_bits)
+            subnet = IPV4_PREFIX_LENGTHS_BY_MASK[segment_sum]
 
     if isinstance(subnet, int):
         return IPV4_MIN_SUBNET_VALUE <= subnet <= IPV4_MAX_SUBNET_VALUE
@@ -226,68 +405,132 @@ def _port_stripper(
     return address, port_num, valid
 
 
-def _ipv4_address_validator(address: str, validation_mode: ValidationMode = ValidationMode.STRICT) -> bool:
-    """Validate the address part of an IPv4 address."""
-    valid = True
+_ADDRESS_KINDS = {
+    (SubnetType.IPV4, False): AddressKind.IPV4,
+    (SubnetType.IPV6, False): AddressKind.IPV6,
+    (SubnetType.IPV4, True): AddressKind.IPV4_ENDPOINT,
+    (SubnetType.IPV6, True): AddressKind.IPV6_ENDPOINT,
+}
+
+
+def _parse_port(port: str, *, strict: bool) -> int | ParseErrorCode:
+    """Parse the port part of an address, with the same rules as _port_stripper."""
+    try:
+        port_num = int(port)
+    except ValueError:
+        return ParseErrorCode.INVALID_PORT
+
+    if strict and not PORT_NUMBER_MIN_VALUE <= port_num <= PORT_NUMBER_MAX_VALUE:
+        return ParseErrorCode.PORT_OUT_OF_RANGE
+
+    return port_num
+
+
+def _parse_ipv4(address: str, *, strict: bool) -> ParsedAddress | ParseErrorCode:
+    """Parse an IPv4 address with an optional port."""
+    portless_address, *port = address.strip().split(":", 2)
+    port_num = None
+
+    if port:
+        port_num = _parse_port(port[0], strict=strict)
+        if isinstance(port_num, ParseErrorCode):
+            return port_num
 
     try:
-        segments = [int(segment) for segment in address.split(".")]
+        segments = [int(segment) for segment in portless_address.split(".")]
     except ValueError:
         # IPv4 address was not made of valid integers
-        return False
+        return ParseErrorCode.INVALID_CHARACTERS
 
-    if not IPV4_MIN_SEGMENT_COUNT <= len(segments) <= IPV4_MAX_SEGMENT_COUNT:
-        # Invalid number of segments
-        valid = False
+    if len(segments) > IPV4_MAX_SEGMENT_COUNT:
+        return ParseErrorCode.TOO_MANY_SEGMENTS
+    if len(segments) < IPV4_MIN_SEGMENT_COUNT:
+        return ParseErrorCode.TOO_FEW_SEGMENTS
 
-    elif validation_mode == ValidationMode.STRICT:
-        for seg in segments:
-            if not IPV4_MIN_SEGMENT_VALUE <= seg <= IPV4_MAX_SEGMENT_VALUE:
-                # Segment value was too high or too low to be strictly valid
-                valid = False
-                break
+    if not strict:
+        return _join_segments(
+            SubnetType.IPV4, segments, IPV4_MIN_SEGMENT_VALUE, IPV4_MAX_SEGMENT_VALUE, port_num, strict=strict
+        )
 
-    return valid
+    if max(segments) > IPV4_MAX_SEGMENT_VALUE:
+        return ParseErrorCode.SEGMENT_TOO_HIGH
+    if min(segments) < IPV4_MIN_SEGMENT_VALUE:
+        return ParseErrorCode.SEGMENT_TOO_LOW
 
+    # The segments are in range, so shifting them in place is the same as joining them
+    first, second, third, fourth = segments
+    return ParsedAddress(SubnetType.IPV4, first << 24 | second << 16 | third << 8 | fourth, port_num)
 
-def _ipv6_address_validator(address: str, validation_mode: ValidationMode = ValidationMode.STRICT) -> bool:
-    """Validate the address part of an IPv6 address."""
-    address = address.strip()
-    valid = True
-    segments: list[str] = []
-    empty_segment = f"{IPV6_MIN_SEGMENT_VALUE:0{IPV6_NUMBER_BIT_COUNT}}"
-    skips = address.count("::")
+
+def _parse_ipv6(address: str, *, strict: bool) -> ParsedAddress | ParseErrorCode:
+    """Parse an IPv6 address, or a bracketed IPv6 address with a port."""
+    portless_address, *port = address.strip().split("]:")
+    port_num = None
+
+    if port:
+        # Get rid of the opening bracket that contained the address (eg. [::12:34]:8080 -> ::12:34)
+        portless_address = portless_address[1:]
+
+        port_num = _parse_port(port[0], strict=strict)
+        if isinstance(port_num, ParseErrorCode):
+            return port_num
+
+    portless_address = portless_address.strip()
+    skips = portless_address.count("::")
 
     if skips > 1:
         # More than one, illegal zero-skip
-        valid = False
-
-    elif skips == 1:
-        # One, legal zero-skip
-        left, *_, right = address.split("::")
+        return ParseErrorCode.MULTIPLE_ZERO_SKIPS
 
+    if skips == 1:
+        left, *_, right = portless_address.split("::")
         left_segments = left.split(":")
         right_segments = right.split(":")
-        total_segments = len(left_segments) + len(right_segments)
-
-        segments.extend(left_segments if left else [empty_segment])
-        segments.extend(empty_segment for _ in range(IPV6_MAX_SEGMENT_COUNT - total_segments))
-        segments.extend(right_segments if right else [empty_segment])
-
+        skipped = IPV6_MAX_SEGMENT_COUNT - len(left_segments) - len(right_segments)
+        text_segments = [*(left_segments if left else [""]), *([""] * skipped), *(right_segments if right else [""])]
     else:
         # No zero-skip, full address
-        segments = address.split(":")
+        text_segments = portless_address.split(":")
 
     try:
-        processed_segments: list[int] = [int(segment, IPV6_SEGMENT_BIT_COUNT) if segment else 0 for segment in segments]
+        segments = [int(segment, IPV6_SEGMENT_BIT_COUNT) if segment else 0 for segment in text_segments]
     except ValueError:
         # IPv6 address was not made of valid hexadecimal numbers
-        return False
-
-    if len(processed_segments) != IPV6_MAX_SEGMENT_COUNT:
-        valid = False
+        return ParseErrorCode.INVALID_CHARACTERS
+
+    if len(segments) > IPV6_MAX_SEGMENT_COUNT:
+        return ParseErrorCode.TOO_MANY_SEGMENTS
+    if len(segments) < IPV6_MAX_SEGMENT_COUNT:
+        return ParseErrorCode.TOO_FEW_SEGMENTS
+
+    return _join_segments(
+        SubnetType.IPV6,
+        segments,
+        IPV6_MIN_SEGMENT_VALUE,
+        IPV6_MAX_SEGMENT_VALUE,
+        port_num,
+        strict=strict,
+    )
 
-    if validation_mode == ValidationMode.STRICT and valid:
-        valid = all(IPV6_MIN_SEGMENT_VALUE <= seg <= IPV6_MAX_SEGMENT_VALUE for seg in processed_segments)
 
-    return valid
+def _join_segments(
+    version: SubnetType,
+    segments: list[int],
+    min_value: int,
+    max_value: int,
+    port_num: int | None,
+    *,
+    strict: bool,
+) -> ParsedAddress | ParseErrorCode:
+    """Range-check the segments and combine them into the value of the address."""
+    if strict:
+        if max(segments) > max_value:
+            return ParseErrorCode.SEGMENT_TOO_HIGH
+        if min(segments) < min_value:
+            return ParseErrorCode.SEGMENT_TOO_LOW
+
+    total = 0
+    for segment in segments:
+        total = total * (max_value + 1) + segment
+
+    return ParsedAddress(version, total, port_num)
@@ -1,24 +1,45 @@
 """Unit tests for iplib3.address."""
 
+import ipaddress
+import pickle
+import random
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from itertools import pairwise
+
 import pytest
 
 from iplib3 import IPAddress
-from iplib3.address import AddressFormat, IPv4, IPv6, PureAddress
+from iplib3 import address as address_module
+from iplib3.address import AddressFormat, IPv4, IPv6, LazyIPAddress, PureAddress
 from iplib3.constants import IPV6_MAX_VALUE
 from tests.test_cases_address import (
+    TEST_CASES_FROM_BYTES_ERRORS,
     TEST_CASES_IPADDRESS,
     TEST_CASES_IPADDRESS_AS_IPV4,
     TEST_CASES_IPADDRESS_AS_IPV6,
     TEST_CASES_IPADDRESS_EQUALITY,
+    TEST_CASES_IPADDRESS_NUMERIC_EQUALITY,
+    TEST_CASES_IPADDRESS_ORDERING,
     TEST_CASES_IPADDRESS_REPR,
+    TEST_CASES_IPADDRESS_SORT_KEY,
     TEST_CASES_IPADDRESS_STRING,
     TEST_CASES_IPV4,
+    TEST_CASES_IPV4_FROM_INT,
+    TEST_CASES_IPV4_FROM_INT_ERRORS,
     TEST_CASES_IPV4_IPV4_TO_NUM,
+    TEST_CASES_IPV4_IPV4_TO_NUM_ERRORS,
     TEST_CASES_IPV4_STRING,
     TEST_CASES_IPV6,
+    TEST_CASES_IPV6_FROM_INT,
+    TEST_CASES_IPV6_FROM_INT_ERRORS,
     TEST_CASES_IPV6_IPV6_TO_NUM,
     TEST_CASES_IPV6_IPV6_TO_NUM_ERRORS,
     TEST_CASES_IPV6_STRING,
+    TEST_CASES_LAZY_IPADDRESS,
+    TEST_CASES_PACKED,
+    TEST_CASES_PICKLE,
     TEST_CASES_PURE_ADDRESS,
     TEST_CASES_PURE_ADDRESS_AS_HEX,
     TEST_CASES_PURE_ADDRESS_EQUALITY,
@@ -177,6 +198,83 @@ def test_ipaddress_equality(ip_address: IPAddress, *, excepted_output: bool) ->
     assert ip_address == excepted_output
 
 
+@pytest.mark.parametrize(
+    ("first", "second", "excepted_output"),
+    TEST_CASES_IPADDRESS_NUMERIC_EQUALITY,
+)
+def test_ipaddress_numeric_equality(
+    first: IPAddress, second: IPAddress | PureAddress, *, excepted_output: bool
+) -> None:
+    """Test IPAddress equality and hashing going by version, value and port."""
+    assert (first == second) is excepted_output
+    assert (first != second) is not excepted_output
+    if excepted_output:
+        assert hash(first) == hash(second)
+
+
+@pytest.mark.parametrize("text", ["127.0.0.1", "127.0.0.1:80", "::1", "[::1]:80"])
+def test_ipaddress_string_equality_deprecated(text: str) -> None:
+    """Test that comparing addresses with their text still works, with a deprecation warning."""
+    address = IPAddress(text)
+
+    with pytest.warns(DeprecationWarning, match="Comparing addresses with strings is deprecated"):
+        assert address == text
+    with pytest.warns(DeprecationWarning, match="Comparing addresses with strings is deprecated"):
+        assert address != "10.0.0.1"
+    with pytest.warns(DeprecationWarning, match="Comparing addresses with strings is deprecated"):
+        assert LazyIPAddress(text) == text
+
+
+@pytest.mark.parametrize(
+    "compare",
+    [
+        lambda: IPAddress("127.0.0.1") == "127.0.0.1",
+        lambda: IPAddress(0x7F_00_00_01) != "::1",
+        lambda: LazyIPAddress("::1") == "::1",
+    ],
+)
+def test_ipaddress_string_equality_warning_location(compare: Callable[[], bool]) -> None:
+    """Test that the deprecation warning points at the comparison, not at iplib3."""
+    with pytest.warns(DeprecationWarning, match="Comparing addresses with strings is deprecated") as records:
+        compare()
+
+    assert records[0].filename == __file__
+
+
+@pytest.mark.parametrize(
+    ("ip_address", "excepted_output"),
+    TEST_CASES_IPADDRESS_SORT_KEY,
+)
+def test_ipaddress_sort_key(ip_address: IPAddress, excepted_output: tuple[int, int, int]) -> None:
+    """Test IPAddress sort keys."""
+    assert ip_address.sort_key == excepted_output
+
+
+@pytest.mark.parametrize(
+    ("addresses", "excepted_output"),
+    TEST_CASES_IPADDRESS_ORDERING,
+)
+def test_ipaddress_ordering(addresses: list[IPAddress], excepted_output: list[IPAddress]) -> None:
+    """Test sorting and comparing IPAddresses."""
+    assert sorted(addresses) == excepted_output
+    assert sorted(addresses, key=lambda address: address.sort_key) == excepted_output
+
+    for smaller, larger in pairwise(excepted_output):
+        assert smaller < larger
+        assert smaller <= larger
+        assert larger > smaller
+        assert larger >= smaller
+        assert not larger < smaller
+
+
+def test_ipaddress_ordering_errors() -> None:
+    """Test comparing IPAddresses with other types."""
+    with pytest.raises(TypeError):
+        _ = IPv4("127.0.0.1") < "127.0.0.2"  # type: ignore[operator]
+    with pytest.raises(TypeError):
+        _ = IPv4("127.0.0.1") >= 0x7F_00_00_02  # type: ignore[operator]
+
+
 @pytest.mark.parametrize(
     ("ip_address", "excepted_output"),
     TEST_CASES_IPADDRESS_STRING,
@@ -186,6 +284,40 @@ def test_ipaddress_string(ip_address: IPAddress, excepted_output: str) -> None:
     assert str(ip_address) == excepted_output
 
 
+def test_ipaddress_string_after_port_change() -> None:
+    """Test that the string form follows a port changed after it was first formatted."""
+    address = IPAddress(0x7F_00_00_01)
+    assert str(address) == "127.0.0.1"
+
+    address.port = 80
+    assert str(address) == "127.0.0.1:80"
+
+    address = IPAddress(IPV6_MAX_VALUE)
+    assert str(address) == "FFFF:FFFF:FFFF:FFFF:FFFF:FFFF:FFFF:FFFF"
+
+    address.port = 443
+    assert str(address) == "[FFFF:FFFF:FFFF:FFFF:FFFF:FFFF:FFFF:FFFF]:443"
+
+
+def test_ipaddress_shared_between_threads() -> None:
+    """Test formatting an address on several threads while its port changes."""
+    address = IPAddress(0x7F_00_00_01)
+    barrier = threading.Barrier(4)
+
+    def format_address(port: int) -> set[str]:
+        barrier.wait()
+        texts = set()
+        for _ in range(500):
+            address.port = port
+            texts.add(str(address))
+        return texts
+
+    with ThreadPoolExecutor(4) as executor:
+        texts = set().union(*executor.map(format_address, (80, 443, 8080, 8443)))
+
+    assert texts <= {"127.0.0.1:80", "127.0.0.1:443", "127.0.0.1:8080", "127.0.0.1:8443"}
+
+
 def test_ipaddress_string_error() -> None:
     """Test string form errors."""
     with pytest.raises(ValueError, match="No valid address representation exists"):
@@ -246,6 +378,41 @@ def test_ipv4_ipv4_to_num(input_ipv4: IPv4, excepted_output: int) -> None:
     assert input_ipv4._ipv4_to_num() == excepted_output
 
 
+@pytest.mark.parametrize(
+    ("input_ipv4", "error", "match_message"),
+    TEST_CASES_IPV4_IPV4_TO_NUM_ERRORS,
+)
+def test_ipv4_ipv4_to_num_errors(input_ipv4: str, error: type, match_message: str) -> None:
+    """Test errors converting IPv4 into number."""
+    with pytest.raises(error, match=match_message):
+        IPv4(input_ipv4)._ipv4_to_num()
+
+
+@pytest.mark.parametrize(
+    ("num", "port_num", "excepted_output"),
+    TEST_CASES_IPV4_FROM_INT,
+)
+def test_ipv4_from_int(num: int, port_num: int | None, excepted_output: str) -> None:
+    """Test creating IPv4 addresses from integers."""
+    address = IPv4.from_int(num, port_num)
+    assert isinstance(address, IPv4)
+    assert address.num == num
+    assert address.port == port_num
+    assert address._ipv4_to_num() == num
+    assert str(address) == excepted_output
+    assert address == IPv4(excepted_output)
+
+
+@pytest.mark.parametrize(
+    ("num", "error", "match_message"),
+    TEST_CASES_IPV4_FROM_INT_ERRORS,
+)
+def test_ipv4_from_int_errors(num: int, error: type[Exception], match_message: str) -> None:
+    """Test errors creating IPv4 addresses from integers."""
+    with pytest.raises(error, match=match_message):
+        IPv4.from_int(num)
+
+
 @pytest.mark.parametrize(
     "input_ipv6",
     TEST_CASES_IPV6,
@@ -281,3 +448,183 @@ def test_ipv6_ipv6_to_num_errors(input_ipv6: str, error: type, match_message: st
     """Test errors converting IPv6 into number."""
     with pytest.raises(error, match=match_message):
         IPv6(input_ipv6)._ipv6_to_num()
+
+
+@pytest.mark.parametrize(
+    ("num", "port_num", "excepted_output"),
+    TEST_CASES_IPV6_FROM_INT,
+)
+def test_ipv6_from_int(num: int, port_num: int | None, excepted_output: str) -> None:
+    """Test creating IPv6 addresses from integers."""
+    address = IPv6.from_int(num, port_num)
+    assert isinstance(address, IPv6)
+    assert address.num == num
+    assert address.port == port_num
+    assert address._ipv6_to_num() == num
+    assert str(address) == excepted_output
+    assert address == IPv6(excepted_output)
+
+
+@pytest.mark.parametrize(
+    ("num", "error", "match_message"),
+    TEST_CASES_IPV6_FROM_INT_ERRORS,
+)
+def test_ipv6_from_int_errors(num: int, error: type[Exception], match_message: str) -> None:
+    """Test errors creating IPv6 addresses from integers."""
+    with pytest.raises(error, match=match_message):
+        IPv6.from_int(num)
+
+
+def test_ipaddress_parses_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that creating an address through IPAddress only parses it once."""
+    calls = []
+    original = address_module.try_parse
+
+    def counting_try_parse(*args, **kwargs):
+        calls.append(args)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(address_module, "try_parse", counting_try_parse)
+    IPAddress("127.0.0.1")  # type: ignore[arg-type]
+    IPv4("127.0.0.1:80")
+    IPv6("[::1]:80")
+
+    assert calls == [("127.0.0.1",), ("127.0.0.1:80",), ("[::1]:80",)]
+
+
+@pytest.mark.parametrize(
+    ("address", "port_num", "excepted_instance", "excepted_output"),
+    TEST_CASES_LAZY_IPADDRESS,
+)
+def test_lazy_ipaddress(address: str, port_num: int | None, excepted_instance: type, excepted_output: str) -> None:
+    """Test that lazy addresses match eagerly parsed ones."""
+    lazy = LazyIPAddress(address, port_num)
+    eager = IPAddress(address, port_num)  # type: ignore[arg-type]
+
+    assert not lazy.is_parsed
+    assert str(lazy) == excepted_output
+    assert repr(lazy) == f"iplib3.LazyIPAddress({excepted_output!r})"
+    assert isinstance(lazy.parsed, excepted_instance)
+    assert lazy.num == eager.num
+    assert lazy.port == eager.port
+    assert lazy.as_hex == eager.as_hex
+    assert lazy == eager
+    assert hash(lazy) == hash(eager)
+    assert lazy.version == eager.version
+    assert lazy.sort_key == eager.sort_key
+
+
+def test_lazy_ipaddress_defers_parsing() -> None:
+    """Test that lazy addresses parse on first use, not on creation."""
+    lazy = LazyIPAddress("not an address")
+
+    assert str(lazy) == "not an address"
+    assert not lazy.is_parsed
+
+    with pytest.raises(ValueError, match="Invalid IPv6 address format"):
+        _ = lazy.num
+
+
+def test_lazy_ipaddress_port_setter() -> None:
+    """Test changing the port of a lazy address."""
+    lazy = LazyIPAddress("[::1]:80")
+    lazy.port = 8080
+
+    assert lazy.is_parsed
+    assert lazy.port == 8080
+    assert str(lazy) == "[::1]:8080"
+
+
+def test_lazy_ipaddress_parsed_once_between_threads() -> None:
+    """Test that threads parsing the same lazy address all get the same result."""
+    lazy = LazyIPAddress("10.0.0.1:80")
+    barrier = threading.Barrier(8)
+
+    def parse(_: int) -> IPv4 | IPv6:
+        barrier.wait()
+        return lazy.parsed
+
+    with ThreadPoolExecutor(8) as executor:
+        results = list(executor.map(parse, range(8)))
+
+    assert all(result is lazy.parsed for result in results)
+
+
+def test_lazy_ipaddress_errors() -> None:
+    """Test that lazy addresses need a string."""
+    with pytest.raises(TypeError, match="Lazy addresses must be strings"):
+        LazyIPAddress(IPV6_MAX_VALUE)  # type: ignore[arg-type]
+
+
+def test_matches_stdlib() -> None:
+    """Test parsing and formatting random addresses the same way as the ipaddress module."""
+    rng = random.Random(0)  # noqa: S311
+    for _ in range(2000):
+        ipv4 = ipaddress.IPv4Address(rng.getrandbits(32))
+        # Runs of zero segments of different lengths, to exercise shortening
+        ipv6 = ipaddress.IPv6Address(rng.getrandbits(128) & ~(((1 << rng.choice((0, 16, 48, 64))) - 1) << 16))
+
+        assert IPv4(str(ipv4)).num == int(ipv4)
+        assert PureAddress(int(ipv4)).num_to_ipv4() == str(ipv4)
+        assert IPv6(ipv6.exploded).num == IPv6(ipv6.compressed).num == int(ipv6)
+        assert PureAddress(int(ipv6)).num_to_ipv6(AddressFormat.DEFAULT) == ipv6.exploded.upper()
+        if ipv6.ipv4_mapped is None:
+            shortened = PureAddress(int(ipv6)).num_to_ipv6(AddressFormat.SHORTEN | AddressFormat.REMOVE_ZEROES)
+            assert shortened == ipv6.compressed.upper()
+
+
+@pytest.mark.parametrize(
+    ("address_class", "num", "packed"),
+    TEST_CASES_PACKED,
+)
+def test_packed(address_class: type[IPv4 | IPv6], num: int, packed: bytes) -> None:
+    """Test converting addresses to and from bytes."""
+    address = address_class.from_int(num)
+    assert address.packed == packed
+    assert address_class.from_bytes(packed) == address
+    assert address_class.from_bytes(bytearray(packed), 80).port == 80
+    assert address_class.from_bytes(memoryview(packed)) == address
+
+
+@pytest.mark.parametrize(
+    ("address_class", "data", "error", "match_message"),
+    TEST_CASES_FROM_BYTES_ERRORS,
+)
+def test_from_bytes_errors(
+    address_class: type[IPv4 | IPv6], data: bytes, error: type[Exception], match_message: str
+) -> None:
+    """Test errors converting bytes to addresses."""
+    with pytest.raises(error, match=match_message):
+        address_class.from_bytes(data)
+
+
+@pytest.mark.parametrize(
+    "address",
+    TEST_CASES_PICKLE,
+)
+def test_pickle(address: IPAddress) -> None:
+    """Test pickling addresses."""
+    restored = pickle.loads(pickle.dumps(address))  # noqa: S301
+    assert restored.__class__ is address.__class__
+    assert restored == address
+    assert restored.num == address.num
+    assert restored.port == address.port
+
+
+def test_pickle_leaves_out_cached_objects() -> None:
+    """Test that pickles hold neither the text form nor the converted addresses."""
+    address = IPv4("192.168.0.1:80")
+    _ = address.as_ipv6, address.as_ipv4, address.sort_key
+    payload = pickle.dumps(address)
+
+    assert b"192.168.0.1" not in payload
+    assert b"IPv6" not in payload
+
+
+def test_pickle_lazy_ipaddress() -> None:
+    """Test that lazy addresses stay unparsed when pickled, and keep a changed port."""
+    address = LazyIPAddress("[::1]:80")
+    assert not pickle.loads(pickle.dumps(address)).is_parsed  # noqa: S301
+
+    address.port = 8080
+    assert pickle.loads(pickle.dumps(address)).port == 8080  # noqa: S301
@@ -0,0 +1,271 @@
+"""Unit tests for iplib3.arrays."""
+
+import pytest
+
+from iplib3 import IPAddress, IPv4, IPv6, LazyIPAddress, arrays
+from iplib3.arrays import IPAddressArray
+from iplib3.bulk import parse_ipv4_many, parse_ipv6_many
+from iplib3.constants import IPV4_MAX_VALUE, IPV6_MAX_VALUE
+from iplib3.constants.subnet import SubnetType
+from tests.test_cases_arrays import (
+    IPV4_NUMS,
+    IPV6_NUMS,
+    TEST_CASES_IPADDRESS_ARRAY_ERRORS,
+    TEST_CASES_IPADDRESS_ARRAY_FROM_BYTES_ERRORS,
+    TEST_CASES_IPADDRESS_ARRAY_SET_OPERATIONS,
+)
+
+
+def test_ipaddress_array_ipv4() -> None:
+    """Test storing and accessing IPv4 addresses."""
+    array = IPAddressArray(IPV4_NUMS)
+
+    assert len(array) == len(IPV4_NUMS)
+    assert array.version == SubnetType.IPV4
+    assert array.high is None
+    assert array.ports is None
+    assert array.nbytes == 4 * len(IPV4_NUMS)
+    assert array.nums() == IPV4_NUMS
+    assert array[0] == IPv4.from_int(IPV4_NUMS[0])
+    assert isinstance(array[-1], IPv4)
+    assert [address.num for address in array] == IPV4_NUMS
+    assert repr(array) == f"iplib3.IPAddressArray(<{len(IPV4_NUMS)} addresses>, version='ipv4')"
+
+
+def test_ipaddress_array_ipv6() -> None:
+    """Test storing and accessing IPv6 addresses as 64-bit halves."""
+    array = IPAddressArray(IPV6_NUMS, SubnetType.IPV6)
+
+    assert array.version == SubnetType.IPV6
+    assert array.high is not None
+    assert array.nbytes == 16 * len(IPV6_NUMS)
+    assert array.nums() == IPV6_NUMS
+    assert array[1] == IPv6.from_int(IPV6_NUMS[1])
+    assert str(array[2]) == "FFFF:FFFF:FFFF:FFFF:FFFF:FFFF:FFFF:FFFF"
+
+
+def test_ipaddress_array_ports() -> None:
+    """Test storing ports alongside the addresses."""
+    array = IPAddressArray.from_addresses([IPv4("10.0.0.1:80"), IPv4("10.0.0.2")])
+
+    assert array.ports is not None
+    assert array.ports.tolist() == [80, -1]
+    assert array[0] == IPv4("10.0.0.1:80")
+    assert array[1].port is None
+    assert IPv4("10.0.0.1:80") in array
+    assert IPv4("10.0.0.1:8080") not in array
+    assert 0x0A_00_00_02 in array
+
+
+def test_ipaddress_array_any_address() -> None:
+    """Test creating and searching arrays with lazy and generic addresses."""
+    ipv6 = IPAddressArray.from_addresses([LazyIPAddress("[2001:db8::1]:443"), IPAddress(IPv6("::2").num)])
+    assert ipv6.version == SubnetType.IPV6
+    assert ipv6.nums() == [IPv6("2001:db8::1").num, 2]
+    assert ipv6.ports is not None
+    assert ipv6.ports.tolist() == [443, -1]
+
+    ipv4 = IPAddressArray(IPV4_NUMS).sort()
+    assert LazyIPAddress("10.0.0.2") in ipv4
+    assert IPAddress(0x0A_00_00_02) in ipv4
+    assert LazyIPAddress("::a00:2") not in ipv4
+    assert ipv4.searchsorted(LazyIPAddress("10.0.0.2")) == ipv4.searchsorted(IPv4("10.0.0.2"))
+    assert ipv4.searchsorted(IPAddress(0x0A_00_00_01), side="right") == 3
+    assert LazyIPAddress("[2001:db8::1]:443") in ipv6.sort()
+    assert LazyIPAddress("[2001:db8::1]:80") not in ipv6
+
+
+def test_ipaddress_array_slicing_is_a_view() -> None:
+    """Test that slices share memory with the original array."""
+    array = IPAddressArray(IPV4_NUMS)
+    view = array[1:3]
+
+    assert isinstance(view, IPAddressArray)
+    assert view.nums() == IPV4_NUMS[1:3]
+    assert view.low.obj is array.low.obj
+    assert array[::2].nums() == IPV4_NUMS[::2]
+
+
+def test_ipaddress_array_sort_and_search() -> None:
+    """Test sorting and bisection."""
+    array = IPAddressArray(IPV4_NUMS)
+    assert not array.is_sorted
+
+    with pytest.raises(ValueError, match="must be sorted"):
+        array.searchsorted(0)
+
+    ordered = array.sort()
+
+    assert ordered.is_sorted
+    assert ordered.nums() == sorted(IPV4_NUMS)
+    assert ordered.searchsorted(0x0A_00_00_01) == 1
+    assert ordered.searchsorted(0x0A_00_00_01, side="right") == 3
+    assert ordered.searchsorted(IPv4("127.0.0.1")) == 4
+    assert 0x0A_00_00_01 in ordered
+    assert 0x0A_00_00_03 not in ordered
+    assert IPV4_MAX_VALUE not in ordered
+    assert ordered[1:].is_sorted
+    assert not ordered[::-1].is_sorted
+
+    with pytest.raises(TypeError, match="Cannot search for"):
+        ordered.searchsorted(IPv6())
+
+
+def test_ipaddress_array_sort_with_ports() -> None:
+    """Test that sorting orders by address and then by port."""
+    array = IPAddressArray([2, 1, 2, 1], ports=[80, None, 22, 443]).sort()
+
+    assert array.nums() == [1, 1, 2, 2]
+    assert array.ports is not None
+    assert array.ports.tolist() == [-1, 443, 22, 80]
+    assert array.searchsorted(2) == 2
+    assert array.searchsorted(2, side="right") == 4
+    assert 2 in array
+    assert 3 not in array
+
+
+@pytest.mark.parametrize("version", list(SubnetType))
+def test_ipaddress_array_sort_in_runs(monkeypatch: pytest.MonkeyPatch, version: SubnetType) -> None:
+    """Test sorting and combining arrays too long to sort in one run."""
+    monkeypatch.setattr(arrays, "_SORT_RUN_SIZE", 2)
+    nums = IPV4_NUMS if version == SubnetType.IPV4 else IPV6_NUMS
+    ports = [80, None, 22, 443, None][: len(nums)]
+    array = IPAddressArray(nums + nums, version, ports + ports)
+
+    assert array.sort().nums() == sorted(nums + nums)
+    assert len(array.unique()) == len(set(zip(nums, ports, strict=True)))
+    assert (array | array[:3]) == array.unique()
+    assert (array & array[:3]) == array[:3].unique()
+    difference = sorted(set(zip(nums, ports, strict=True)) - set(zip(nums[:3], ports[:3], strict=True)))
+    assert (array - array[:3]) == IPAddressArray([num for num, _ in difference], version, [p for _, p in difference])
+
+
+def test_ipaddress_array_unique() -> None:
+    """Test removing duplicates."""
+    array = IPAddressArray(IPV6_NUMS + IPV6_NUMS, SubnetType.IPV6).unique()
+    assert array.nums() == sorted(set(IPV6_NUMS))
+    assert array.is_sorted
+
+
+@pytest.mark.parametrize(
+    ("first", "second", "operation", "excepted_output"),
+    TEST_CASES_IPADDRESS_ARRAY_SET_OPERATIONS,
+)
+def test_ipaddress_array_set_operations(
+    first: list[int], second: list[int], operation: str, excepted_output: list[int]
+) -> None:
+    """Test union, intersection and difference."""
+    for version in SubnetType:
+        result = getattr(IPAddressArray(first, version), operation)(IPAddressArray(second, version))
+        assert result.nums() == excepted_output
+        assert result.is_sorted
+
+
+def test_ipaddress_array_set_operators() -> None:
+    """Test the set operators."""
+    first = IPAddressArray([1, 2])
+    second = IPAddressArray([2, 3])
+
+    assert (first | second).nums() == [1, 2, 3]
+    assert (first & second).nums() == [2]
+    assert (first - second).nums() == [1]
+
+
+def test_ipaddress_array_from_batch() -> None:
+    """Test creating arrays from bulk parsing results without the invalid entries."""
+    ipv4 = IPAddressArray.from_batch(parse_ipv4_many(["10.0.0.1:80", "cheese", "10.0.0.2"]))
+    ipv6 = IPAddressArray.from_batch(parse_ipv6_many(["::1", "[::2]:80"]))
+
+    assert ipv4.nums() == [0x0A_00_00_01, 0x0A_00_00_02]
+    assert ipv4[0].port == 80
+    assert ipv6.nums() == [1, 2]
+    assert ipv6[1] == IPv6("[::2]:80")
+    assert IPAddressArray.from_batch(parse_ipv6_many(["::1", "::G"])).nums() == [1]
+
+
+def test_ipaddress_array_equality() -> None:
+    """Test comparing arrays."""
+    assert IPAddressArray([1, 2]) == IPAddressArray([1, 2])
+    assert IPAddressArray([1, 2]) != IPAddressArray([1, 2], SubnetType.IPV6)
+    assert IPAddressArray([1, 2]) != [1, 2]
+    assert IPAddressArray([1, 2], ports=[80, None]) == IPAddressArray([1, 2], ports=[80, None])
+    assert IPAddressArray([1, 2], ports=[80, None]) != IPAddressArray([1, 2], ports=[80, 22])
+    assert IPAddressArray([1, 2], ports=[None, None]) != IPAddressArray([1, 2])
+    assert IPAddressArray(IPV6_NUMS, SubnetType.IPV6) == IPAddressArray.from_bytes(
+        IPAddressArray(IPV6_NUMS, SubnetType.IPV6).to_bytes(), SubnetType.IPV6
+    )
+
+
+@pytest.mark.parametrize(
+    ("arguments", "error", "match_message"),
+    TEST_CASES_IPADDRESS_ARRAY_ERRORS,
+)
+def test_ipaddress_array_errors(arguments: tuple, error: type[Exception], match_message: str) -> None:
+    """Test invalid arrays."""
+    with pytest.raises(error, match=match_message):
+        IPAddressArray(*arguments)
+
+
+def test_ipaddress_array_combination_errors() -> None:
+    """Test combining incompatible arrays."""
+    with pytest.raises(ValueError, match="Cannot combine ipv4 and ipv6 addresses"):
+        IPAddressArray([1]).union(IPAddressArray([1], SubnetType.IPV6))
+    with pytest.raises(ValueError, match="Cannot combine arrays with and without ports"):
+        IPAddressArray([1]).union(IPAddressArray([1], ports=[80]))
+    with pytest.raises(TypeError, match="Expected an IPAddressArray"):
+        IPAddressArray([1]).union([1])  # type: ignore[arg-type]
+
+
+def test_ipaddress_array_ipv6_max_value() -> None:
+    """Test that the largest IPv6 address survives the round trip."""
+    assert IPAddressArray([IPV6_MAX_VALUE], SubnetType.IPV6).nums() == [IPV6_MAX_VALUE]
+
+
+def test_ipaddress_array_bytes_ipv4() -> None:
+    """Test the binary format of IPv4 arrays."""
+    ports = [80, None, 443, 0, None]
+    array = IPAddressArray(IPV4_NUMS, ports=ports)
+
+    data = array.to_bytes()
+    port_data = array.ports_to_bytes()
+    assert data == b"".join(address.packed for address in array)
+    assert port_data == b"".join((-1 if port is None else port).to_bytes(4, "big", signed=True) for port in ports)
+
+    restored = IPAddressArray.from_bytes(data, SubnetType.IPV4, port_data)
+    assert restored == array
+    assert IPAddressArray.from_bytes(data).ports is None
+    assert IPAddressArray(IPV4_NUMS).ports_to_bytes() is None
+
+
+def test_ipaddress_array_bytes_ipv6() -> None:
+    """Test the binary format of IPv6 arrays, including views."""
+    array = IPAddressArray(IPV6_NUMS, SubnetType.IPV6)
+
+    data = array.to_bytes()
+    assert data == b"".join(address.packed for address in array)
+    assert IPAddressArray.from_bytes(data, SubnetType.IPV6) == array
+    assert IPAddressArray.from_bytes(array[::2].to_bytes(), SubnetType.IPV6).nums() == IPV6_NUMS[::2]
+    assert IPAddressArray.from_bytes(b"", SubnetType.IPV6).nums() == []
+
+
+def test_ipaddress_array_bytes_numpy() -> None:
+    """Test reading the binary format with NumPy."""
+    np = pytest.importorskip("numpy")
+
+    ipv4 = IPAddressArray(IPV4_NUMS, ports=[80] * len(IPV4_NUMS))
+    assert np.frombuffer(ipv4.to_bytes(), dtype=">u4").tolist() == IPV4_NUMS
+    assert np.frombuffer(ipv4.ports_to_bytes(), dtype=">i4").tolist() == [80] * len(IPV4_NUMS)
+
+    ipv6 = IPAddressArray(IPV6_NUMS, SubnetType.IPV6)
+    records = np.frombuffer(ipv6.to_bytes(), dtype=[("high", ">u8"), ("low", ">u8")])
+    assert [int(high) << 64 | int(low) for high, low in records.tolist()] == IPV6_NUMS
+
+
+@pytest.mark.parametrize(
+    ("arguments", "error", "match_message"),
+    TEST_CASES_IPADDRESS_ARRAY_FROM_BYTES_ERRORS,
+)
+def test_ipaddress_array_from_bytes_errors(arguments: tuple, error: type[Exception], match_message: str) -> None:
+    """Test errors reading the binary format."""
+    with pytest.raises(error, match=match_message):
+        IPAddressArray.from_bytes(*arguments)
@@ -0,0 +1,199 @@
+"""Unit tests for iplib3.bulk."""
+
+import io
+import random
+
+import pytest
+
+from iplib3 import IPv4, IPv6
+from iplib3.address import AddressFormat, PureAddress
+from iplib3.bulk import NO_PORT, format_ipv4_many, format_ipv6_many, parse_ipv4_many, parse_ipv6_many
+from iplib3.constants import IPV4_MAX_VALUE, IPV6_MAX_VALUE
+from tests.test_cases_bulk import (
+    TEST_CASES_FORMAT_IPV4_MANY,
+    TEST_CASES_FORMAT_IPV6_MANY,
+    TEST_CASES_FORMAT_MANY_ERRORS,
+    TEST_CASES_PARSE_IPV4_MANY,
+    TEST_CASES_PARSE_IPV4_MANY_INVALID,
+    TEST_CASES_PARSE_IPV6_MANY,
+    TEST_CASES_PARSE_IPV6_MANY_INVALID,
+)
+
+
+@pytest.mark.parametrize(
+    ("address", "excepted_address", "excepted_port"),
+    TEST_CASES_PARSE_IPV4_MANY,
+)
+def test_parse_ipv4_many(address: str, excepted_address: int, excepted_port: int) -> None:
+    """Test parsing valid IPv4 addresses in bulk."""
+    batch = parse_ipv4_many([address])
+    assert list(batch.addresses) == [excepted_address]
+    assert list(batch.ports) == [excepted_port]
+    assert batch.invalid == []
+
+
+@pytest.mark.parametrize(
+    "address",
+    TEST_CASES_PARSE_IPV4_MANY_INVALID,
+)
+def test_parse_ipv4_many_invalid(address: str) -> None:
+    """Test that invalid IPv4 addresses are reported by index."""
+    batch = parse_ipv4_many(["127.0.0.1", address])
+    assert batch.invalid == [1]
+    assert list(batch.addresses) == [IPv4("127.0.0.1").num, 0]
+    assert list(batch.ports) == [NO_PORT, NO_PORT]
+
+
+def test_parse_ipv4_many_matches_ipv4() -> None:
+    """Test that bulk parsing agrees with IPv4 across multiple chunks."""
+    addresses = [f"{idx % 256}.{idx * 7 % 256}.{idx * 13 % 256}.{idx * 17 % 256}:{idx}" for idx in range(10_000)]
+    addresses[5000] = "1.2.3.999"
+
+    batch = parse_ipv4_many(addresses)
+
+    assert batch.invalid == [5000]
+    assert len(batch.addresses) == len(batch.ports) == len(addresses)
+    for idx, address in enumerate(addresses):
+        if idx != 5000:
+            ipv4 = IPv4(address)
+            assert batch.addresses[idx] == ipv4.num
+            assert batch.ports[idx] == ipv4.port
+
+
+def test_parse_ipv4_many_empty() -> None:
+    """Test bulk parsing with no input."""
+    batch = parse_ipv4_many([])
+    assert len(batch.addresses) == len(batch.ports) == len(batch.invalid) == 0
+
+
+@pytest.mark.parametrize(
+    ("address", "excepted_address", "excepted_port"),
+    TEST_CASES_PARSE_IPV6_MANY,
+)
+def test_parse_ipv6_many(address: str, excepted_address: int, excepted_port: int) -> None:
+    """Test parsing valid IPv6 addresses in bulk."""
+    batch = parse_ipv6_many([address])
+    assert batch.high[0] << 64 | batch.low[0] == excepted_address
+    assert list(batch.ports) == [excepted_port]
+    assert list(batch.valid) == [1]
+
+
+@pytest.mark.parametrize(
+    "address",
+    TEST_CASES_PARSE_IPV6_MANY_INVALID,
+)
+def test_parse_ipv6_many_invalid(address: str) -> None:
+    """Test that invalid IPv6 addresses are masked out."""
+    batch = parse_ipv6_many(["::1", address])
+    assert list(batch.valid) == [1, 0]
+    assert list(batch.high) == [0, 0]
+    assert list(batch.low) == [1, 0]
+    assert list(batch.ports) == [NO_PORT, NO_PORT]
+
+
+def test_parse_ipv6_many_matches_ipv6() -> None:
+    """Test that bulk parsing agrees with IPv6 across multiple chunks."""
+    addresses = [f"[2001:db8::{idx:x}:{idx * 7 % 65536:x}]:{idx}" for idx in range(10_000)]
+    addresses[5000] = "2001:db8::1::2"
+
+    batch = parse_ipv6_many(addresses)
+
+    assert batch.valid.count(0) == 1
+    assert batch.valid[5000] == 0
+    for idx, address in enumerate(addresses):
+        if idx != 5000:
+            ipv6 = IPv6(address)
+            assert batch.high[idx] << 64 | batch.low[idx] == ipv6.num
+            assert batch.ports[idx] == ipv6.port
+
+
+def test_parse_ipv6_many_to_numpy() -> None:
+    """Test converting an IPv6 batch into a NumPy structured array."""
+    np = pytest.importorskip("numpy")
+
+    records, mask = parse_ipv6_many(["[ffff::1]:80", "cheese"]).to_numpy()
+
+    assert records.dtype.names == ("hi", "lo", "port")
+    assert records["hi"].tolist() == [0xFFFF << 48, 0]
+    assert records["lo"].tolist() == [1, 0]
+    assert records["port"].tolist() == [80, NO_PORT]
+    assert mask.dtype == np.bool_
+    assert mask.tolist() == [True, False]
+
+
+@pytest.mark.parametrize(
+    ("num", "port", "excepted_output"),
+    TEST_CASES_FORMAT_IPV4_MANY,
+)
+def test_format_ipv4_many(num: int, port: int, excepted_output: str) -> None:
+    """Test formatting IPv4 addresses in bulk."""
+    assert format_ipv4_many([num], [port]) == [excepted_output]
+    if port == NO_PORT:
+        assert format_ipv4_many([num]) == [excepted_output]
+
+
+@pytest.mark.parametrize(
+    ("num", "port", "address_format", "excepted_output"),
+    TEST_CASES_FORMAT_IPV6_MANY,
+)
+def test_format_ipv6_many(num: int, port: int, address_format: AddressFormat, excepted_output: str) -> None:
+    """Test formatting IPv6 addresses in bulk."""
+    assert format_ipv6_many([num], [port], address_format) == [excepted_output]
+    if port == NO_PORT:
+        assert PureAddress(num).num_to_ipv6(address_format) == excepted_output
+
+
+def test_format_many_round_trip() -> None:
+    """Test that bulk formatting agrees with the address classes and bulk parsing across multiple chunks."""
+    rng = random.Random(0)  # noqa: S311
+    ipv4 = [rng.randint(0, IPV4_MAX_VALUE) for _ in range(10_000)]
+    ipv6 = [rng.randint(0, IPV6_MAX_VALUE) >> rng.choice((0, 16, 64, 112)) for _ in range(10_000)]
+    ports = [NO_PORT if idx % 3 else idx for idx in range(10_000)]
+
+    ipv4_texts = format_ipv4_many(ipv4, ports)
+    assert ipv4_texts == [
+        str(IPv4.from_int(num, None if port == NO_PORT else port)) for num, port in zip(ipv4, ports, strict=True)
+    ]
+    batch = parse_ipv4_many(ipv4_texts)
+    assert list(batch.addresses) == ipv4
+    assert list(batch.ports) == ports
+
+    for address_format in (
+        AddressFormat.DEFAULT,
+        AddressFormat.SHORTEN,
+        AddressFormat.REMOVE_ZEROES,
+        AddressFormat.SHORTEN | AddressFormat.REMOVE_ZEROES,
+    ):
+        ipv6_texts = format_ipv6_many(ipv6, address_format=address_format)
+        assert ipv6_texts == [PureAddress(num).num_to_ipv6(address_format) for num in ipv6]
+        ipv6_batch = parse_ipv6_many(ipv6_texts)
+        assert [high << 64 | low for high, low in zip(ipv6_batch.high, ipv6_batch.low, strict=True)] == ipv6
+
+
+def test_format_many_to_file() -> None:
+    """Test writing bulk formatted addresses to a file."""
+    file = io.StringIO()
+    assert format_ipv4_many(iter([1, 2]), iter([NO_PORT, 80]), file=file) is None
+    assert format_ipv6_many([1], file=file) is None
+    assert format_ipv6_many([], file=file) is None
+    assert file.getvalue() == "0.0.0.1\n0.0.0.2:80\n0:0:0:0:0:0:0:1\n"
+
+
+@pytest.mark.parametrize(
+    ("nums", "ports", "match_message"),
+    TEST_CASES_FORMAT_MANY_ERRORS,
+)
+def test_format_many_errors(nums: list[int], ports: list[int] | None, match_message: str) -> None:
+    """Test bulk formatting errors."""
+    with pytest.raises(ValueError, match=match_message):
+        format_ipv4_many(nums, ports)
+    with pytest.raises(ValueError, match=match_message):
+        format_ipv6_many(nums, ports)
+
+
+def test_format_many_out_of_range() -> None:
+    """Test bulk formatting values too large for the version."""
+    with pytest.raises(ValueError, match="valid ipv4 range"):
+        format_ipv4_many([IPV4_MAX_VALUE + 1])
+    with pytest.raises(ValueError, match="valid ipv6 range"):
+        format_ipv6_many([IPV6_MAX_VALUE + 1])
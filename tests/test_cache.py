@@ -0,0 +1,97 @@
+"""Unit tests for iplib3.cache."""
+
+import pytest
+
+from iplib3 import IPv4, IPv6
+from iplib3.address import FrozenIPv4, FrozenIPv6
+from iplib3.cache import AddressCache
+
+
+def test_address_cache_reuses_instances() -> None:
+    """Test that repeated inputs return the same instance."""
+    cache = AddressCache()
+
+    first = cache("127.0.0.1")
+    second = cache("127.0.0.1")
+
+    assert first is second
+    assert cache.hits == 1
+    assert cache.misses == 1
+    assert len(cache) == 1
+
+
+def test_address_cache_dispatch() -> None:
+    """Test that the cache creates frozen addresses of the right version."""
+    cache = AddressCache()
+
+    ipv4 = cache("127.0.0.1", 80)
+    ipv6 = cache("[::1]:8080")
+
+    assert isinstance(ipv4, FrozenIPv4)
+    assert isinstance(ipv6, FrozenIPv6)
+    assert ipv4 == IPv4("127.0.0.1:80")
+    assert ipv6 == IPv6("::1", 8080)
+
+
+def test_address_cache_port_is_part_of_key() -> None:
+    """Test that the same address with different ports gives different instances."""
+    cache = AddressCache()
+    assert cache("127.0.0.1") is not cache("127.0.0.1", 80)
+    assert cache("127.0.0.1", 80).port == 80
+
+
+def test_address_cache_eviction() -> None:
+    """Test that the least recently used address is evicted."""
+    cache = AddressCache(maxsize=2)
+
+    first = cache("10.0.0.1")
+    cache("10.0.0.2")
+    cache("10.0.0.1")
+    cache("10.0.0.3")
+
+    assert len(cache) == cache.maxsize == 2
+    assert cache("10.0.0.1") is first
+    assert cache.misses == 3
+
+    cache("10.0.0.2")
+    assert cache.misses == 4
+
+
+def test_address_cache_clear() -> None:
+    """Test clearing the cache."""
+    cache = AddressCache()
+    cache("10.0.0.1")
+    cache.clear()
+
+    assert len(cache) == cache.hits == cache.misses == 0
+    assert repr(cache) == "iplib3.AddressCache(maxsize=4096, size=0, hits=0, misses=0)"
+
+
+def test_address_cache_invalid_input() -> None:
+    """Test that invalid addresses are not cached."""
+    cache = AddressCache()
+
+    with pytest.raises(ValueError, match="Invalid IPv6 address format"):
+        cache("::G")
+    with pytest.raises(TypeError, match="Only string addresses can be cached"):
+        cache(0x7F_00_00_01)  # type: ignore[arg-type]
+
+    assert len(cache) == 0
+
+
+@pytest.mark.parametrize("maxsize", [0, -1, None])
+def test_address_cache_invalid_size(maxsize: int) -> None:
+    """Test that the cache size must be positive."""
+    with pytest.raises(ValueError, match="Cache size must be a positive integer"):
+        AddressCache(maxsize)
+
+
+def test_address_cache_instances_are_frozen() -> None:
+    """Test that cached addresses can't be changed through another reference."""
+    cache = AddressCache()
+    address = cache("127.0.0.1")
+
+    with pytest.raises(AttributeError, match="is immutable"):
+        address.port = 80
+
+    assert cache("127.0.0.1").port is None
@@ -1,10 +1,12 @@
 """Address test cases."""
 
 from iplib3 import IPAddress, IPv4, IPv6
-from iplib3.address import PureAddress
+from iplib3.address import FrozenIPv4, FrozenIPv6, LazyIPAddress, PureAddress
 from iplib3.constants import (
     IPV4_LOCALHOST,
+    IPV4_MAX_VALUE,
     IPV6_LOCALHOST,
+    IPV6_MAX_VALUE,
     PORT_NUMBER_MAX_VALUE,
 )
 from iplib3.constants.port import PORT_NUMBER_MIN_VALUE
@@ -132,6 +134,38 @@
     (IPAddress(IPV4_LOCALHOST), PureAddress(IPV4_LOCALHOST)),
 ]
 
+TEST_CASES_IPADDRESS_NUMERIC_EQUALITY: list[tuple[IPAddress, IPAddress | PureAddress, bool]] = [
+    (IPv6("::1"), IPv6.from_int(1), True),
+    (IPv6("[::1]:80"), IPv6.from_int(1, 80), True),
+    (IPv6("::1"), IPv6.from_int(1, 80), False),
+    (IPv4("0.0.0.1"), IPv6.from_int(1), False),
+    (IPAddress(IPV4_LOCALHOST), IPv4("127.0.0.1"), True),
+    (IPAddress(0xDEAD_DEAD_BEEF), IPv6.from_int(0xDEAD_DEAD_BEEF), True),
+    (IPv6("0:0::1"), IPv6.from_int(1), True),
+    (FrozenIPv4("127.0.0.1:80"), IPv4("127.0.0.1:80"), True),
+    (LazyIPAddress("127.0.0.1"), IPv4("127.0.0.1"), True),
+    (IPv4("127.0.0.1"), PureAddress(IPV4_LOCALHOST), True),
+]
+
+TEST_CASES_IPADDRESS_SORT_KEY: list[tuple[IPAddress, tuple[int, int, int]]] = [
+    (IPv4("127.0.0.1"), (4, IPV4_LOCALHOST, -1)),
+    (IPv4("127.0.0.1:80"), (4, IPV4_LOCALHOST, 80)),
+    (IPv6("[::1]:0"), (6, IPV6_LOCALHOST, 0)),
+    (IPAddress(IPV4_LOCALHOST), (4, IPV4_LOCALHOST, -1)),
+    (IPAddress(0xDEAD_DEAD_BEEF, 443), (6, 0xDEAD_DEAD_BEEF, 443)),
+]
+
+TEST_CASES_IPADDRESS_ORDERING: list[tuple[list[IPAddress], list[IPAddress]]] = [
+    (
+        [IPv4("10.0.0.2"), IPv4("10.0.0.1:80"), IPv4("9.255.255.255"), IPv4("10.0.0.1")],
+        [IPv4("9.255.255.255"), IPv4("10.0.0.1"), IPv4("10.0.0.1:80"), IPv4("10.0.0.2")],
+    ),
+    (
+        [IPv6("::2"), IPv4("255.255.255.255"), IPv6("[::1]:80"), IPv4("0.0.0.1")],
+        [IPv4("0.0.0.1"), IPv4("255.255.255.255"), IPv6("[::1]:80"), IPv6("::2")],
+    ),
+]
+
 TEST_CASES_IPADDRESS_STRING = [
     (IPAddress(), IP_ADDRESS_MASK[2]),
     (IPAddress(IPV4_LOCALHOST), IP_ADDRESS_MASK[2]),
@@ -179,6 +213,18 @@
     (IPv4(IPV4_MASK[3]), 0xC0_A8_00_01),
 ]
 
+TEST_CASES_IPV4_FROM_INT: list[tuple[int, int | None, str]] = [
+    (IPV4_LOCALHOST, None, IPV4_MASK[0]),
+    (IPV4_LOCALHOST, 80, IPV4_MASK[1]),
+    (0xC0_A8_00_01, None, IPV4_MASK[3]),
+    (IPV4_MAX_VALUE, None, "255.255.255.255"),
+]
+
+TEST_CASES_IPV4_FROM_INT_ERRORS: list[tuple[int, type[Exception], str]] = [
+    (-1, ValueError, "not in valid IPv4 range"),
+    (IPV4_MAX_VALUE + 1, ValueError, "not in valid IPv4 range"),
+]
+
 TEST_CASES_IPV6 = [
     IPv6(),
     IPv6(IPV6_MASK[0]),
@@ -201,6 +247,17 @@
     (IPV6_MASK[4], 0x70_0000_0000_0000_0000_0000_0000_0000),
 ]
 
+TEST_CASES_IPV6_FROM_INT: list[tuple[int, int | None, str]] = [
+    (IPV6_LOCALHOST, None, IPV6_MASK[2]),
+    (0x2606_4700_4700_0000_0000_0000_0000_1111, 80, "[2606:4700:4700:0:0:0:0:1111]:80"),
+    (IPV6_MAX_VALUE, None, ":".join(["FFFF"] * 8)),
+]
+
+TEST_CASES_IPV6_FROM_INT_ERRORS: list[tuple[int, type[Exception], str]] = [
+    (-1, ValueError, "not in valid IPv6 range"),
+    (IPV6_MAX_VALUE + 1, ValueError, "not in valid IPv6 range"),
+]
+
 TEST_CASES_IPV6_IPV6_TO_NUM_ERRORS = [
     # Two zero-skips
     ("::DE::AD", ValueError, "Invalid IPv6 address format; only one zero-skip allowed"),
@@ -212,4 +269,57 @@
     ("::7:FFFFF", ValueError, "Invalid IPv6 address format; segment max value "),
     # Segment value too low (negative)
     ("::7:-34", ValueError, "Invalid IPv6 address format; segment min value "),
+    # Too few segments
+    ("1:2:3", ValueError, "Invalid IPv6 address format; too few segments "),
+    # Port out of range
+    ("[::1]:70000", ValueError, r"Invalid IPv6 address format; port not in valid range \(0-65535\)"),
+    # Port not an integer
+    ("[::1]:http", ValueError, "Invalid IPv6 address format; port is not a valid integer"),
+]
+
+TEST_CASES_IPV4_IPV4_TO_NUM_ERRORS = [
+    # Segment value too high
+    ("999.1.1.1", ValueError, "Invalid IPv4 address format; segment max value "),
+    # Too many segments
+    ("1.1.1.1.1", ValueError, "Invalid IPv4 address format; too many segments "),
+    # Invalid integer
+    ("1.1.one.1", ValueError, "Invalid IPv4 address format; address contains invalid characters"),
+    # Port out of range
+    ("1.1.1.1:70000", ValueError, r"Invalid IPv4 address format; port not in valid range \(0-65535\)"),
+    # Port not an integer
+    ("1.1.1.1:http", ValueError, "Invalid IPv4 address format; port is not a valid integer"),
+]
+
+TEST_CASES_LAZY_IPADDRESS: list[tuple[str, int | None, type[IPAddress], str]] = [
+    (IPV4_MASK[0], None, IPv4, IPV4_MASK[0]),
+    (IPV4_MASK[1], None, IPv4, IPV4_MASK[1]),
+    (IPV4_MASK[0], 80, IPv4, IPV4_MASK[1]),
+    (IPV6_MASK[0], None, IPv6, IPV6_MASK[0]),
+    (IPV6_MASK[1], 8080, IPv6, IPV6_MASK[3]),
+]
+
+TEST_CASES_PACKED: list[tuple[type[IPv4 | IPv6], int, bytes]] = [
+    (IPv4, 0x7F_00_00_01, b"\x7f\x00\x00\x01"),
+    (IPv4, 0, bytes(4)),
+    (IPv4, IPV4_MAX_VALUE, b"\xff" * 4),
+    (IPv6, 1, bytes(15) + b"\x01"),
+    (IPv6, 0x2001_0DB8 << 96, b"\x20\x01\x0d\xb8" + bytes(12)),
+    (IPv6, IPV6_MAX_VALUE, b"\xff" * 16),
+]
+
+TEST_CASES_FROM_BYTES_ERRORS: list[tuple[type[IPv4 | IPv6], object, type[Exception], str]] = [
+    (IPv4, b"\x7f\x00\x01", ValueError, "IPv4 addresses are 4 bytes long, got 3"),
+    (IPv4, bytes(16), ValueError, "IPv4 addresses are 4 bytes long, got 16"),
+    (IPv6, bytes(4), ValueError, "IPv6 addresses are 16 bytes long, got 4"),
+    (IPv4, "abcd", TypeError, "cannot convert 'str' object to bytes"),
+]
+
+TEST_CASES_PICKLE: list[IPAddress] = [
+    IPAddress(IPV4_LOCALHOST),
+    IPv4(IPV4_MASK[0]),
+    IPv4(IPV4_MASK[1]),
+    IPv6(IPV6_MASK[3]),
+    FrozenIPv4(IPV4_MASK[1]),
+    FrozenIPv6(IPV6_MASK[0]),
+    LazyIPAddress(IPV6_MASK[3]),
 ]
@@ -0,0 +1,48 @@
+"""Address array test cases."""
+
+from iplib3.constants import IPV4_MAX_VALUE, IPV6_MAX_VALUE
+from iplib3.constants.subnet import SubnetType
+
+IPV4_NUMS = [
+    0x7F_00_00_01,
+    0x0A_00_00_01,
+    0x0A_00_00_02,
+    0x0A_00_00_01,
+    0x00_00_00_00,
+]
+
+IPV6_NUMS = [
+    0x2606_4700_4700_0000_0000_0000_0000_1111,
+    0x1,
+    IPV6_MAX_VALUE,
+    0xDEAD_BEEF,
+]
+
+TEST_CASES_IPADDRESS_ARRAY_SET_OPERATIONS: list[tuple[list[int], list[int], str, list[int]]] = [
+    ([3, 1, 2], [4, 2, 3], "union", [1, 2, 3, 4]),
+    ([3, 1, 2, 2], [4, 2, 3], "intersection", [2, 3]),
+    ([3, 1, 2, 1], [4, 2, 3], "difference", [1]),
+    ([], [1], "union", [1]),
+    ([], [1], "intersection", []),
+]
+
+TEST_CASES_IPADDRESS_ARRAY_ERRORS: list[tuple[tuple, type[Exception], str]] = [
+    (([IPV4_MAX_VALUE + 1],), ValueError, "not in valid IPv4 range"),
+    (([-1], SubnetType.IPV6), ValueError, "not in valid IPv6 range"),
+    (([1, 2], SubnetType.IPV4, [80]), ValueError, "Got 1 ports for 2 addresses"),
+    (([1], "ipv5"), ValueError, "Invalid subnet type"),
+    (([IPV4_MAX_VALUE + 1], SubnetType.IPV4, [80]), ValueError, "not in valid IPv4 range"),
+    (([1 << 200], SubnetType.IPV6), ValueError, "not in valid IPv6 range"),
+    (([1], SubnetType.IPV4, [-2]), ValueError, "Port numbers not in valid range"),
+    (([1], SubnetType.IPV4, [70000]), ValueError, "Port numbers not in valid range"),
+    (([1], SubnetType.IPV6, [131071]), ValueError, "Port numbers not in valid range"),
+    (([1], SubnetType.IPV4, [1 << 40]), ValueError, "Port numbers not in valid range"),
+]
+
+TEST_CASES_IPADDRESS_ARRAY_FROM_BYTES_ERRORS: list[tuple[tuple, type[Exception], str]] = [
+    ((bytes(5),), ValueError, "ipv4 address data must be a multiple of 4 bytes long, got 5"),
+    ((bytes(8), SubnetType.IPV6), ValueError, "ipv6 address data must be a multiple of 16 bytes long, got 8"),
+    ((bytes(8), SubnetType.IPV4, bytes(4)), ValueError, "Got 1 ports for 2 addresses"),
+    ((bytes(4), SubnetType.IPV4, (65536).to_bytes(4, "big")), ValueError, "Port numbers not in valid range"),
+    ((bytes(4), SubnetType.IPV4, (-2).to_bytes(4, "big", signed=True)), ValueError, "Port numbers not in valid range"),
+]
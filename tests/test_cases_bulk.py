@@ -0,0 +1,114 @@
+"""Bulk test cases."""
+
+from iplib3.address import AddressFormat
+from iplib3.bulk import NO_PORT
+from iplib3.constants import (
+    IPV4_LOCALHOST,
+    IPV4_MAX_VALUE,
+    IPV6_LOCALHOST,
+    IPV6_MAX_VALUE,
+    PORT_NUMBER_MAX_VALUE,
+)
+
+TEST_CASES_PARSE_IPV4_MANY: list[tuple[str, int, int]] = [
+    ("127.0.0.1", IPV4_LOCALHOST, NO_PORT),
+    ("127.0.0.1:80", IPV4_LOCALHOST, 80),
+    ("0.0.0.0", 0, NO_PORT),  # noqa: S104
+    ("255.255.255.255", IPV4_MAX_VALUE, NO_PORT),
+    ("192.168.0.1:8080", 0xC0_A8_00_01, 8080),
+    (f"192.168.0.1:{PORT_NUMBER_MAX_VALUE}", 0xC0_A8_00_01, PORT_NUMBER_MAX_VALUE),
+    (" 10.0.0.1 ", 0x0A_00_00_01, NO_PORT),
+    ("010.0.0.1", 0x0A_00_00_01, NO_PORT),
+    ("1.2.3.4:80:90", 0x01_02_03_04, 80),
+]
+
+TEST_CASES_PARSE_IPV4_MANY_INVALID: list[str | int] = [
+    "256.0.0.1",
+    "1.2.3",
+    "1.2.3.4.5",
+    "DE.AD.BE.EF",
+    "1.2.3.4:",
+    "1.2.3.4:-1",
+    "1.2.3.4:http",
+    f"1.2.3.4:{PORT_NUMBER_MAX_VALUE + 1}",
+    "::1",
+    "",
+    IPV4_LOCALHOST,
+]
+
+TEST_CASES_PARSE_IPV6_MANY: list[tuple[str, int, int]] = [
+    ("::1", IPV6_LOCALHOST, NO_PORT),
+    ("[::1]:80", IPV6_LOCALHOST, 80),
+    ("::", 0, NO_PORT),
+    ("70::", 0x70 << 112, NO_PORT),
+    ("2606:4700:4700::1111", 0x2606_4700_4700_0000_0000_0000_0000_1111, NO_PORT),
+    ("[2606:4700:4700::1111]:8080", 0x2606_4700_4700_0000_0000_0000_0000_1111, 8080),
+    ("0:0:0:0:DEAD:C0DE:1057:BE17", 0xDEAD_C0DE_1057_BE17, NO_PORT),
+    ("1::2:3:4:5:6:7:8", 0x0001_0002_0003_0004_0005_0006_0007_0008, NO_PORT),
+    (" ::dead:beef ", 0xDEAD_BEEF, NO_PORT),
+    ("FFFF:FFFF:FFFF:FFFF:FFFF:FFFF:FFFF:FFFF", IPV6_MAX_VALUE, NO_PORT),
+]
+
+TEST_CASES_PARSE_IPV6_MANY_INVALID: list[str | int] = [
+    "1:2:3",
+    "1::2::3",
+    "1:2:3:4:5:6:7:8:9",
+    "::10000",
+    "::12:34:56:GG",
+    "[::1]",
+    "[::1]:",
+    "[::1]:-1",
+    f"[::1]:{PORT_NUMBER_MAX_VALUE + 1}",
+    "::ffff:127.0.0.1",
+    "127.0.0.1",
+    IPV6_LOCALHOST,
+]
+
+TEST_CASES_FORMAT_IPV4_MANY: list[tuple[int, int, str]] = [
+    (IPV4_LOCALHOST, NO_PORT, "127.0.0.1"),
+    (IPV4_LOCALHOST, 80, "127.0.0.1:80"),
+    (0, NO_PORT, ".".join("0000")),
+    (IPV4_MAX_VALUE, PORT_NUMBER_MAX_VALUE, f"255.255.255.255:{PORT_NUMBER_MAX_VALUE}"),
+    (0x0A_00_FF_01, 0, "10.0.255.1:0"),
+]
+
+TEST_CASES_FORMAT_IPV6_MANY: list[tuple[int, int, AddressFormat, str]] = [
+    (IPV6_LOCALHOST, NO_PORT, AddressFormat.SHORTEN, "0:0:0:0:0:0:0:1"),
+    (IPV6_LOCALHOST, 80, AddressFormat.SHORTEN, "[0:0:0:0:0:0:0:1]:80"),
+    (IPV6_LOCALHOST, NO_PORT, AddressFormat.DEFAULT, "0000:0000:0000:0000:0000:0000:0000:0001"),
+    (IPV6_LOCALHOST, NO_PORT, AddressFormat.SHORTEN | AddressFormat.REMOVE_ZEROES, "::1"),
+    (IPV6_LOCALHOST, 443, AddressFormat.REMOVE_ZEROES, "[::0001]:443"),
+    (0, NO_PORT, AddressFormat.SHORTEN | AddressFormat.REMOVE_ZEROES, "::"),
+    (IPV6_MAX_VALUE, NO_PORT, AddressFormat.SHORTEN | AddressFormat.REMOVE_ZEROES, ":".join(["FFFF"] * 8)),
+    # A lone zero segment is kept
+    (
+        0x2001_0DB8_0000_0001_0001_0001_0001_0001,
+        NO_PORT,
+        AddressFormat.SHORTEN | AddressFormat.REMOVE_ZEROES,
+        "2001:DB8:0:1:1:1:1:1",
+    ),
+    # The longest run is removed
+    (
+        0x2001_0000_0000_0001_0000_0000_0000_0001,
+        NO_PORT,
+        AddressFormat.SHORTEN | AddressFormat.REMOVE_ZEROES,
+        "2001:0:0:1::1",
+    ),
+    # The first of equally long runs is removed
+    (
+        0x2001_0DB8_0000_0000_0001_0000_0000_0001,
+        NO_PORT,
+        AddressFormat.SHORTEN | AddressFormat.REMOVE_ZEROES,
+        "2001:DB8::1:0:0:1",
+    ),
+    (0x2001_0DB8_0000_0000_0001_0000_0000_0001, NO_PORT, AddressFormat.REMOVE_ZEROES, "2001:0DB8::0001:0000:0000:0001"),
+    (0x2001_0DB8 << 96, NO_PORT, AddressFormat.SHORTEN | AddressFormat.REMOVE_ZEROES, "2001:DB8::"),
+]
+
+TEST_CASES_FORMAT_MANY_ERRORS: list[tuple[list[int], list[int] | None, str]] = [
+    ([-1], None, "valid ipv"),
+    ([1, 2], [NO_PORT], "differ in length"),
+    ([1], [NO_PORT, 80], "differ in length"),
+    ([1], [PORT_NUMBER_MAX_VALUE + 1], "not in valid range"),
+    ([1], [-2], "not in valid range"),
+]
@@ -0,0 +1,22 @@
+"""Range index test cases."""
+
+from iplib3.constants.subnet import SubnetType
+
+TEST_CASES_BUILD_RANGE_INDEX_ERRORS: list[tuple[list, SubnetType, type[Exception], str]] = [
+    ([("10.0.0.0", 8), ("9.0.0.0", 8)], SubnetType.IPV4, ValueError, "Ranges must be sorted and must not overlap"),
+    ([("10.0.0.0", 8), ("10.1.0.0", 16)], SubnetType.IPV4, ValueError, "Ranges must be sorted and must not overlap"),
+    ([("10.0.0.0", 8), ("10.0.0.0", 8)], SubnetType.IPV4, ValueError, "Ranges must be sorted and must not overlap"),
+    ([("2001:db8::", 32)], SubnetType.IPV4, ValueError, "Cannot add ipv6 network '2001:DB8:0:0:0:0:0:0/32'"),
+    ([("10.0.0.0", 8)], SubnetType.IPV6, ValueError, "Cannot add ipv4 network '10.0.0.0/8' to an index of ipv6"),
+    ([("10.0.0.0", 8)], "ipv5", ValueError, "Invalid subnet type"),
+]
+
+TEST_CASES_RANGE_INDEX_FILE_ERRORS: list[tuple[bytes, str]] = [
+    (b"", "is not an iplib3 range index"),
+    (b"IPLIB3RI", "is not an iplib3 range index"),
+    (b"NOTANIDX" + bytes(24), "is not an iplib3 range index"),
+    (b"IPLIB3RI\x01\x05" + bytes(22), "is not an iplib3 range index"),
+    (b"IPLIB3RI\x02\x04" + bytes(22), "unsupported format version: 2"),
+    (b"IPLIB3RI\x01\x04" + bytes(6) + (1).to_bytes(8, "big") + (48).to_bytes(8, "big"), "truncated or corrupted"),
+    (b"IPLIB3RI\x01\x04" + bytes(6) + (0).to_bytes(8, "big") + (40).to_bytes(8, "big"), "truncated or corrupted"),
+]
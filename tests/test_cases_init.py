@@ -0,0 +1,28 @@
+"""Package test cases."""
+
+# Every name the package exposed when it star-imported address, subnet and validators,
+# except those the submodules imported from the standard library (annotations, importlib, overload)
+TEST_CASES_BASELINE_NAMES: list[str] = [
+    "IPAddress",
+    "IPV4_MAX_SUBNET_VALUE",
+    "IPV4_MIN_SEGMENT_COUNT",
+    "IPV4_MIN_SUBNET_VALUE",
+    "IPV4_SEGMENT_BIT_COUNT",
+    "IPV6_MAX_SUBNET_VALUE",
+    "IPV6_MIN_SUBNET_VALUE",
+    "IPv4",
+    "IPv6",
+    "PureSubnetMask",
+    "SubnetMask",
+    "SubnetType",
+    "__version__",
+    "address",
+    "constants",
+    "ip_validator",
+    "ipv4_validator",
+    "ipv6_validator",
+    "port_validator",
+    "subnet",
+    "subnet_validator",
+    "validators",
+]
@@ -0,0 +1,42 @@
+"""Network test cases."""
+
+from iplib3.constants import IPV4_MAX_VALUE, IPV6_MAX_VALUE
+from iplib3.constants.subnet import SubnetType
+from iplib3.subnet import SubnetMask
+
+TEST_CASES_IPNETWORK: list[tuple[tuple, str, int, int, SubnetType]] = [
+    (("10.0.0.0/8",), "10.0.0.0/8", 0x0A_00_00_00, 0x0A_FF_FF_FF, SubnetType.IPV4),
+    (("10.0.0.0", 8), "10.0.0.0/8", 0x0A_00_00_00, 0x0A_FF_FF_FF, SubnetType.IPV4),
+    (("192.168.1.0", "255.255.255.0"), "192.168.1.0/24", 0xC0_A8_01_00, 0xC0_A8_01_FF, SubnetType.IPV4),
+    (("192.168.1.0", SubnetMask(24, SubnetType.IPV4)), "192.168.1.0/24", 0xC0_A8_01_00, 0xC0_A8_01_FF, SubnetType.IPV4),
+    (("0.0.0.0/0",), "0.0.0.0/0", 0, IPV4_MAX_VALUE, SubnetType.IPV4),
+    (("127.0.0.1",), "127.0.0.1/32", 0x7F_00_00_01, 0x7F_00_00_01, SubnetType.IPV4),
+    (("127.0.0.1/32",), "127.0.0.1/32", 0x7F_00_00_01, 0x7F_00_00_01, SubnetType.IPV4),
+    (("10.1.2.3/8",), "10.0.0.0/8", 0x0A_00_00_00, 0x0A_FF_FF_FF, SubnetType.IPV4),
+    (
+        ("2001:db8::/32",),
+        "2001:DB8:0:0:0:0:0:0/32",
+        0x2001_0DB8 << 96,
+        0x2001_0DB8 << 96 | (1 << 96) - 1,
+        SubnetType.IPV6,
+    ),
+    (("::/0",), "0:0:0:0:0:0:0:0/0", 0, IPV6_MAX_VALUE, SubnetType.IPV6),
+    (("::1/128",), "0:0:0:0:0:0:0:1/128", 1, 1, SubnetType.IPV6),
+]
+
+TEST_CASES_IPNETWORK_ERRORS: list[tuple[tuple, type[Exception], str]] = [
+    (("10.0.0.1/8",), ValueError, "has host bits set"),
+    (("10.0.0.0/8", 8), ValueError, "Subnet mask given twice"),
+    (("10.0.0.0/33",), ValueError, "not in valid range"),
+    (("::/129",), ValueError, "not in valid range"),
+    (("10.0.0.0", SubnetMask(64)), ValueError, "not valid for ipv4"),
+    ((42,), TypeError, "Invalid type for network address"),
+]
+
+TEST_CASES_IPNETWORK_HOSTS: list[tuple[str, list[str]]] = [
+    ("10.0.0.0/30", ["10.0.0.1", "10.0.0.2"]),
+    ("10.0.0.0/31", ["10.0.0.0", "10.0.0.1"]),
+    ("10.0.0.1/32", ["10.0.0.1"]),
+    ("2001:db8::/126", ["2001:db8::1", "2001:db8::2", "2001:db8::3"]),
+    ("2001:db8::/127", ["2001:db8::", "2001:db8::1"]),
+]
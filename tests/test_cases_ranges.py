@@ -0,0 +1,19 @@
+"""Address range set test cases."""
+
+TEST_CASES_TO_CIDRS: list[tuple[list, list[tuple[str, int | None]]]] = [
+    (["10.0.0.0/24", "10.0.1.0/24"], [("10.0.0.0", 23)]),
+    (["10.0.0.1", "10.0.0.2", "10.0.0.3"], [("10.0.0.1", None), ("10.0.0.2", 31)]),
+    ([("10.0.0.0", "10.0.0.255"), "10.0.1.0"], [("10.0.0.0", 24), ("10.0.1.0", None)]),
+    ([("0.0.0.0", "255.255.255.255")], [("0.0.0.0", 0)]),  # noqa: S104
+    (["192.168.0.0/16", "192.168.1.0/24"], [("192.168.0.0", 16)]),
+    ([], []),
+]
+
+TEST_CASES_RANGE_SET_ERRORS: list[tuple[object, type[Exception], str]] = [
+    ("::1", ValueError, "Cannot add ipv6 address"),
+    ("::/64", ValueError, "Cannot add ipv6 network"),
+    (2**32, ValueError, "not in valid ipv4 range"),
+    ((5, 4), ValueError, "is after its end"),
+    ((1, 2, 3), ValueError, "must be \\(first, last\\) pairs"),
+    (1.5, TypeError, "Invalid type for address range"),
+]
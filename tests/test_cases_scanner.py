@@ -0,0 +1,40 @@
+"""Scanner test cases."""
+
+from itertools import cycle
+
+from iplib3.constants import IPV4_LOCALHOST, IPV6_LOCALHOST
+from iplib3.constants.subnet import SubnetType
+
+TEST_CASES_SCAN: list[tuple[str, list[tuple[int, int, int | None, SubnetType]]]] = [
+    ("127.0.0.1", [(0, IPV4_LOCALHOST, None, SubnetType.IPV4)]),
+    ("GET from 127.0.0.1:8080 ok", [(9, IPV4_LOCALHOST, 8080, SubnetType.IPV4)]),
+    ("(10.0.0.1)", [(1, 0x0A_00_00_01, None, SubnetType.IPV4)]),
+    ("host=[::1]:443;", [(5, IPV6_LOCALHOST, 443, SubnetType.IPV6)]),
+    ("host=[::1]", [(5, IPV6_LOCALHOST, None, SubnetType.IPV6)]),
+    (
+        "src 2001:db8::1 dst ::1",
+        [(4, 0x2001_0DB8 << 96 | 1, None, SubnetType.IPV6), (20, IPV6_LOCALHOST, None, SubnetType.IPV6)],
+    ),
+    ("1.2.3.4, 5.6.7.8.", [(0, 0x01_02_03_04, None, SubnetType.IPV4), (9, 0x05_06_07_08, None, SubnetType.IPV4)]),
+    ("1.2.3.4:99999", [(0, 0x01_02_03_04, None, SubnetType.IPV4)]),
+    ("[::1]:99999", [(0, IPV6_LOCALHOST, None, SubnetType.IPV6)]),
+]
+
+TEST_CASES_SCAN_NOTHING: list[str] = [
+    "",
+    "no addresses here",
+    "999.1.1.1",
+    "1.2.3.4.5",
+    "v1.2.3.4",
+    "12:34:56",
+    "00:1a:2b:3c:4d:5e",
+    "std::vector",
+    "1:2:3:4:5:6:7:8:9",
+]
+
+# Addresses with and without ports and brackets, mixed with look-alikes and runs of filler of varying length
+TEST_CASES_SCAN_CORPUS = "".join(
+    f"{idx} {text} {'-' * (idx * 7 % 41)}[2001:db8:85a3::8a2e:370:{idx:x}]:{8000 + idx} "
+    f"{'x' * (idx % 23)} [fe80::{idx:x}] 10.{idx}.0.1:{idx} {look_alike}\n"
+    for idx, ((text, _), look_alike) in enumerate(zip(TEST_CASES_SCAN * 4, cycle(TEST_CASES_SCAN_NOTHING)))
+)
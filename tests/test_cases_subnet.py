@@ -82,3 +82,27 @@
     (24, SubnetType.IPV6, ValueError, "IPv6 does not support string representations of subnet masks"),
     (IPV4_MAX_SUBNET_VALUE + 1, SubnetType.IPV4, ValueError, "Invalid subnet value for IPv4: "),
 ]
+
+TEST_CASES_SUBNET_MASK_SINGLETON: list[
+    tuple[tuple[int | str | None, SubnetType], tuple[int | str | None, SubnetType]]
+] = [
+    ((24, SubnetType.IPV4), (SUBNET_MASKS[0], SubnetType.IPV4)),
+    ((24, SubnetType.IPV4), ("24", SubnetType.IPV4)),
+    ((SUBNET_MASKS[0], SubnetType.IPV6), ("255.255.255.0", SubnetType.IPV4)),
+    ((64, SubnetType.IPV6), (64, "ipv6")),
+    ((None, SubnetType.IPV4), (None, SubnetType.IPV4)),
+]
+
+TEST_CASES_SUBNET_MASK_DISTINCT: list[
+    tuple[tuple[int | str | None, SubnetType], tuple[int | str | None, SubnetType]]
+] = [
+    ((24, SubnetType.IPV4), (24, SubnetType.IPV6)),
+    ((24, SubnetType.IPV4), (25, SubnetType.IPV4)),
+    ((None, SubnetType.IPV4), (None, SubnetType.IPV6)),
+]
+
+TEST_CASES_SUBNET_MASK_NON_CANONICAL_STRING: list[tuple[str, int]] = [
+    (" 255.255.255.0", 24),
+    ("255.255.255.000", 24),
+    (".".join("0000"), 0),
+]
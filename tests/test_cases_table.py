@@ -0,0 +1,26 @@
+"""Prefix table test cases."""
+
+TEST_CASES_PREFIX_TABLE = [
+    ("0.0.0.0/0", "default"),
+    ("10.0.0.0/8", "private"),
+    ("10.1.0.0/16", "office"),
+    ("10.1.2.0/24", "lab"),
+    ("10.1.2.3/32", "host"),
+    ("10.1.2.128/25", "rack"),
+    ("192.168.0.0/16", "home"),
+    ("2001:db8::/32", "documentation"),
+    ("2001:db8:1::/48", "site"),
+]
+
+TEST_CASES_PREFIX_TABLE_LOOKUP: list[tuple[str, str | None]] = [
+    ("10.1.2.3", "host"),
+    ("10.1.2.4", "lab"),
+    ("10.1.2.200", "rack"),
+    ("10.1.3.1", "office"),
+    ("10.2.0.1", "private"),
+    ("192.168.255.255", "home"),
+    ("8.8.8.8", "default"),
+    ("2001:db8:1::1", "site"),
+    ("2001:db8:2::1", "documentation"),
+    ("::1", None),
+]
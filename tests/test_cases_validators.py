@@ -12,7 +12,8 @@
     PORT_NUMBER_MAX_VALUE,
     PORT_NUMBER_MIN_VALUE,
 )
-from iplib3.validators import ValidationMode
+from iplib3.constants.subnet import SubnetType
+from iplib3.validators import AddressKind, ParsedAddress, ParseErrorCode, ValidationMode
 
 VALID_IPV4_ADDRESSES_STRICT = [
     "127.0.0.1",
@@ -241,3 +242,47 @@
     ("2606:4700:4700::1111", "ipv6", "2606:4700:4700::1111", PORT_NUMBERS_VALID[0], True),
     ("::DEAD:BEEF", "ipv6", "::DEAD:BEEF", PORT_NUMBERS_VALID[0], True),
 ]
+
+TEST_CASES_VALIDATE_MANY: list[tuple[str | int, ValidationMode, AddressKind, int]] = [
+    ("127.0.0.1", ValidationMode.STRICT, AddressKind.IPV4, 0x7F_00_00_01),
+    ("127.0.0.1:80", ValidationMode.STRICT, AddressKind.IPV4_ENDPOINT, 0x7F_00_00_01),
+    ("::1", ValidationMode.STRICT, AddressKind.IPV6, 1),
+    ("[::1]:80", ValidationMode.STRICT, AddressKind.IPV6_ENDPOINT, 1),
+    ("2001:db8::", ValidationMode.STRICT, AddressKind.IPV6, 0x2001_0DB8 << 96),
+    (IPV4_MAX_VALUE, ValidationMode.STRICT, AddressKind.IPV4, IPV4_MAX_VALUE),
+    (IPV4_MAX_VALUE + 1, ValidationMode.STRICT, AddressKind.IPV6, IPV4_MAX_VALUE + 1),
+    (IPV6_MAX_VALUE + 1, ValidationMode.STRICT, AddressKind.INVALID, 0),
+    ("256.0.0.1", ValidationMode.STRICT, AddressKind.INVALID, 0),
+    ("256.0.0.1", ValidationMode.RELAXED, AddressKind.IPV4, 256 << 24 | 1),
+    ("1.2.3.4:70000", ValidationMode.STRICT, AddressKind.INVALID, 0),
+    ("1.2.3.4:70000", ValidationMode.RELAXED, AddressKind.IPV4_ENDPOINT, 0x01_02_03_04),
+    ("[::1]:70000", ValidationMode.RELAXED, AddressKind.IPV6_ENDPOINT, 1),
+    ("1:2:3", ValidationMode.STRICT, AddressKind.INVALID, 0),
+    ("1::2::3", ValidationMode.STRICT, AddressKind.INVALID, 0),
+    ("[::1]", ValidationMode.STRICT, AddressKind.INVALID, 0),
+    ("not an address", ValidationMode.RELAXED, AddressKind.INVALID, 0),
+]
+
+TEST_CASES_TRY_PARSE: list[tuple[str | int, ValidationMode, SubnetType | None, ParsedAddress | ParseErrorCode]] = [
+    ("127.0.0.1", ValidationMode.STRICT, None, ParsedAddress(SubnetType.IPV4, 0x7F_00_00_01, None)),
+    ("127.0.0.1:80", ValidationMode.STRICT, None, ParsedAddress(SubnetType.IPV4, 0x7F_00_00_01, 80)),
+    ("[::1]:80", ValidationMode.STRICT, None, ParsedAddress(SubnetType.IPV6, 1, 80)),
+    ("::1", ValidationMode.STRICT, SubnetType.IPV6, ParsedAddress(SubnetType.IPV6, 1, None)),
+    (1, ValidationMode.STRICT, None, ParsedAddress(SubnetType.IPV4, 1, None)),
+    (1, ValidationMode.STRICT, SubnetType.IPV6, ParsedAddress(SubnetType.IPV6, 1, None)),
+    (IPV4_MAX_VALUE + 1, ValidationMode.STRICT, SubnetType.IPV4, ParseErrorCode.VALUE_OUT_OF_RANGE),
+    (IPV6_MAX_VALUE + 1, ValidationMode.STRICT, None, ParseErrorCode.VALUE_OUT_OF_RANGE),
+    (1.0, ValidationMode.STRICT, None, ParseErrorCode.INVALID_TYPE),
+    ("999.1.1.1", ValidationMode.STRICT, None, ParseErrorCode.SEGMENT_TOO_HIGH),
+    ("999.1.1.1", ValidationMode.RELAXED, None, ParsedAddress(SubnetType.IPV4, 999 << 24 | 0x01_01_01, None)),
+    ("-1.1.1.1", ValidationMode.STRICT, None, ParseErrorCode.SEGMENT_TOO_LOW),
+    ("1.1.1", ValidationMode.STRICT, None, ParseErrorCode.TOO_FEW_SEGMENTS),
+    ("1.1.1.1.1", ValidationMode.STRICT, None, ParseErrorCode.TOO_MANY_SEGMENTS),
+    ("1.1.a.1", ValidationMode.STRICT, None, ParseErrorCode.INVALID_CHARACTERS),
+    ("1.1.1.1:http", ValidationMode.STRICT, None, ParseErrorCode.INVALID_PORT),
+    ("1.1.1.1:70000", ValidationMode.STRICT, None, ParseErrorCode.PORT_OUT_OF_RANGE),
+    ("1::2::3", ValidationMode.STRICT, None, ParseErrorCode.MULTIPLE_ZERO_SKIPS),
+    ("1:2:3", ValidationMode.STRICT, None, ParseErrorCode.TOO_FEW_SEGMENTS),
+    ("::FFFFF", ValidationMode.STRICT, None, ParseErrorCode.SEGMENT_TOO_HIGH),
+    ("::FFFFF", ValidationMode.RELAXED, None, ParsedAddress(SubnetType.IPV6, 0xFFFFF, None)),
+]
@@ -0,0 +1,222 @@
+"""Unit tests for iplib3.index."""
+
+import pickle
+from pathlib import Path
+
+import pytest
+
+from iplib3 import IPAddress, IPv4, IPv6, LazyIPAddress
+from iplib3.constants.subnet import SubnetType
+from iplib3.index import NO_MATCH, IndexRecord, MmapRangeIndex, build_range_index
+from iplib3.ranges import AddressRangeSet
+from iplib3.subnet import SubnetMask
+from tests.test_cases_index import TEST_CASES_BUILD_RANGE_INDEX_ERRORS, TEST_CASES_RANGE_INDEX_FILE_ERRORS
+
+IPV4_RANGES = [
+    (IPv4("10.0.0.0"), 8, b"private"),
+    (IPv4("100.64.0.0"), 10, b"shared"),
+    (IPv4("127.0.0.0"), 8, b"loopback"),
+    (IPv4("172.16.0.0"), 12, b"private"),
+    (IPv4("192.168.1.77"), SubnetMask(24), b"private"),
+]
+
+
+@pytest.fixture
+def ipv4_index(tmp_path: Path):
+    """Build and open an index of IPv4 ranges."""
+    path = tmp_path / "ipv4.idx"
+    build_range_index(path, IPV4_RANGES)
+    with MmapRangeIndex(path) as index:
+        yield index
+
+
+def test_range_index_ipv4(ipv4_index: MmapRangeIndex) -> None:
+    """Test looking up IPv4 addresses."""
+    assert len(ipv4_index) == len(IPV4_RANGES)
+    assert ipv4_index.version == SubnetType.IPV4
+    assert ipv4_index.find("10.0.0.0") == 0
+    assert ipv4_index.find(IPv4("10.255.255.255")) == 0
+    assert ipv4_index.find(0x7F_00_00_01) == 2
+    assert ipv4_index.find("192.168.1.1") == 4
+    assert ipv4_index.find("11.0.0.0") == NO_MATCH
+    assert ipv4_index.find("9.255.255.255") == NO_MATCH
+    assert ipv4_index.find("255.255.255.255") == NO_MATCH
+    assert ipv4_index.lookup("100.127.0.1") == b"shared"
+    assert ipv4_index.lookup("172.31.255.255") == b"private"
+    assert ipv4_index.lookup("172.32.0.0") is None
+    assert ipv4_index.lookup_record("192.168.1.255") == (0xC0_A8_01_00, 0xC0_A8_01_FF, b"private")
+    assert ipv4_index.lookup_record("8.8.8.8") is None
+
+
+def test_range_index_other_version(ipv4_index: MmapRangeIndex) -> None:
+    """Test that addresses of the other version never match."""
+    assert ipv4_index.find(IPv6("::a00:1")) == NO_MATCH
+    assert ipv4_index.lookup("::ffff:a00:1") is None
+    assert "::a00:1" not in ipv4_index
+
+
+def test_range_index_records(ipv4_index: MmapRangeIndex) -> None:
+    """Test accessing the ranges by index and iterating over them."""
+    records = list(ipv4_index)
+
+    assert all(isinstance(record, IndexRecord) for record in records)
+    assert [bytes(record.payload) for record in records] == [payload for _, _, payload in IPV4_RANGES]
+    assert ipv4_index[0] == (0x0A_00_00_00, 0x0A_FF_FF_FF, b"private")
+    assert ipv4_index[-1] == records[-1]
+
+    with pytest.raises(IndexError, match="Record index 5 out of range"):
+        ipv4_index[5]
+    with pytest.raises(IndexError, match="Record index -6 out of range"):
+        ipv4_index[-6]
+
+
+def test_range_index_contains(ipv4_index: MmapRangeIndex) -> None:
+    """Test membership of addresses."""
+    assert "127.0.0.1" in ipv4_index
+    assert IPAddress("172.20.1.1") in ipv4_index
+    assert LazyIPAddress("172.20.1.1") in ipv4_index
+    assert IPAddress(0x7F_00_00_01) in ipv4_index
+    assert LazyIPAddress("::ffff:7f00:1") not in ipv4_index
+    assert "8.8.8.8" not in ipv4_index
+    assert 3.14 not in ipv4_index
+
+
+def test_range_index_invalid_address(ipv4_index: MmapRangeIndex) -> None:
+    """Test looking up objects that aren't addresses."""
+    with pytest.raises(TypeError, match="Invalid type for address: 'float'"):
+        ipv4_index.find(3.14)  # type: ignore[arg-type]
+
+
+def test_range_index_ipv6(tmp_path: Path) -> None:
+    """Test looking up IPv6 addresses, with ranges given without payloads."""
+    path = tmp_path / "ipv6.idx"
+    ranges = [(IPv6("2001:db8::"), 32), (IPv6("fe80::"), 10)]
+
+    assert build_range_index(path, ranges, SubnetType.IPV6) == len(ranges)
+    with MmapRangeIndex(path) as index:
+        assert index.version == SubnetType.IPV6
+        assert index.find("2001:db8:ffff::1") == 0
+        assert index.find("fe80::1") == 1
+        assert index.find("::1") == NO_MATCH
+        assert index.lookup("fe80::1") == b""
+        assert index.find("10.0.0.1") == NO_MATCH
+        assert index[1][:2] == (0xFE80 << 112, (0xFEC0 << 112) - 1)
+
+
+def test_range_index_payload_deduplication(tmp_path: Path) -> None:
+    """Test that consecutive identical payloads are stored once, and recurring ones again."""
+    unique = tmp_path / "unique.idx"
+    repeated = tmp_path / "repeated.idx"
+    alternating = tmp_path / "alternating.idx"
+    payloads = [bytes(100), bytes([1]) * 100]
+
+    build_range_index(unique, [(IPv4(f"10.0.{idx}.0"), 24, bytes([idx]) * 100) for idx in range(10)])
+    build_range_index(repeated, [(IPv4(f"10.0.{idx}.0"), 24, payloads[0]) for idx in range(10)])
+    build_range_index(alternating, [(IPv4(f"10.0.{idx}.0"), 24, payloads[idx % 2]) for idx in range(10)])
+
+    assert repeated.stat().st_size < unique.stat().st_size
+    assert alternating.stat().st_size == unique.stat().st_size
+    with MmapRangeIndex(repeated) as index:
+        assert all(record.payload == payloads[0] for record in index)
+    with MmapRangeIndex(alternating) as index:
+        assert [record.payload for record in index] == [payloads[idx % 2] for idx in range(10)]
+
+
+def test_range_index_rebuild_while_mapped(tmp_path: Path) -> None:
+    """Test that rebuilding an index replaces the file, leaving mapped copies of the old one intact."""
+    path = tmp_path / "ranges.idx"
+    build_range_index(path, [(IPv4("10.0.0.0"), 24, b"old")])
+    path.chmod(0o640)
+
+    with MmapRangeIndex(path) as old_index:
+        build_range_index(path, [(IPv4("10.0.0.0"), 16, b"new"), (IPv4("10.1.0.0"), 16, b"newer")])
+        assert old_index.lookup("10.0.0.1") == b"old"
+        assert len(old_index) == 1
+
+        with pytest.raises(ValueError, match="must be sorted"):
+            build_range_index(path, [(IPv4("10.1.0.0"), 16), (IPv4("10.0.0.0"), 16)])
+
+    with MmapRangeIndex(path) as new_index:
+        assert new_index.lookup("10.0.1.1") == b"new"
+        assert len(new_index) == 2
+    assert path.stat().st_mode & 0o777 == 0o640
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_range_index_from_range_set(tmp_path: Path) -> None:
+    """Test building an index from the CIDR blocks of a range set."""
+    path = tmp_path / "ranges.idx"
+    ranges = AddressRangeSet([("10.0.0.0", "10.0.0.5"), ("10.0.1.1", "10.0.1.1")])
+
+    assert build_range_index(path, ranges.to_cidrs()) == 3
+    with MmapRangeIndex(path) as index:
+        assert all(index.find(f"10.0.0.{idx}") != NO_MATCH for idx in range(6))
+        assert "10.0.0.6" not in index
+        assert "10.0.1.1" in index
+        assert "10.0.1.2" not in index
+
+
+def test_range_index_empty(tmp_path: Path) -> None:
+    """Test an index without ranges."""
+    path = tmp_path / "empty.idx"
+
+    assert build_range_index(path, []) == 0
+    with MmapRangeIndex(path) as index:
+        assert len(index) == 0
+        assert index.find("10.0.0.1") == NO_MATCH
+        assert list(index) == []
+
+
+def test_range_index_pickle(ipv4_index: MmapRangeIndex) -> None:
+    """Test that pickling an index maps the same file again."""
+    with pickle.loads(pickle.dumps(ipv4_index)) as index:  # noqa: S301
+        assert index.path == ipv4_index.path
+        assert list(index) == list(ipv4_index)
+
+
+def test_range_index_repr(ipv4_index: MmapRangeIndex) -> None:
+    """Test the representation of an index."""
+    assert repr(ipv4_index) == f"iplib3.MmapRangeIndex('{ipv4_index.path}', <5 ranges>, version='ipv4')"
+
+
+def test_range_index_close_with_views(tmp_path: Path) -> None:
+    """Test that an index can't be closed while payload views are in use."""
+    path = tmp_path / "ipv4.idx"
+    build_range_index(path, IPV4_RANGES)
+    index = MmapRangeIndex(path)
+    payload = index.lookup("10.0.0.1")
+    assert payload is not None
+
+    with pytest.raises(BufferError):
+        index.close()
+    assert index.lookup("127.0.0.1") == b"loopback"
+
+    payload.release()
+    index.close()
+
+
+@pytest.mark.parametrize(
+    ("items", "version", "error", "match_message"),
+    TEST_CASES_BUILD_RANGE_INDEX_ERRORS,
+)
+def test_build_range_index_errors(
+    tmp_path: Path, items: list, version: SubnetType, error: type[Exception], match_message: str
+) -> None:
+    """Test building indexes from invalid ranges."""
+    with pytest.raises(error, match=match_message):
+        build_range_index(tmp_path / "invalid.idx", items, version)
+
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.parametrize(
+    ("data", "match_message"),
+    TEST_CASES_RANGE_INDEX_FILE_ERRORS,
+)
+def test_range_index_file_errors(tmp_path: Path, data: bytes, match_message: str) -> None:
+    """Test opening files that aren't valid range indexes."""
+    path = tmp_path / "invalid.idx"
+    path.write_bytes(data)
+
+    with pytest.raises(ValueError, match=match_message):
+        MmapRangeIndex(path)
@@ -0,0 +1,80 @@
+"""Unit tests for the iplib3 package."""
+
+import subprocess
+import sys
+from importlib import import_module
+
+import pytest
+
+import iplib3
+from tests.test_cases_init import TEST_CASES_BASELINE_NAMES
+
+
+def imported_modules(code: str) -> set[str]:
+    """Run code in a new interpreter, returning the modules it imported."""
+    output = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", f"{code}\nimport sys\nprint(*sys.modules)"],
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout
+    return set(output.split())
+
+
+def test_import_is_lazy() -> None:
+    """Test that importing the package imports none of its submodules, nor the metadata lookup."""
+    modules = imported_modules("import iplib3")
+
+    assert not {module for module in modules if module.startswith("iplib3.")}
+    assert "importlib.metadata" not in modules
+
+
+def test_import_only_needed_submodules() -> None:
+    """Test that importing a name only imports the submodules it needs."""
+    modules = imported_modules("from iplib3 import ip_validator")
+
+    assert "iplib3.validators" in modules
+    assert "iplib3.address" not in modules
+    assert "iplib3.bulk" not in modules
+
+
+def test_exports() -> None:
+    """Test that every name a submodule exports is available from the package, and nothing else."""
+    for module_name in set(iplib3._EXPORTS.values()):
+        module = import_module(f"iplib3.{module_name}")
+        for name in getattr(module, "__all__", ()):
+            assert iplib3._EXPORTS[name] == module_name
+
+    for name, module_name in iplib3._EXPORTS.items():
+        assert getattr(iplib3, name) is getattr(import_module(f"iplib3.{module_name}"), name)
+
+
+@pytest.mark.parametrize(
+    "name",
+    TEST_CASES_BASELINE_NAMES,
+)
+def test_baseline_names(name: str) -> None:
+    """Test that the names the package exposed before importing lazily are still listed and available."""
+    assert name in dir(iplib3)
+    assert getattr(iplib3, name) is not None
+
+
+def test_submodules() -> None:
+    """Test accessing submodules as attributes."""
+    assert iplib3.stats is import_module("iplib3.stats")  # type: ignore[attr-defined]
+
+
+def test_dir() -> None:
+    """Test listing the names that haven't been imported yet."""
+    assert {"IPNetwork", "scan", "table", "__version__"} <= set(dir(iplib3))
+
+
+def test_version() -> None:
+    """Test looking up the version."""
+    assert isinstance(iplib3.__version__, str)
+
+
+def test_missing_attribute() -> None:
+    """Test accessing names the package doesn't have."""
+    with pytest.raises(AttributeError, match="module 'iplib3' has no attribute 'IPAdress'"):
+        _ = iplib3.IPAdress  # type: ignore[attr-defined]
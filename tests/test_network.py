@@ -0,0 +1,116 @@
+"""Unit tests for iplib3.network."""
+
+from itertools import islice
+
+import pytest
+
+from iplib3 import IPAddress, IPv4, IPv6, LazyIPAddress
+from iplib3.constants.subnet import SubnetType
+from iplib3.network import IPNetwork
+from tests.test_cases_network import (
+    TEST_CASES_IPNETWORK,
+    TEST_CASES_IPNETWORK_ERRORS,
+    TEST_CASES_IPNETWORK_HOSTS,
+)
+
+
+@pytest.mark.parametrize(
+    ("args", "string", "network", "broadcast", "version"),
+    TEST_CASES_IPNETWORK,
+)
+def test_ipnetwork(args: tuple, string: str, network: int, broadcast: int, version: SubnetType) -> None:
+    """Test creating networks."""
+    net = IPNetwork(*args, strict=False)
+    assert str(net) == string
+    assert repr(net) == f"iplib3.IPNetwork('{string}')"
+    assert net.network == network
+    assert net.broadcast == broadcast
+    assert net.version == version
+    assert net.num_addresses == broadcast - network + 1
+    assert IPNetwork(string) == net
+    assert hash(IPNetwork(string)) == hash(net)
+
+
+@pytest.mark.parametrize(
+    ("args", "error", "message"),
+    TEST_CASES_IPNETWORK_ERRORS,
+)
+def test_ipnetwork_errors(args: tuple, error: type[Exception], message: str) -> None:
+    """Test invalid networks."""
+    with pytest.raises(error, match=message):
+        IPNetwork(*args)
+
+
+def test_ipnetwork_from_any_address() -> None:
+    """Test creating networks from lazy and generic addresses."""
+    assert IPNetwork(LazyIPAddress("10.0.0.0"), 8) == IPNetwork("10.0.0.0/8")
+    assert IPNetwork(LazyIPAddress("2001:db8::"), 32) == IPNetwork("2001:db8::/32")
+    assert IPNetwork(IPAddress(0x0A_01_02_03), 8, strict=False) == IPNetwork("10.0.0.0/8")
+
+
+def test_ipnetwork_contains() -> None:
+    """Test membership of integers, addresses and networks."""
+    net = IPNetwork("10.0.0.0/8")
+
+    assert 0x0A_12_34_56 in net
+    assert 0x0B_00_00_00 not in net
+    assert IPv4("10.255.255.255") in net
+    assert IPv4("11.0.0.0") not in net
+    assert IPv6("::a00:1") not in net
+    assert IPNetwork("10.1.0.0/16") in net
+    assert IPNetwork("10.0.0.0/7", strict=False) not in net
+    assert IPNetwork("::/8") not in net
+    assert "10.0.0.1" not in net
+
+
+def test_ipnetwork_contains_any_address() -> None:
+    """Test that lazy and generic addresses are compared by value and version."""
+    net = IPNetwork("10.0.0.0/8")
+    ipv6_net = IPNetwork("2001:db8::/32")
+
+    assert LazyIPAddress("10.1.2.3") in net
+    assert LazyIPAddress("10.1.2.3:80") in net
+    assert LazyIPAddress("11.0.0.0") not in net
+    assert LazyIPAddress("2001:db8::1") in ipv6_net
+    assert LazyIPAddress("2001:db8::1") not in net
+    assert IPAddress(0x0A_00_00_01) in net
+    assert IPAddress(0x2001_0DB8 << 96) in ipv6_net
+    assert IPAddress(0x0A_00_00_01) not in ipv6_net
+
+
+def test_ipnetwork_getitem() -> None:
+    """Test random access, including huge IPv6 networks."""
+    net = IPNetwork("2001:db8::/64")
+
+    assert net[0] == IPv6("2001:db8::")
+    assert net[-1] == IPv6("2001:db8::ffff:ffff:ffff:ffff")
+    assert net[2**40] == IPv6("2001:db8::100:0:0")
+    assert net.num_addresses == 2**64
+
+    with pytest.raises(IndexError, match="out of range"):
+        net[2**64]
+    with pytest.raises(TypeError, match="must be integers"):
+        net["1"]  # type: ignore[call-overload]
+    with pytest.raises(OverflowError):
+        len(net)
+
+    assert len(IPNetwork("10.0.0.0/30")) == 4
+
+
+@pytest.mark.parametrize(
+    ("network", "hosts"),
+    TEST_CASES_IPNETWORK_HOSTS,
+)
+def test_ipnetwork_hosts(network: str, hosts: list[str]) -> None:
+    """Test iterating over usable hosts."""
+    assert list(IPNetwork(network).hosts()) == [IPAddress(host) for host in hosts]
+
+
+def test_ipnetwork_iteration_is_lazy() -> None:
+    """Test that iterating over a huge network doesn't build it first."""
+    net = IPNetwork("2001:db8::/64")
+
+    assert list(islice(net.hosts(), 2)) == [IPv6("2001:db8::1"), IPv6("2001:db8::2")]
+    assert list(islice(net, 2)) == [IPv6("2001:db8::"), IPv6("2001:db8::1")]
+    assert net.network_address == IPv6("2001:db8::")
+    assert net.broadcast_address == net[-1]
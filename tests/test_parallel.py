@@ -0,0 +1,152 @@
+"""Unit tests for iplib3.parallel."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+from iplib3 import parallel
+from iplib3.bulk import parse_ipv4_many, parse_ipv6_many
+from iplib3.constants.subnet import SubnetType
+from iplib3.parallel import _map_threaded, parse_file_parallel, threads_run_in_parallel
+from iplib3.validators import ValidationMode, validate_many
+
+IPV4_LINES = ["127.0.0.1", "10.0.0.1:8080", "300.0.0.1", "", "192.168.0.1:65535", "1.2.3", "8.8.8.8"] * 200
+IPV6_LINES = ["::1", "[2001:db8::1]:443", "::g", "", "fe80::1", "1.2.3.4"] * 200
+
+
+@pytest.fixture
+def ipv4_file(tmp_path: Path) -> Path:
+    """Write a file of IPv4 addresses, some of them invalid."""
+    path = tmp_path / "ipv4.txt"
+    path.write_text("\n".join(IPV4_LINES) + "\n")
+    return path
+
+
+def test_parse_file_parallel_ipv4(ipv4_file: Path) -> None:
+    """Test that parsing on several processes matches parsing the lines in one go."""
+    batch = parse_file_parallel(ipv4_file, workers=2, chunk_bytes=500)
+
+    assert batch == parse_ipv4_many(IPV4_LINES)
+
+
+def test_parse_file_parallel_ipv6(tmp_path: Path) -> None:
+    """Test parsing IPv6 addresses, with Windows line endings and no final newline."""
+    path = tmp_path / "ipv6.txt"
+    path.write_bytes("\r\n".join(IPV6_LINES).encode())
+
+    batch = parse_file_parallel(path, SubnetType.IPV6, workers=2, chunk_bytes=500)
+
+    assert batch == parse_ipv6_many(IPV6_LINES)
+
+
+def test_parse_file_parallel_single_worker(ipv4_file: Path) -> None:
+    """Test parsing in the calling process."""
+    assert parse_file_parallel(ipv4_file, workers=1, chunk_bytes=500) == parse_ipv4_many(IPV4_LINES)
+
+
+@pytest.mark.parametrize("chunk_bytes", [1, 7, 1 << 20])
+def test_parse_file_parallel_chunk_sizes(ipv4_file: Path, chunk_bytes: int) -> None:
+    """Test chunks shorter than a line and chunks longer than the file."""
+    assert parse_file_parallel(ipv4_file, workers=1, chunk_bytes=chunk_bytes) == parse_ipv4_many(IPV4_LINES)
+
+
+def test_parse_file_parallel_progress(ipv4_file: Path) -> None:
+    """Test that progress is reported in order after every chunk."""
+    reports: list[tuple[int, int]] = []
+    size = ipv4_file.stat().st_size
+
+    parse_file_parallel(
+        ipv4_file, workers=2, chunk_bytes=1000, progress=lambda done, total: reports.append((done, total))
+    )
+
+    assert len(reports) > 1
+    assert [done for done, _ in reports] == sorted({done for done, _ in reports})
+    assert reports[-1] == (size, size)
+
+
+def test_parse_file_parallel_empty(tmp_path: Path) -> None:
+    """Test parsing an empty file."""
+    path = tmp_path / "empty.txt"
+    path.touch()
+
+    assert parse_file_parallel(path, workers=2) == parse_ipv4_many([])
+    assert parse_file_parallel(path, SubnetType.IPV6, workers=2) == parse_ipv6_many([])
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_parse_file_parallel_line_breaks(tmp_path: Path, workers: int) -> None:
+    """Test that only newlines split lines, not the other characters str.splitlines splits on."""
+    lines = [
+        "127.0.0.1",
+        "10.0.0.1\x0b",
+        "\x0c8.8.8.8",
+        "1.1.1.1\x1c2.2.2.2",
+        "3.3.3.3\x85",
+        "4.4.4.4\u2028",
+        "5.5.5.5",
+    ]
+    path = tmp_path / "ipv4.txt"
+    path.write_bytes("\n".join(lines * 50).encode())
+
+    assert parse_file_parallel(path, workers=workers, chunk_bytes=100) == parse_ipv4_many(lines * 50)
+
+
+@pytest.mark.parametrize(("workers", "chunk_bytes"), [(0, 1), (1, 0), (-1, -1)])
+def test_parse_file_parallel_errors(ipv4_file: Path, workers: int, chunk_bytes: int) -> None:
+    """Test invalid worker counts and chunk sizes."""
+    with pytest.raises(ValueError, match="workers and chunk_bytes must be positive"):
+        parse_file_parallel(ipv4_file, workers=workers, chunk_bytes=chunk_bytes)
+
+
+@pytest.fixture
+def parallel_threads(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Use threads even if the GIL would keep them from running in parallel."""
+    monkeypatch.setattr(parallel, "threads_run_in_parallel", lambda: True)
+
+
+def test_threads_run_in_parallel() -> None:
+    """Test detecting free-threaded builds."""
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    assert threads_run_in_parallel() is (is_gil_enabled is not None and not is_gil_enabled())
+
+
+@pytest.mark.usefixtures("parallel_threads")
+def test_map_threaded() -> None:
+    """Test that chunks are mapped on threads and the results kept in order."""
+    assert _map_threaded(list, range(10_000), 2) == [
+        list(range(4096)),
+        list(range(4096, 8192)),
+        list(range(8192, 10_000)),
+    ]
+    assert _map_threaded(list, range(10), 2) == [list(range(10))]
+    assert _map_threaded(list, range(10_000), 1) == [list(range(10_000))]
+
+
+def test_map_threaded_with_gil(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that everything is done at once in the calling thread if threads can't run in parallel."""
+    monkeypatch.setattr(parallel, "threads_run_in_parallel", lambda: False)
+
+    assert _map_threaded(list, range(10_000), 4) == [list(range(10_000))]
+
+
+@pytest.mark.usefixtures("parallel_threads")
+def test_parse_many_threaded() -> None:
+    """Test that parsing on threads matches parsing in one go."""
+    ipv4_lines = IPV4_LINES * 10
+    ipv6_lines = IPV6_LINES * 10
+
+    assert parse_ipv4_many(ipv4_lines, workers=4) == parse_ipv4_many(ipv4_lines)
+    assert parse_ipv6_many(iter(ipv6_lines), workers=4) == parse_ipv6_many(ipv6_lines)
+
+
+@pytest.mark.usefixtures("parallel_threads")
+def test_validate_many_threaded() -> None:
+    """Test that validating on threads matches validating in one go."""
+    addresses = (IPV4_LINES + IPV6_LINES) * 10
+
+    for validation_mode in ValidationMode:
+        assert validate_many(addresses, validation_mode, workers=4) == validate_many(addresses, validation_mode)
+        assert validate_many(addresses, validation_mode, with_values=True, workers=4) == validate_many(
+            addresses, validation_mode, with_values=True
+        )
@@ -0,0 +1,132 @@
+"""Unit tests for iplib3.ranges."""
+
+import random
+
+import pytest
+
+from iplib3 import IPAddress, IPv4, IPv6, LazyIPAddress
+from iplib3.constants.subnet import SubnetType
+from iplib3.network import IPNetwork
+from iplib3.ranges import AddressRangeSet, collapse_sorted
+from iplib3.subnet import SubnetMask
+from tests.test_cases_ranges import TEST_CASES_RANGE_SET_ERRORS, TEST_CASES_TO_CIDRS
+
+
+def _addresses(ranges: AddressRangeSet) -> set[int]:
+    return {num for start, end in ranges for num in range(start, end + 1)}
+
+
+def _random_set(rng: random.Random) -> AddressRangeSet:
+    ranges = AddressRangeSet()
+    for _ in range(rng.randint(0, 20)):
+        start = rng.randint(0, 200)
+        ranges.add((start, start + rng.randint(0, 10)))
+    return ranges
+
+
+def test_address_range_set_merging() -> None:
+    """Test that overlapping and adjacent ranges are merged when added."""
+    ranges = AddressRangeSet([(10, 20), (30, 40)])
+    assert list(ranges) == [(10, 20), (30, 40)]
+
+    ranges.add(21)
+    assert list(ranges) == [(10, 21), (30, 40)]
+
+    ranges.add((22, 29))
+    assert list(ranges) == [(10, 40)]
+
+    ranges.add(IPNetwork("0.0.0.0/29"))
+    ranges.add(IPv4("0.0.0.9"))
+    assert list(ranges) == [(0, 7), (9, 40)]
+    assert len(ranges) == 2
+    assert ranges.num_addresses == 40
+
+    ranges.discard((15, 19))
+    ranges.discard(0)
+    ranges.discard((100, 200))
+    assert list(ranges) == [(1, 7), (9, 14), (20, 40)]
+
+    assert 5 in ranges
+    assert (20, 40) in ranges
+    assert (14, 20) not in ranges
+    assert "0.0.0.25" in ranges
+    assert "::1" not in ranges
+    assert repr(ranges) == "iplib3.AddressRangeSet(<3 ranges>, version='ipv4')"
+
+
+def test_address_range_set_any_address() -> None:
+    """Test that lazy and generic addresses are added and looked up by value and version."""
+    ranges = AddressRangeSet([LazyIPAddress("10.0.0.1"), (IPAddress(0x0A_00_00_02), LazyIPAddress("10.0.0.5"))])
+
+    assert list(ranges) == [(0x0A_00_00_01, 0x0A_00_00_05)]
+    assert LazyIPAddress("10.0.0.3") in ranges
+    with pytest.raises(ValueError, match="Cannot add ipv6 address"):
+        ranges.add(LazyIPAddress("::1"))
+
+
+def test_address_range_set_operations() -> None:
+    """Test set operations against sets of individual addresses."""
+    rng = random.Random(7)  # noqa: S311
+
+    for _ in range(200):
+        first, second = _random_set(rng), _random_set(rng)
+
+        for result, expected in (
+            (first | second, _addresses(first) | _addresses(second)),
+            (first & second, _addresses(first) & _addresses(second)),
+            (first - second, _addresses(first) - _addresses(second)),
+        ):
+            assert _addresses(result) == expected
+            # Results stay sorted and fully merged
+            assert result == AddressRangeSet(expected)
+            assert all(end + 1 < start for (_, end), (start, _) in zip(result, list(result)[1:], strict=False))
+
+
+def test_address_range_set_operation_errors() -> None:
+    """Test that sets of different versions can't be combined."""
+    with pytest.raises(ValueError, match="Cannot combine ipv4 and ipv6 addresses"):
+        AddressRangeSet() | AddressRangeSet(version=SubnetType.IPV6)
+    with pytest.raises(TypeError, match="Expected an AddressRangeSet"):
+        AddressRangeSet().union([(1, 2)])  # type: ignore[arg-type]
+
+
+@pytest.mark.parametrize(
+    ("ranges", "expected"),
+    TEST_CASES_TO_CIDRS,
+)
+def test_address_range_set_to_cidrs(ranges: list, expected: list[tuple[str, int | None]]) -> None:
+    """Test collapsing into the fewest CIDR blocks."""
+    cidrs = list(AddressRangeSet(ranges).to_cidrs())
+    assert [(str(address), mask.prefix_length) for address, mask in cidrs] == expected
+    assert all(isinstance(mask, SubnetMask) for _, mask in cidrs)
+
+
+def test_address_range_set_ipv6_cidrs() -> None:
+    """Test collapsing IPv6 ranges."""
+    ranges = AddressRangeSet(["2001:db8::/33", "2001:db8:8000::/33", "::1"], SubnetType.IPV6)
+    assert [(address, mask.prefix_length) for address, mask in ranges.to_cidrs()] == [
+        (IPv6("::1"), None),
+        (IPv6("2001:db8::"), 32),
+    ]
+
+
+def test_collapse_sorted() -> None:
+    """Test streaming collapse of sorted input."""
+    addresses = (IPv4.from_int(num) for num in range(0x0A_00_00_00, 0x0A_00_01_02))
+    cidrs = [(str(address), mask.prefix_length) for address, mask in collapse_sorted(addresses)]
+    assert cidrs == [("10.0.0.0", 24), ("10.0.1.0", 31)]
+
+    assert AddressRangeSet.from_sorted([1, 2, (3, 5), 9]) == AddressRangeSet([(1, 5), 9])
+
+    with pytest.raises(ValueError, match="Ranges must be sorted"):
+        list(collapse_sorted([5, 1]))
+
+
+@pytest.mark.parametrize(
+    ("item", "error", "message"),
+    TEST_CASES_RANGE_SET_ERRORS,
+)
+def test_address_range_set_errors(item: object, error: type[Exception], message: str) -> None:
+    """Test invalid items."""
+    with pytest.raises(error, match=message):
+        AddressRangeSet().add(item)  # type: ignore[arg-type]
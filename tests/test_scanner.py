@@ -0,0 +1,72 @@
+"""Unit tests for iplib3.scanner."""
+
+import io
+from pathlib import Path
+
+import pytest
+
+from iplib3 import IPv4, IPv6
+from iplib3.constants.subnet import SubnetType
+from iplib3.scanner import ScanMatch, scan
+from tests.test_cases_scanner import TEST_CASES_SCAN, TEST_CASES_SCAN_CORPUS, TEST_CASES_SCAN_NOTHING
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    TEST_CASES_SCAN,
+)
+def test_scan(text: str, expected: list[tuple[int, int, int | None, SubnetType]]) -> None:
+    """Test finding addresses in binary and text streams."""
+    assert list(scan(io.BytesIO(text.encode()))) == expected
+    assert list(scan(io.StringIO(text))) == expected
+
+
+@pytest.mark.parametrize(
+    "text",
+    TEST_CASES_SCAN_NOTHING,
+)
+def test_scan_nothing(text: str) -> None:
+    """Test that text without valid addresses gives no matches."""
+    assert list(scan(io.BytesIO(text.encode()))) == []
+
+
+def test_scan_chunk_boundaries() -> None:
+    """Test that matches spanning chunk boundaries are found exactly once."""
+    lines = [f"{idx} client 10.0.{idx}.1:{1000 + idx} server [2001:db8::{idx:x}]:443\n" for idx in range(256)]
+    data = "".join(lines).encode()
+
+    expected = list(scan(io.BytesIO(data)))
+    assert len(expected) == 512
+
+    for chunk_size in (1, 7, 64, 100, 4096):
+        assert list(scan(io.BytesIO(data), chunk_size=chunk_size)) == expected
+
+    first, second = expected[:2]
+    assert first == ScanMatch(data.index(b"10.0.0.1"), IPv4("10.0.0.1").num, 1000, SubnetType.IPV4)
+    assert second == ScanMatch(data.index(b"[2001"), IPv6("2001:db8::").num, 443, SubnetType.IPV6)
+
+
+@pytest.mark.parametrize("chunk_size", [*range(1, 201), 997, 2970, 4096])
+def test_scan_any_chunk_size(chunk_size: int) -> None:
+    """Test that every chunk size finds the same matches as scanning everything at once."""
+    data = TEST_CASES_SCAN_CORPUS.encode()
+    expected = list(scan(io.BytesIO(data), chunk_size=len(data)))
+
+    assert list(scan(io.BytesIO(data), chunk_size=chunk_size)) == expected
+    assert list(scan(io.StringIO(TEST_CASES_SCAN_CORPUS), chunk_size=chunk_size)) == expected
+
+
+def test_scan_path(tmp_path: Path) -> None:
+    """Test that paths are opened and read."""
+    path = tmp_path / "access.log"
+    path.write_bytes(b"\x00\xff binary 192.168.0.1 junk\n")
+
+    expected = [ScanMatch(10, IPv4("192.168.0.1").num, None, SubnetType.IPV4)]
+    assert list(scan(path)) == expected
+    assert list(scan(str(path))) == expected
+
+
+def test_scan_invalid_chunk_size() -> None:
+    """Test that the chunk size must be positive."""
+    with pytest.raises(ValueError, match="Chunk size must be positive"):
+        list(scan(io.BytesIO(b""), chunk_size=0))
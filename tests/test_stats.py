@@ -0,0 +1,120 @@
+"""Unit tests for iplib3.stats."""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from iplib3 import stats
+from iplib3.stats import CallStats
+
+
+@pytest.fixture
+def enabled(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Enable instrumentation, restoring the counters and hooks afterwards."""
+    monkeypatch.setattr(stats, "ENABLED", True)
+    monkeypatch.setattr(stats, "_counters", {})
+    monkeypatch.setattr(stats, "_hooks", [])
+
+
+def validate(value: int) -> bool:
+    """Reject negative values, and values that aren't integers."""
+    if not isinstance(value, int):
+        msg = "Not an integer"
+        raise TypeError(msg)
+    return value >= 0
+
+
+def test_instrumented_disabled(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test functions not being wrapped without instrumentation."""
+    monkeypatch.setattr(stats, "ENABLED", False)
+    assert stats.instrumented(validate) is validate
+
+
+def test_instrumented_counts(enabled: None) -> None:
+    """Test counting calls and failures."""
+    wrapped = stats.instrumented(validate)
+
+    assert wrapped(1)
+    assert not wrapped(-1)
+    with pytest.raises(TypeError, match="Not an integer"):
+        wrapped("1")  # type: ignore[arg-type]
+
+    counters = stats.snapshot()["validate"]
+    assert counters.calls == 3
+    assert counters.failures == 2
+    assert counters.seconds > 0
+
+
+def test_instrumented_with(enabled: None) -> None:
+    """Test counting the results a predicate accepts as failures."""
+    wrapped = stats.instrumented_with(lambda result: result is None)(validate)
+
+    assert wrapped(1)
+    assert not wrapped(-1)
+
+    assert stats.snapshot()["validate"].failures == 0
+
+
+def test_reset(enabled: None) -> None:
+    """Test resetting the counters."""
+    wrapped = stats.instrumented(validate)
+    wrapped(1)
+    stats.reset()
+    assert stats.snapshot() == {"validate": CallStats(calls=0, failures=0, seconds=0.0)}
+
+
+def test_hooks(enabled: None) -> None:
+    """Test hooks getting every call until they're removed."""
+    calls = []
+
+    def hook(name: str, seconds: float, failed: bool) -> None:  # noqa: FBT001
+        calls.append((name, failed))
+
+    wrapped = stats.instrumented(validate)
+    stats.add_hook(hook)
+    wrapped(1)
+    wrapped(-1)
+    stats.remove_hook(hook)
+    wrapped(1)
+
+    assert calls == [("validate", False), ("validate", True)]
+
+    with pytest.raises(ValueError, match="isn't registered"):
+        stats.remove_hook(hook)
+
+
+def test_environment_variable() -> None:
+    """Test the environment variable instrumenting the hot paths."""
+    code = (
+        "import json\n"
+        "from iplib3 import IPAddress, IPv6, SubnetMask, ip_validator, stats, try_parse\n"
+        "IPAddress('127.0.0.1'), IPAddress('::1'), ip_validator('1.2.3'), str(IPv6.from_int(1)), SubnetMask(24)\n"
+        "print(json.dumps({name: counters.calls for name, counters in stats.snapshot().items()}))\n"
+        "stats.reset()\n"
+        "try_parse('1.2.3'), try_parse('1.2.3.4'), try_parse('1.2.3.4:70000')\n"
+        "print(json.dumps(stats.snapshot()['try_parse']))\n"
+    )
+    output = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", code],
+        capture_output=True,
+        check=True,
+        env={**os.environ, stats.ENV_VAR: "1"},
+        text=True,
+    ).stdout
+    calls_line, try_parse_line = output.splitlines()
+    calls = json.loads(calls_line)
+
+    assert calls["IPAddress.__new__"] == 2
+    assert calls["IPAddress._parse"] == 2
+    assert calls["try_parse"] == 3
+    assert calls["PureAddress._num_to_ipv6"] == 1
+    assert calls["ip_validator"] == 1
+    assert calls["SubnetMask.__new__"] == 1
+    # Conversions that creating addresses no longer goes through have no counters
+    assert not {name for name in calls if name.endswith("_to_num")}
+
+    # Error codes returned by try_parse are failures too
+    assert json.loads(try_parse_line)[:2] == [3, 2]
@@ -0,0 +1,147 @@
+"""Unit tests for iplib3.streams."""
+
+import asyncio
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from iplib3 import IPAddress, IPv4, IPv6
+from iplib3.streams import InvalidLine, aiter_addresses
+
+LINES = [
+    "127.0.0.1",
+    "10.0.0.1:8080",
+    "not an address",
+    "",
+    "[2001:db8::1]:443",
+    "1.2.3",
+    "fe80::1",
+]
+DATA = "\r\n".join(LINES).encode() + b"\n192.168.0.1\n\n8.8.8.8"
+VALID = ["127.0.0.1", "10.0.0.1:8080", "[2001:db8::1]:443", "fe80::1", "192.168.0.1", "8.8.8.8"]
+
+
+def read_all(data: bytes, **kwargs) -> tuple[list[IPv4 | IPv6], list[InvalidLine]]:
+    """Feed data to a stream and collect what aiter_addresses yields and reports."""
+    invalid: list[InvalidLine] = []
+
+    async def collect() -> list[IPv4 | IPv6]:
+        reader = asyncio.StreamReader()
+        reader.feed_data(data)
+        reader.feed_eof()
+        return [address async for address in aiter_addresses(reader, on_invalid=invalid.append, **kwargs)]
+
+    return asyncio.run(collect()), invalid
+
+
+def test_aiter_addresses() -> None:
+    """Test parsing addresses from a stream, reporting the invalid lines."""
+    addresses, invalid = read_all(DATA)
+
+    assert addresses == [IPAddress(address) for address in VALID]
+    assert [str(address) for address in addresses] == VALID
+    assert [type(address) for address in addresses] == [IPv4, IPv4, IPv6, IPv6, IPv4, IPv4]
+    assert [(line.line_number, line.text) for line in invalid] == [(3, "not an address"), (6, "1.2.3")]
+    assert "Invalid IPv6 address format" in invalid[0].message
+
+
+def test_aiter_addresses_small_chunks() -> None:
+    """Test lines split across chunks and batches."""
+    assert read_all(DATA, chunk_size=3, batch_size=2) == read_all(DATA)
+
+
+def test_aiter_addresses_executor() -> None:
+    """Test parsing batches in an executor."""
+    with ThreadPoolExecutor(1) as executor:
+        assert read_all(DATA, executor=executor, offload_threshold=2) == read_all(DATA)
+
+
+def test_aiter_addresses_without_callback() -> None:
+    """Test that invalid lines are skipped without a callback."""
+
+    async def collect() -> list[str]:
+        reader = asyncio.StreamReader()
+        reader.feed_data(b"::1\nbad\n")
+        reader.feed_eof()
+        return [str(address) async for address in aiter_addresses(reader)]
+
+    assert asyncio.run(collect()) == ["::1"]
+
+
+@pytest.mark.parametrize("chunk_size", [3, 100, 1 << 16])
+def test_aiter_addresses_long_lines(chunk_size: int) -> None:
+    """Test that lines longer than the limit are reported as invalid, whether they end or not."""
+    data = b"127.0.0.1\n" + b"x" * 50 + b"\r\n" + b"1" * 16 + b"\r\n::1\n" + b"y" * 1000
+    addresses, invalid = read_all(data, chunk_size=chunk_size, max_line_length=16)
+
+    assert [str(address) for address in addresses] == ["127.0.0.1", "::1"]
+    assert [(line.line_number, line.text) for line in invalid] == [(2, "x" * 16), (3, "1" * 16), (5, "y" * 16)]
+    assert invalid[0].message == invalid[2].message == "Line is longer than 16 bytes"
+    # Lines as long as the limit are parsed
+    assert invalid[1].message.startswith("Invalid IPv6 address format")
+
+
+class EndlessLine:
+    """Stream reader producing a line without a newline, a chunk at a time."""
+
+    def __init__(self, size: int) -> None:
+        """Produce a line of the given number of bytes."""
+        self.remaining = size
+
+    async def read(self, size: int) -> bytes:
+        """Return the next chunk, or nothing once the line is over."""
+        size = min(size, self.remaining)
+        self.remaining -= size
+        return b"x" * size
+
+
+def test_aiter_addresses_without_newlines() -> None:
+    """Test that a stream without newlines isn't kept in memory while waiting for the end of the line."""
+    size = 16 << 20
+    invalid: list[InvalidLine] = []
+
+    async def collect() -> None:
+        reader = EndlessLine(size)
+        _ = [address async for address in aiter_addresses(reader, on_invalid=invalid.append)]  # type: ignore[arg-type]
+
+    tracemalloc.start()
+    try:
+        asyncio.run(collect())
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert peak < size // 16
+    assert [(line.line_number, len(line.text)) for line in invalid] == [(1, 1 << 16)]
+
+
+def test_aiter_addresses_empty() -> None:
+    """Test an empty stream."""
+    assert read_all(b"") == ([], [])
+
+
+def test_aiter_addresses_yields_control() -> None:
+    """Test that other tasks run between batches, even when the stream has everything buffered."""
+    ticks: list[int] = []
+
+    async def tick() -> None:
+        while True:
+            ticks.append(len(ticks))
+            await asyncio.sleep(0)
+
+    async def collect() -> list[int]:
+        reader = asyncio.StreamReader()
+        reader.feed_data(b"10.0.0.1\n" * 100)
+        reader.feed_eof()
+        ticker = asyncio.create_task(tick())
+        await asyncio.sleep(0)
+
+        seen = [len(ticks) async for _ in aiter_addresses(reader, batch_size=10)]
+        ticker.cancel()
+        return seen
+
+    seen = asyncio.run(collect())
+
+    assert len(seen) == 100
+    assert len(set(seen)) == 10
@@ -1,8 +1,26 @@
 """Unit tests for iplib3.subnet."""
 
+import copy
+import pickle
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
-from iplib3.constants.subnet import SubnetType
+from iplib3.constants.subnet import (
+    IPV4_HOST_MASKS,
+    IPV4_MAX_SUBNET_VALUE,
+    IPV4_PREFIX_LENGTHS_BY_MASK,
+    IPV4_PREFIX_LENGTHS_BY_STRING,
+    IPV4_SUBNET_MASK_STRINGS,
+    IPV4_SUBNET_MASKS,
+    IPV6_HOST_MASKS,
+    IPV6_MAX_SUBNET_VALUE,
+    IPV6_PREFIX_LENGTHS_BY_MASK,
+    IPV6_SUBNET_MASKS,
+    SubnetType,
+)
 from iplib3.subnet import (
     PureSubnetMask,
     SubnetMask,
@@ -12,8 +30,11 @@
     TEST_CASES_PURE_SUBNET_MASK_INEQUALITY,
     TEST_CASES_PURE_SUBNET_MASK_PREFIX_LENGTH,
     TEST_CASES_PURE_SUBNET_MASK_STRING,
+    TEST_CASES_SUBNET_MASK_DISTINCT,
+    TEST_CASES_SUBNET_MASK_NON_CANONICAL_STRING,
     TEST_CASES_SUBNET_MASK_PREFIX_TO_SUBNET_MASK,
     TEST_CASES_SUBNET_MASK_PREFIX_TO_SUBNET_MASK_ERRORS,
+    TEST_CASES_SUBNET_MASK_SINGLETON,
     TEST_CASES_SUBNET_MASK_STRING,
     TEST_CASES_SUBNET_MASK_SUBNET_LENGTH,
     TEST_CASES_SUBNET_MASK_SUBNET_TO_NUM,
@@ -138,3 +159,102 @@ def test_subnet_mask_prefix_to_subnet_mask_errors(
     """Test SubnetMask number to mask converter."""
     with pytest.raises(error, match=match_message):
         SubnetMask._prefix_to_subnet_mask(prefix_length=prefix_length, subnet_type=subnet_type)
+
+
+@pytest.mark.parametrize(
+    ("first", "second"),
+    TEST_CASES_SUBNET_MASK_SINGLETON,
+)
+def test_subnet_mask_singleton(
+    first: tuple[int | str | None, SubnetType], second: tuple[int | str | None, SubnetType]
+) -> None:
+    """Test equal subnet masks sharing an instance."""
+    assert SubnetMask(*first) is SubnetMask(*second)
+
+
+@pytest.mark.parametrize(
+    ("first", "second"),
+    TEST_CASES_SUBNET_MASK_DISTINCT,
+)
+def test_subnet_mask_distinct(
+    first: tuple[int | str | None, SubnetType], second: tuple[int | str | None, SubnetType]
+) -> None:
+    """Test different subnet masks not sharing an instance."""
+    assert SubnetMask(*first) is not SubnetMask(*second)
+
+
+@pytest.mark.parametrize(
+    ("subnet_mask", "excepted_output"),
+    TEST_CASES_SUBNET_MASK_NON_CANONICAL_STRING,
+)
+def test_subnet_mask_non_canonical_string(subnet_mask: str, excepted_output: int) -> None:
+    """Test subnet mask strings that aren't in the lookup table."""
+    assert SubnetMask(subnet_mask).prefix_length == excepted_output
+
+
+def test_subnet_mask_cache_checks_type() -> None:
+    """Test values equal to a cached prefix length still being type checked."""
+    _ = SubnetMask(24, SubnetType.IPV4)
+    with pytest.raises(TypeError, match="Invalid type for subnet value: "):
+        SubnetMask(24.0, SubnetType.IPV4)  # type: ignore[arg-type]
+
+
+def test_subnet_mask_shared_between_threads(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that threads creating the same subnet mask all get the same instance."""
+    monkeypatch.setattr(SubnetMask, "_instances", {})
+    barrier = threading.Barrier(8)
+
+    def create(_: int) -> SubnetMask:
+        barrier.wait()
+        return SubnetMask("255.255.252.0")
+
+    with ThreadPoolExecutor(8) as executor:
+        masks = list(executor.map(create, range(8)))
+
+    assert all(mask is masks[0] for mask in masks)
+
+
+def test_subnet_mask_keeps_state() -> None:
+    """Test reusing a subnet mask not resetting it."""
+    subnet = SubnetMask(16, SubnetType.IPV4)
+    _ = SubnetMask(16, SubnetType.IPV4)
+    assert subnet.prefix_length == 16
+    assert subnet._subnet_type == SubnetType.IPV4
+
+
+@pytest.mark.parametrize(
+    "round_trip",
+    [lambda mask: pickle.loads(pickle.dumps(mask)), copy.copy, copy.deepcopy],  # noqa: S301
+    ids=["pickle", "copy", "deepcopy"],
+)
+@pytest.mark.parametrize(
+    "subnet_mask",
+    [("255.255.255.0", SubnetType.IPV4), (64, SubnetType.IPV6), (None, SubnetType.IPV4)],
+)
+def test_subnet_mask_round_trip(
+    round_trip: Callable[[SubnetMask], SubnetMask], subnet_mask: tuple[int | str | None, SubnetType]
+) -> None:
+    """Test that pickling and copying return the shared instance and leave other masks alone."""
+    default = SubnetMask()
+    default_state = (default.prefix_length, default._subnet_type)
+    mask = SubnetMask(*subnet_mask)
+
+    assert round_trip(mask) is mask
+    assert SubnetMask() is default
+    assert (default.prefix_length, default._subnet_type) == default_state
+
+
+def test_subnet_mask_tables() -> None:
+    """Test the precomputed subnet mask tables."""
+    for prefix_length in range(IPV4_MAX_SUBNET_VALUE + 2):
+        mask = IPV4_SUBNET_MASKS[prefix_length]
+        assert mask + IPV4_HOST_MASKS[prefix_length] == 0xFF_FF_FF_FF
+        assert f"{mask:032b}" == "1" * prefix_length + "0" * (32 - prefix_length)
+        assert IPV4_PREFIX_LENGTHS_BY_MASK[mask] == prefix_length
+        assert IPV4_PREFIX_LENGTHS_BY_STRING[IPV4_SUBNET_MASK_STRINGS[prefix_length]] == prefix_length
+
+    for prefix_length in range(IPV6_MAX_SUBNET_VALUE + 2):
+        mask = IPV6_SUBNET_MASKS[prefix_length]
+        assert mask + IPV6_HOST_MASKS[prefix_length] == (1 << 128) - 1
+        assert f"{mask:0128b}" == "1" * prefix_length + "0" * (128 - prefix_length)
+        assert IPV6_PREFIX_LENGTHS_BY_MASK[mask] == prefix_length
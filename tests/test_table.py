@@ -0,0 +1,176 @@
+"""Unit tests for iplib3.table."""
+
+import random
+
+import pytest
+
+from iplib3 import IPAddress, IPv4, IPv6, LazyIPAddress
+from iplib3.arrays import IPAddressArray
+from iplib3.constants.subnet import SubnetType
+from iplib3.network import IPNetwork
+from iplib3.table import NO_MATCH, PrefixTable
+from tests.test_cases_table import TEST_CASES_PREFIX_TABLE, TEST_CASES_PREFIX_TABLE_LOOKUP
+
+
+@pytest.fixture
+def table() -> PrefixTable[str]:
+    """Create a small routing table."""
+    return PrefixTable(TEST_CASES_PREFIX_TABLE)
+
+
+@pytest.mark.parametrize(
+    ("address", "expected"),
+    TEST_CASES_PREFIX_TABLE_LOOKUP,
+)
+def test_prefix_table_lookup(table: PrefixTable[str], address: str, expected: str | None) -> None:
+    """Test longest-prefix-match lookups."""
+    assert table.lookup(address) == expected
+    address_class = IPv4 if "." in address else IPv6
+    assert table.lookup(address_class(address)) == expected
+
+    match = table.lookup_prefix(address)
+    if expected is None:
+        assert match is None
+    else:
+        prefix, value = match  # type: ignore[misc]
+        assert value == expected
+        assert address_class(address) in prefix
+
+
+def test_prefix_table_any_address(table: PrefixTable[str]) -> None:
+    """Test lookups and prefixes with lazy and generic addresses."""
+    assert table.lookup(LazyIPAddress("10.1.2.3")) == "host"
+    assert table.lookup(LazyIPAddress("2001:db8:1::1")) == "site"
+    assert table.lookup_index(IPAddress(IPv4("10.1.3.1").num)) == table.lookup_index("10.1.3.1")
+    assert table.lookup(IPAddress(IPv6("2001:db8:2::1").num)) == "documentation"
+
+    assert (LazyIPAddress("10.1.0.0"), 16) in table
+    assert (IPAddress(IPv4("10.1.2.0").num), 24) in table
+    assert (LazyIPAddress("10.1.0.0"), 17) not in table
+    table[LazyIPAddress("172.16.0.0"), 12] = "private"
+    assert table.lookup("172.16.1.1") == "private"
+
+
+def test_prefix_table_exact(table: PrefixTable[str]) -> None:
+    """Test exact matches, replacing and deleting prefixes."""
+    assert len(table) == len(TEST_CASES_PREFIX_TABLE)
+    assert table["10.1.0.0/16"] == "office"
+    assert table[IPNetwork("10.1.2.0", 24)] == "lab"
+    assert table["10.1.2.0", "255.255.255.0"] == "lab"
+    assert "10.1.0.0/17" not in table
+    assert "not a prefix" not in table
+    assert table.get("10.1.0.0/17") is None
+
+    table["10.1.0.0/16"] = "branch"
+    assert table.lookup("10.1.3.1") == "branch"
+    assert len(table) == len(TEST_CASES_PREFIX_TABLE)
+
+    del table["10.1.0.0/16"]
+    assert table.lookup("10.1.3.1") == "private"
+    assert table.lookup("10.1.2.3") == "host"
+    assert len(table) == len(TEST_CASES_PREFIX_TABLE) - 1
+
+    with pytest.raises(KeyError):
+        del table["10.1.0.0/16"]
+    with pytest.raises(KeyError):
+        table["10.1.0.0/16"]
+    with pytest.raises(ValueError, match="has host bits set"):
+        table["10.1.0.1/16"] = "invalid"
+    with pytest.raises(TypeError, match="Invalid type for prefix"):
+        table[42] = "invalid"  # type: ignore[index]
+
+
+def test_prefix_table_iteration(table: PrefixTable[str]) -> None:
+    """Test that prefixes come out IPv4 first, in address order."""
+    assert [str(prefix) for prefix in table][:7] == [prefix for prefix, _ in TEST_CASES_PREFIX_TABLE][:7]
+    assert dict(table.items())[IPNetwork("2001:db8::/32")] == "documentation"
+    assert repr(table) == f"iplib3.PrefixTable(<{len(TEST_CASES_PREFIX_TABLE)} prefixes>)"
+
+
+def test_prefix_table_lookup_many(table: PrefixTable[str]) -> None:
+    """Test bulk lookups returning value indexes."""
+    addresses = [IPv4(address) for address, _ in TEST_CASES_PREFIX_TABLE_LOOKUP if "." in address]
+    expected = [table.lookup(address) for address in addresses]
+
+    indexes = table.lookup_many([address.num for address in addresses])
+    assert [table.value_at(idx) for idx in indexes] == expected
+    assert table.lookup_many(IPAddressArray.from_addresses(addresses)) == indexes
+
+    ipv6_indexes = table.lookup_many([1, IPv6("2001:db8::1").num], SubnetType.IPV6)
+    assert ipv6_indexes[0] == NO_MATCH
+    assert table.value_at(ipv6_indexes[1]) == "documentation"
+
+    with pytest.raises(IndexError, match="No value at index"):
+        table.value_at(NO_MATCH)
+
+
+def test_prefix_table_against_linear_scan() -> None:
+    """Test random tables against a brute-force longest-prefix match."""
+    rng = random.Random(3)  # noqa: S311
+
+    for bits, address_class, version in ((32, IPv4, SubnetType.IPV4), (128, IPv6, SubnetType.IPV6)):
+        table: PrefixTable[tuple[int, int]] = PrefixTable()
+        prefixes = set()
+
+        for _ in range(200):
+            length = rng.randint(0, bits)
+            key = rng.getrandbits(bits) >> (bits - length) << (bits - length) if length else 0
+            table[address_class.from_int(key), length] = key, length
+            prefixes.add((key, length))
+
+        for key, length in rng.sample(sorted(prefixes), 50):
+            del table[address_class.from_int(key), length]
+            prefixes.remove((key, length))
+
+        nums = [rng.getrandbits(bits) for _ in range(200)]
+        nums += [key | rng.getrandbits(bits - length) for key, length in prefixes]
+
+        for num in nums:
+            matches = [(key, length) for key, length in prefixes if (num ^ key) >> (bits - length) == 0]
+            expected = max(matches, key=lambda prefix: prefix[1], default=None)
+            assert table.lookup(num, version) == expected
+
+
+def test_compiled_prefix_table(table: PrefixTable[str]) -> None:
+    """Test vectorized lookups against the trie."""
+    np = pytest.importorskip("numpy")
+    compiled = table.compile()
+
+    ipv4 = [IPv4(address).num for address, _ in TEST_CASES_PREFIX_TABLE_LOOKUP if "." in address]
+    assert compiled.lookup_ipv4(np.array(ipv4, dtype=np.uint32)).tolist() == table.lookup_many(ipv4).tolist()
+
+    ipv6 = [IPv6(address).num for address, _ in TEST_CASES_PREFIX_TABLE_LOOKUP if "." not in address]
+    high, low = [num >> 64 for num in ipv6], [num & (2**64 - 1) for num in ipv6]
+    indexes = compiled.lookup_ipv6(high, low)
+    assert indexes.tolist() == table.lookup_many(ipv6, SubnetType.IPV6).tolist()
+    assert [None if idx == NO_MATCH else compiled.value_at(idx) for idx in indexes] == ["site", "documentation", None]
+
+    # The snapshot doesn't change with the table
+    del table["10.1.2.3/32"]
+    assert compiled.value_at(compiled.lookup_ipv4([IPv4("10.1.2.3").num])[0]) == "host"
+    assert repr(compiled).startswith("iplib3.CompiledPrefixTable(")
+
+
+def test_compiled_prefix_table_against_trie() -> None:
+    """Test random tables, including nested and adjacent prefixes, against the trie."""
+    np = pytest.importorskip("numpy")
+    rng = random.Random(5)  # noqa: S311
+
+    for bits, address_class, version in ((32, IPv4, SubnetType.IPV4), (128, IPv6, SubnetType.IPV6)):
+        table: PrefixTable[int] = PrefixTable()
+        for idx in range(300):
+            length = rng.choice([0, 1, bits // 2, bits - 1, bits, rng.randint(0, bits)])
+            key = rng.getrandbits(8) << (bits - 8) >> (bits - length) << (bits - length) if length else 0
+            table[address_class.from_int(key), length] = idx
+
+        nums = [rng.getrandbits(bits) for _ in range(500)]
+        nums += [prefix.network for prefix in table] + [prefix.broadcast for prefix in table]
+        nums += [min(prefix.broadcast + 1, 2**bits - 1) for prefix in table] + [0, 2**bits - 1]
+        compiled = table.compile()
+
+        if version == SubnetType.IPV4:
+            indexes = compiled.lookup_ipv4(np.array(nums, dtype=np.uint32))
+        else:
+            indexes = compiled.lookup_ipv6([num >> 64 for num in nums], [num & (2**64 - 1) for num in nums])
+
+        assert indexes.tolist() == table.lookup_many(nums, version).tolist()
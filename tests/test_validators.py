@@ -4,6 +4,9 @@
 
 from iplib3.constants.subnet import SubnetType
 from iplib3.validators import (
+    AddressKind,
+    ParsedAddress,
+    ParseErrorCode,
     ValidationMode,
     _ipv4_subnet_validator,
     _ipv6_subnet_validator,
@@ -13,6 +16,8 @@
     ipv6_validator,
     port_validator,
     subnet_validator,
+    try_parse,
+    validate_many,
 )
 from tests.test_cases_validators import (
     TEST_CASES_IP_VALIDATOR,
@@ -26,6 +31,8 @@
     TEST_CASES_PORT_STRIPPER_IPV6,
     TEST_CASES_PORT_VALIDATOR,
     TEST_CASES_SUBNET_VALIDATOR,
+    TEST_CASES_TRY_PARSE,
+    TEST_CASES_VALIDATE_MANY,
 )
 
 
@@ -144,3 +151,54 @@ def test_port_stripper_invalid_protocol() -> None:
     """Test the port stripper for using invalid protocol."""
     with pytest.raises(ValueError, match="Invalid subnet type"):
         _port_stripper("127.0.0.1:8080", protocol="IPv9")  # type: ignore[arg-type]
+
+
+@pytest.mark.parametrize(
+    ("address", "validation_mode", "excepted_kind", "excepted_value"),
+    TEST_CASES_VALIDATE_MANY,
+)
+def test_validate_many(
+    address: str | int, validation_mode: ValidationMode, excepted_kind: AddressKind, excepted_value: int
+) -> None:
+    """Test classifying addresses in bulk."""
+    assert validate_many([address], validation_mode) == bytearray([excepted_kind])
+    assert validate_many([address], validation_mode, with_values=True) == (
+        bytearray([excepted_kind]),
+        [excepted_value],
+    )
+    assert ip_validator(address, validation_mode) is (excepted_kind != AddressKind.INVALID)
+
+
+def test_validate_many_matches_validators() -> None:
+    """Test that bulk validation agrees with the individual validators."""
+    addresses = [
+        address
+        for cases in (TEST_CASES_IPV4_VALIDATOR, TEST_CASES_IPV6_VALIDATOR)
+        for address, _, _ in cases
+        if isinstance(address, (str, int))
+    ]
+
+    for validation_mode in ValidationMode:
+        kinds = validate_many(addresses, validation_mode)
+        assert [bool(kind) for kind in kinds] == [
+            ipv4_validator(address, validation_mode) or ipv6_validator(address, validation_mode)
+            for address in addresses
+        ]
+
+
+@pytest.mark.parametrize(
+    ("address", "validation_mode", "version", "excepted_output"),
+    TEST_CASES_TRY_PARSE,
+)
+def test_try_parse(
+    address: str | int,
+    validation_mode: ValidationMode,
+    version: SubnetType | None,
+    excepted_output: ParsedAddress | ParseErrorCode,
+) -> None:
+    """Test parsing addresses without exceptions."""
+    result = try_parse(address, validation_mode, version)
+    assert result == excepted_output
+    assert type(result) is type(excepted_output)
+    if isinstance(result, ParseErrorCode):
+        assert result.message